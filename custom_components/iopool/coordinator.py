@@ -56,6 +56,30 @@ class IopoolDataUpdateCoordinator(DataUpdateCoordinator):
             None,
         )
 
+    @staticmethod
+    def _parse_response(data: list[dict]) -> IopoolAPIResponse:
+        """Convert the decoded API payload into model objects.
+
+        Args:
+            data: The JSON body returned by the pools endpoint.
+
+        Returns:
+            The parsed API response.
+
+        Raises:
+            UpdateFailed: If the payload does not match the expected structure.
+
+        """
+        _LOGGER.debug("Converting data to iopoolData model")
+        try:
+            api_response = IopoolAPIResponse.from_dict(data)
+        except (KeyError, ValueError) as error:
+            _LOGGER.error("Error parsing response from iopool API: %s", error)
+            raise UpdateFailed(f"Error parsing API response: {error}") from error
+
+        _LOGGER.debug("iopool Converted data: %s", api_response)
+        return api_response
+
     async def _async_update_data(self) -> IopoolAPIResponse:
         """Fetch data from iopool API."""
         _LOGGER.debug("Updating iopool data with API key %s", self.api_key)
@@ -65,19 +89,13 @@ class IopoolDataUpdateCoordinator(DataUpdateCoordinator):
             ) as response:
                 response.raise_for_status()
                 data = await response.json()
-
-                _LOGGER.debug("iopool Response data: %s", data)
-
-                # Convert raw data to model objects
-                _LOGGER.debug("Converting data to iopoolData model")
-                _LOGGER.debug(
-                    "iopool Converted data: %s", IopoolAPIResponse.from_dict(data)
-                )
-                return IopoolAPIResponse.from_dict(data)
-
         except (ServerTimeoutError, ClientError) as error:
             _LOGGER.error("Error fetching data from iopool API: %s", error)
             raise UpdateFailed(f"Error communicating with API: {error}") from error
-        except (KeyError, ValueError) as error:
+        except ValueError as error:
+            # The body is not valid JSON
             _LOGGER.error("Error parsing response from iopool API: %s", error)
             raise UpdateFailed(f"Error parsing API response: {error}") from error
+
+        _LOGGER.debug("iopool Response data: %s", data)
+        return self._parse_response(data)
@@ -16,6 +16,47 @@ from .coordinator import IopoolDataUpdateCoordinator
 type IopoolConfigEntry = ConfigEntry[IopoolData]
 
 
+# Parsed time strings, including invalid ones cached as None
+_TIME_CACHE: dict[str, time | None] = {}
+_MISSING = object()
+
+
+def _parse_time(time_str: str | None) -> time | None:
+    """Parse a HH:MM:SS time string into a time object."""
+    if not time_str or not isinstance(time_str, str):
+        return None
+    parsed = _TIME_CACHE.get(time_str, _MISSING)
+    if parsed is _MISSING:
+        try:
+            hour, minute, second = map(int, time_str.split(":"))
+            parsed = time(hour, minute, second)
+        except (ValueError, AttributeError):
+            parsed = None
+        _TIME_CACHE[time_str] = parsed
+    return parsed
+
+
+def _parse_duration(minutes: int | None) -> timedelta | None:
+    """Convert minutes to timedelta object."""
+    if minutes is None:
+        return None
+    return timedelta(minutes=minutes)
+
+
+def _format_time(time_obj: time | None) -> str | None:
+    """Format time object to HH:MM:SS string."""
+    if time_obj is None:
+        return None
+    return time_obj.strftime("%H:%M:%S")
+
+
+def _format_duration(duration: timedelta | None) -> int | None:
+    """Convert timedelta to minutes."""
+    if duration is None:
+        return None
+    return int(duration.total_seconds() / 60)
+
+
 @dataclass
 class IopoolData:
     """Data class for Iopool integration.
@@ -43,7 +84,7 @@ class IopoolData:
     setup_time_events: Callable[[], None] | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class IopoolOptionsFiltrationSlot:
     """iopoolOptionsFiltrationSlot defines the summer filtration slot options."""
 
@@ -51,8 +92,16 @@ class IopoolOptionsFiltrationSlot:
     start: time | None = None
     duration_percent: int | None = 50
 
+    def to_dict(self) -> dict:
+        """Convert the slot to a dictionary."""
+        return {
+            "name": self.name,
+            "start": _format_time(self.start),
+            "duration_percent": self.duration_percent,
+        }
 
-@dataclass
+
+@dataclass(slots=True)
 class IopoolOptionsSummerFiltration:
     """iopoolOptionsFiltration defines the summer filtration options."""
 
@@ -66,8 +115,18 @@ class IopoolOptionsSummerFiltration:
         default_factory=IopoolOptionsFiltrationSlot
     )
 
+    def to_dict(self) -> dict:
+        """Convert the summer filtration options to a dictionary."""
+        return {
+            "status": self.status,
+            "min_duration": self.min_duration,
+            "max_duration": self.max_duration,
+            "slot1": self.slot1.to_dict(),
+            "slot2": self.slot2.to_dict(),
+        }
+
 
-@dataclass
+@dataclass(slots=True)
 class IopoolOptionsWinterFiltration:
     """iopoolOptionsFiltration defines the winter filtration options."""
 
@@ -75,8 +134,16 @@ class IopoolOptionsWinterFiltration:
     start: time | None = None
     duration: timedelta | None = None
 
+    def to_dict(self) -> dict:
+        """Convert the winter filtration options to a dictionary."""
+        return {
+            "status": self.status,
+            "start": _format_time(self.start),
+            "duration": _format_duration(self.duration),
+        }
 
-@dataclass
+
+@dataclass(slots=True)
 class IopoolOptionsFiltration:
     """iopoolOptionsFiltration defines the filtration options."""
 
@@ -88,6 +155,14 @@ class IopoolOptionsFiltration:
         default_factory=IopoolOptionsWinterFiltration
     )
 
+    def to_dict(self) -> dict:
+        """Convert the filtration options to a dictionary."""
+        return {
+            "switch_entity": self.switch_entity,
+            "summer_filtration": self.summer_filtration.to_dict(),
+            "winter_filtration": self.winter_filtration.to_dict(),
+        }
+
 
 @dataclass
 class IopoolOptionsData:
@@ -110,39 +185,23 @@ class IopoolOptionsData:
             return cls()
 
         filtration_data = data.get("filtration", {})
-
-        def parse_time(time_str: str | None) -> time | None:
-            """Parse a time string into a time object."""
-            if not time_str:
-                return None
-            try:
-                hour, minute, second = map(int, time_str.split(":"))
-                return time(hour, minute, second)
-            except (ValueError, AttributeError):
-                return None
-
-        def parse_duration(minutes: int | None) -> timedelta | None:
-            """Convert minutes to timedelta object."""
-            if minutes is None:
-                return None
-            return timedelta(minutes=minutes)
+        summer_data = filtration_data.get("summer_filtration", {})
 
         # Process summer filtration slots
-        slot1_data = filtration_data.get("summer_filtration", {}).get("slot1", {})
+        slot1_data = summer_data.get("slot1", {})
         slot1 = IopoolOptionsFiltrationSlot(
             name=slot1_data.get("name"),
-            start=parse_time(slot1_data.get("start")),
+            start=_parse_time(slot1_data.get("start")),
             duration_percent=slot1_data.get("duration_percent"),
         )
-        slot2_data = filtration_data.get("summer_filtration", {}).get("slot2", {})
+        slot2_data = summer_data.get("slot2", {})
         slot2 = IopoolOptionsFiltrationSlot(
             name=slot2_data.get("name"),
-            start=parse_time(slot2_data.get("start")),
+            start=_parse_time(slot2_data.get("start")),
             duration_percent=slot2_data.get("duration_percent"),
         )
 
         # Process summer filtration
-        summer_data = filtration_data.get("summer_filtration", {})
         summer_filtration = IopoolOptionsSummerFiltration(
             status=summer_data.get("status"),
             min_duration=summer_data.get("min_duration"),
@@ -157,8 +216,8 @@ class IopoolOptionsData:
 
         winter_filtration = IopoolOptionsWinterFiltration(
             status=winter_data.get("status"),
-            start=parse_time(winter_data.get("start")),
-            duration=parse_duration(winter_duration),
+            start=_parse_time(winter_data.get("start")),
+            duration=_parse_duration(winter_duration),
         )
 
         # Create filtration options
@@ -177,57 +236,7 @@ class IopoolOptionsData:
             A dictionary representation of the options
 
         """
-
-        # Function to format time object to string
-        def format_time(time_obj) -> str | None:
-            """Format time object to string."""
-            if time_obj is None:
-                return None
-            return time_obj.strftime("%H:%M:%S")
-
-        def format_duration(duration) -> int | None:
-            """Convert timedelta to minutes."""
-            if duration is None:
-                return None
-            return int(duration.total_seconds() / 60)
-
-        # Process summer filtration slots
-        slot1_dict = {
-            "name": self.filtration.summer_filtration.slot1.name,
-            "start": format_time(self.filtration.summer_filtration.slot1.start),
-            "duration_percent": self.filtration.summer_filtration.slot1.duration_percent,
-        }
-
-        slot2_dict = {
-            "name": self.filtration.summer_filtration.slot2.name,
-            "start": format_time(self.filtration.summer_filtration.slot2.start),
-            "duration_percent": self.filtration.summer_filtration.slot2.duration_percent,
-        }
-
-        # Process summer filtration
-        summer_dict = {
-            "status": self.filtration.summer_filtration.status,
-            "min_duration": self.filtration.summer_filtration.min_duration,
-            "max_duration": self.filtration.summer_filtration.max_duration,
-            "slot1": slot1_dict,
-            "slot2": slot2_dict,
-        }
-
-        # Process winter filtration
-        winter_dict = {
-            "status": self.filtration.winter_filtration.status,
-            "start": format_time(self.filtration.winter_filtration.start),
-            "duration": format_duration(self.filtration.winter_filtration.duration),
-        }
-
-        # Build complete dictionary
-        return {
-            "filtration": {
-                "switch_entity": self.filtration.switch_entity,
-                "summer_filtration": summer_dict,
-                "winter_filtration": winter_dict,
-            }
-        }
+        return {"filtration": self.filtration.to_dict()}
 
     @classmethod
     def from_config_flow_data(cls, data: dict) -> IopoolOptionsData:
@@ -242,16 +251,6 @@ class IopoolOptionsData:
         """
         filtration_data = data.get("filtration", {})
 
-        def parse_time(time_str: str | None) -> time | None:
-            """Parse a time string into a time object."""
-            if not time_str:
-                return None
-            try:
-                hour, minute, second = map(int, time_str.split(":"))
-                return time(hour, minute, second)
-            except (ValueError, AttributeError):
-                return None
-
         def safe_int(value) -> int | None:
             """Safely convert a value to int."""
             if value is None:
@@ -264,14 +263,14 @@ class IopoolOptionsData:
         # Create slot objects
         slot1 = IopoolOptionsFiltrationSlot(
             name=filtration_data.get("summer_filtration.slot1.name"),
-            start=parse_time(filtration_data.get("summer_filtration.slot1.start")),
+            start=_parse_time(filtration_data.get("summer_filtration.slot1.start")),
             duration_percent=safe_int(
                 filtration_data.get("summer_filtration.slot1.duration_percent")
             ),
         )
         slot2 = IopoolOptionsFiltrationSlot(
             name=filtration_data.get("summer_filtration.slot2.name"),
-            start=parse_time(filtration_data.get("summer_filtration.slot2.start")),
+            start=_parse_time(filtration_data.get("summer_filtration.slot2.start")),
             duration_percent=safe_int(
                 filtration_data.get("summer_filtration.slot2.duration_percent")
             ),
@@ -301,7 +300,7 @@ class IopoolOptionsData:
         )
         winter_filtration = IopoolOptionsWinterFiltration(
             status=filtration_data.get("winter_filtration.status", False),
-            start=parse_time(filtration_data.get("winter_filtration.start")),
+            start=_parse_time(filtration_data.get("winter_filtration.start")),
             duration=winter_duration,
         )
 
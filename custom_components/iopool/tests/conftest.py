@@ -1,15 +1,23 @@
 """Test configuration and fixtures for iopool integration."""
 
 import asyncio
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass, field
 from datetime import datetime
 import os
+from types import MappingProxyType, SimpleNamespace
+from typing import Any
 from unittest.mock import AsyncMock, MagicMock
 import warnings
 
+from aiohttp import ClientResponseError, RequestInfo
 from custom_components.iopool.api_models import IopoolAPIResponse, IopoolAPIResponsePool
-from custom_components.iopool.const import CONF_POOL_ID, DOMAIN
+from custom_components.iopool.const import CONF_POOL_ID, DOMAIN, POOLS_ENDPOINT
 from custom_components.iopool.coordinator import IopoolDataUpdateCoordinator
+from custom_components.iopool.sensor import POOL_SENSORS
+from multidict import CIMultiDict, CIMultiDictProxy
 import pytest
+from yarl import URL
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import CONF_API_KEY
@@ -43,6 +51,12 @@ def pytest_configure(config):
             config._metadata["Git Commit"] = os.environ["GITHUB_SHA"][:8]  # noqa: SLF001
 
 
+def pytest_generate_tests(metafunc):
+    """Parametrize ``sensor_desc`` over every pool sensor description."""
+    if "sensor_desc" in metafunc.fixturenames:
+        metafunc.parametrize("sensor_desc", POOL_SENSORS, ids=lambda desc: desc.key)
+
+
 @pytest.fixture
 def hass():
     """Create a HomeAssistant instance for testing."""
@@ -109,61 +123,143 @@ TEST_API_KEY = "test-api-key-12345"
 TEST_POOL_ID = "test_pool_id_67890"
 TEST_POOL_TITLE = "Test Pool"
 
-# Mock pools API response data (based on real API structure)
-MOCK_POOLS_API_RESPONSE = [
+# Keyword arguments for a real ConfigEntry; override fields with {**..., key: value}
+CONFIG_ENTRY_KWARGS = MappingProxyType(
     {
-        "id": "test_pool_id_67890",
-        "title": "Test Pool",
-        "latestMeasure": {
-            "temperature": 25.5,
-            "ph": 7.2,
-            "orp": 750,
-            "mode": "gateway",
-            "isValid": True,
-            "ecoId": "eco456",
-            "measuredAt": "2024-01-01T12:00:00Z",
-        },
-        "mode": "STANDARD",
-        "hasAnActionRequired": False,
-        "advice": {"filtrationDuration": 8.5},
+        "version": 1,
+        "minor_version": 1,
+        "domain": DOMAIN,
+        "title": TEST_POOL_TITLE,
+        "data": MappingProxyType(
+            {CONF_API_KEY: TEST_API_KEY, CONF_POOL_ID: TEST_POOL_ID}
+        ),
+        "options": MappingProxyType({}),
+        "source": "user",
+        "unique_id": TEST_POOL_ID,
+        "discovery_keys": frozenset(),
+        "subentries_data": (),
     }
-]
+)
 
+# Mock pools API response data (based on real API structure). Each pool is
+# read-only so no test can alter the payload other tests parse.
+MOCK_POOLS_API_RESPONSE = [
+    MappingProxyType(
+        {
+            "id": "test_pool_id_67890",
+            "title": "Test Pool",
+            "latestMeasure": MappingProxyType(
+                {
+                    "temperature": 25.5,
+                    "ph": 7.2,
+                    "orp": 750,
+                    "mode": "gateway",
+                    "isValid": True,
+                    "ecoId": "eco456",
+                    "measuredAt": "2024-01-01T12:00:00Z",
+                }
+            ),
+            "mode": "STANDARD",
+            "hasAnActionRequired": False,
+            "advice": MappingProxyType({"filtrationDuration": 8.5}),
+        }
+    )
+]
 
-@pytest.fixture
-def event_loop():
-    """Create an instance of the default event loop for the test session."""
-    loop = asyncio.new_event_loop()
-    yield loop
-    loop.close()
 
+@dataclass(slots=True)
+class FakeEntry:
+    """Lightweight ConfigEntry double exposing only what the integration uses."""
+
+    data: Mapping[str, Any]
+    options: Mapping[str, Any]
+    entry_id: str = "test_entry_id"
+    unique_id: str | None = TEST_POOL_ID
+    title: str = TEST_POOL_TITLE
+    domain: str = DOMAIN
+    runtime_data: Any = None
+    update_listeners: list[Callable] = field(default_factory=list)
+    on_unload: list[Callable] = field(default_factory=list)
+
+    def add_update_listener(self, listener: Callable) -> Callable[[], None]:
+        """Register an update listener and return its remover."""
+        self.update_listeners.append(listener)
+        return lambda: self.update_listeners.remove(listener)
+
+    def async_on_unload(self, func: Callable) -> None:
+        """Record a callback to run when the entry is unloaded."""
+        self.on_unload.append(func)
+
+
+class FakeResponse:
+    """Plain aiohttp response double, usable as ``async with session.get(...)``."""
+
+    def __init__(
+        self,
+        json_data: Any = MOCK_POOLS_API_RESPONSE,
+        *,
+        status: int = 200,
+        json_error: Exception | None = None,
+    ) -> None:
+        """Store the body, status and optional error returned by json()."""
+        self.json_data = json_data
+        self.status = status
+        self.json_error = json_error
+
+    async def __aenter__(self) -> "FakeResponse":
+        """Return the response itself, like aiohttp's request context manager."""
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        """Release nothing; there is no connection behind the fake."""
+
+    async def json(self) -> Any:
+        """Return the stored body or raise the stored error."""
+        if self.json_error is not None:
+            raise self.json_error
+        return self.json_data
+
+    def raise_for_status(self) -> None:
+        """Raise ClientResponseError for a 4xx/5xx status, like aiohttp."""
+        if self.status >= 400:
+            url = URL(POOLS_ENDPOINT)
+            raise ClientResponseError(
+                RequestInfo(url, "GET", CIMultiDictProxy(CIMultiDict()), url),
+                (),
+                status=self.status,
+                message="Fake HTTP error",
+            )
 
-@pytest.fixture
-def mock_aiohttp_session():
-    """Mock aiohttp session with proper async context manager support."""
-    session = AsyncMock()
 
-    # Create a proper mock response
-    response_mock = AsyncMock()
-    response_mock.status = 200
-    response_mock.json = AsyncMock(return_value=MOCK_POOLS_API_RESPONSE)
-    response_mock.raise_for_status = AsyncMock()
+class FakeSession:
+    """Plain aiohttp session double whose get() yields a FakeResponse."""
 
-    # Create a proper context manager
-    context_manager = AsyncMock()
-    context_manager.__aenter__ = AsyncMock(return_value=response_mock)
-    context_manager.__aexit__ = AsyncMock(return_value=None)
+    def __init__(
+        self, response: FakeResponse | None = None, *, error: Exception | None = None
+    ) -> None:
+        """Store the response to return, or the error get() should raise."""
+        self.response = response if response is not None else FakeResponse()
+        self.error = error
 
-    # Assign the context manager to session.get
-    session.get = MagicMock(return_value=context_manager)
+    def get(self, *args: Any, **kwargs: Any) -> FakeResponse:
+        """Return the stored response or raise the stored error."""
+        if self.error is not None:
+            raise self.error
+        return self.response
 
-    # Mock session close method
-    session.close = AsyncMock()
-    session.closed = False
 
-    return session
+@pytest.fixture
+def mock_aiohttp_session() -> FakeSession:
+    """Fake aiohttp session returning the mock pools payload."""
+    return FakeSession()
 
 
+# Style rule for test classes: never add xunit-style setup_method /
+# teardown_method hooks. pytest wraps each one in a generically named autouse
+# fixture, and matching those against every collected test is quadratic in
+# the collection size. When per-test setup is needed, declare an explicit
+# autouse fixture whose name is unique to its class, for example
+# ``@pytest.fixture(autouse=True, name="_filtration_autouse_setup")``.
 @pytest.fixture(autouse=True)
 def suppress_aiohttp_warnings():
     """Suppress aiohttp unclosed session warnings in tests."""
@@ -258,6 +354,41 @@ def mock_config_entry():
     return entry
 
 
+@pytest.fixture
+def base_config_entry():
+    """Return a fresh real ConfigEntry for one test."""
+    return ConfigEntry(**CONFIG_ENTRY_KWARGS)
+
+
+@pytest.fixture
+def make_config_entry():
+    """Return a factory building a FakeEntry, with optional kwargs overrides."""
+
+    def _make(**overrides: Any) -> FakeEntry:
+        # Fresh dicts per entry so one test's entry data never reaches another
+        kwargs = {
+            "data": dict(CONFIG_ENTRY_KWARGS["data"]),
+            "options": dict(CONFIG_ENTRY_KWARGS["options"]),
+        }
+        return FakeEntry(**{**kwargs, **overrides})
+
+    return _make
+
+
+@pytest.fixture
+def iopool_mocks(mocker):
+    """Patch the classes instantiated by async_setup_entry for one test."""
+    return SimpleNamespace(
+        coordinator_cls=mocker.patch(
+            "custom_components.iopool.IopoolDataUpdateCoordinator"
+        ),
+        filtration_cls=mocker.patch("custom_components.iopool.Filtration"),
+        card_registration_cls=mocker.patch(
+            "custom_components.iopool.IopoolCardRegistration"
+        ),
+    )
+
+
 @pytest.fixture
 def mock_api_response():
     """Mock API response with pool data."""
@@ -1,3 +1,8 @@
 #!/bin/bash
 cd /workspaces/home-assistant-dev/config
-PYTHONPATH=/workspaces/home-assistant-dev python -m pytest custom_components/iopool/tests/ --cov-config=custom_components/iopool/.coveragerc "$@"
+# Spread test files across cores when pytest-xdist is installed (as in CI)
+XDIST_ARGS=()
+if python -c "import xdist" 2>/dev/null; then
+    XDIST_ARGS=(-n auto --dist loadfile)
+fi
+PYTHONPATH=/workspaces/home-assistant-dev python -m pytest custom_components/iopool/tests/ --cov-config=custom_components/iopool/.coveragerc "${XDIST_ARGS[@]}" "$@"
@@ -4,6 +4,8 @@ from __future__ import annotations
 
 from datetime import datetime
 
+import pytest
+
 from custom_components.iopool.api_models import (
     IopoolAdvice,
     IopoolAPIResponse,
@@ -142,68 +144,64 @@ class TestIopoolAPIResponsePool:
 class TestIopoolAPIResponse:
     """Test IopoolAPIResponse model."""
 
-    def test_from_dict_with_pools(self) -> None:
-        """Test creating IopoolAPIResponse from data with pools."""
-        data = MOCK_POOLS_API_RESPONSE  # Pass the pools list directly
-
-        response = IopoolAPIResponse.from_dict(data)
-
-        assert len(response.pools) == 1
-        assert response.pools[0].id == "test_pool_id_67890"
-        assert response.pools[0].title == "Test Pool"
-
-    def test_from_dict_empty_list(self) -> None:
-        """Test creating IopoolAPIResponse from empty list."""
-        data = []
-
+    @pytest.mark.parametrize(
+        ("data", "expected_ids"),
+        [
+            (MOCK_POOLS_API_RESPONSE, ["test_pool_id_67890"]),
+            ([], []),
+            (
+                [
+                    {
+                        "id": "pool1",
+                        "title": "Pool 1",
+                        "mode": "STANDARD",
+                        "hasAnActionRequired": False,
+                    },
+                    {
+                        "id": "pool2",
+                        "title": "Pool 2",
+                        "mode": "WINTER",
+                        "hasAnActionRequired": True,
+                    },
+                ],
+                ["pool1", "pool2"],
+            ),
+        ],
+        ids=["with_pools", "empty_list", "multiple_pools"],
+    )
+    def test_from_dict(self, data: list, expected_ids: list[str]) -> None:
+        """Test creating IopoolAPIResponse from a list of pools."""
         response = IopoolAPIResponse.from_dict(data)
 
-        assert len(response.pools) == 0
-
-    def test_from_dict_multiple_pools(self) -> None:
-        """Test creating IopoolAPIResponse from multiple pools."""
-        data = [
-            {
-                "id": "pool1",
-                "title": "Pool 1",
-                "mode": "STANDARD",
-                "hasAnActionRequired": False,
-            },
-            {
-                "id": "pool2",
-                "title": "Pool 2",
-                "mode": "WINTER",
-                "hasAnActionRequired": True,
-            },
-        ]
+        assert [pool.id for pool in response.pools] == expected_ids
 
-        response = IopoolAPIResponse.from_dict(data)
+    def test_from_dict_keeps_pool_fields(self) -> None:
+        """Test that pools built from the API response keep their fields."""
+        response = IopoolAPIResponse.from_dict(MOCK_POOLS_API_RESPONSE)
 
-        assert len(response.pools) == 2
-        assert response.pools[0].id == "pool1"
-        assert response.pools[1].id == "pool2"
+        assert response.pools[0].title == "Test Pool"
 
 
 class TestIopoolLatestMeasureEdgeCases:
     """Test IopoolLatestMeasure edge cases and error handling."""
 
-    def test_from_dict_all_mode_types(self) -> None:
+    @pytest.mark.parametrize(
+        "mode", ["standard", "live", "maintenance", "manual", "backup", "gateway"]
+    )
+    def test_from_dict_all_mode_types(self, mode: str) -> None:
         """Test all possible mode values."""
-        modes = ["standard", "live", "maintenance", "manual", "backup", "gateway"]
-
-        for mode in modes:
-            data = {
-                "temperature": 25.0,
-                "ph": 7.2,
-                "orp": 650.0,
-                "mode": mode,
-                "isValid": True,
-                "ecoId": "eco123",
-                "measuredAt": "2025-07-22T10:30:00Z",
-            }
+        data = {
+            "temperature": 25.0,
+            "ph": 7.2,
+            "orp": 650.0,
+            "mode": mode,
+            "isValid": True,
+            "ecoId": "eco123",
+            "measuredAt": "2025-07-22T10:30:00Z",
+        }
 
-            measure = IopoolLatestMeasure.from_dict(data)
-            assert measure.mode == mode
+        measure = IopoolLatestMeasure.from_dict(data)
+        assert measure.mode == mode
 
     def test_from_dict_with_microseconds(self) -> None:
         """Test creating IopoolLatestMeasure with microseconds in timestamp."""
@@ -221,29 +219,29 @@ class TestIopoolLatestMeasureEdgeCases:
         assert isinstance(measure.measured_at, datetime)
         assert measure.measured_at.microsecond == 123456
 
-    def test_from_dict_with_different_timezone_formats(self) -> None:
-        """Test different timezone formats."""
-        # Test various timezone formats
-        timezone_formats = [
+    @pytest.mark.parametrize(
+        "timestamp",
+        [
             "2025-07-22T10:30:00Z",
             "2025-07-22T10:30:00+00:00",
             "2025-07-22T10:30:00-05:00",
             "2025-07-22T10:30:00+02:00",
-        ]
-
-        for timestamp in timezone_formats:
-            data = {
-                "temperature": 24.5,
-                "ph": 7.2,
-                "orp": 650.0,
-                "mode": "standard",
-                "isValid": True,
-                "ecoId": "eco123",
-                "measuredAt": timestamp,
-            }
+        ],
+    )
+    def test_from_dict_with_different_timezone_formats(self, timestamp: str) -> None:
+        """Test different timezone formats."""
+        data = {
+            "temperature": 24.5,
+            "ph": 7.2,
+            "orp": 650.0,
+            "mode": "standard",
+            "isValid": True,
+            "ecoId": "eco123",
+            "measuredAt": timestamp,
+        }
 
-            measure = IopoolLatestMeasure.from_dict(data)
-            assert isinstance(measure.measured_at, datetime)
+        measure = IopoolLatestMeasure.from_dict(data)
+        assert isinstance(measure.measured_at, datetime)
 
     def test_from_dict_extreme_values(self) -> None:
         """Test with extreme but valid values."""
@@ -268,21 +266,21 @@ class TestIopoolLatestMeasureEdgeCases:
 class TestIopoolAPIResponsePoolEdgeCases:
     """Test IopoolAPIResponsePool edge cases."""
 
-    def test_from_dict_all_pool_modes(self) -> None:
+    @pytest.mark.parametrize(
+        "mode", ["STANDARD", "OPENING", "ACTIVE_WINTER", "WINTER", "INITIALIZATION"]
+    )
+    def test_from_dict_all_pool_modes(self, mode: str) -> None:
         """Test all possible pool mode values."""
-        modes = ["STANDARD", "OPENING", "ACTIVE_WINTER", "WINTER", "INITIALIZATION"]
-
-        for mode in modes:
-            data = {
-                "id": f"pool_{mode.lower()}",
-                "title": f"Pool {mode}",
-                "mode": mode,
-                "hasAnActionRequired": False,
-            }
+        data = {
+            "id": f"pool_{mode.lower()}",
+            "title": f"Pool {mode}",
+            "mode": mode,
+            "hasAnActionRequired": False,
+        }
 
-            pool = IopoolAPIResponsePool.from_dict(data)
-            assert pool.mode == mode
-            assert pool.id == f"pool_{mode.lower()}"
+        pool = IopoolAPIResponsePool.from_dict(data)
+        assert pool.mode == mode
+        assert pool.id == f"pool_{mode.lower()}"
 
     def test_from_dict_with_empty_strings(self) -> None:
         """Test with empty string values."""
@@ -24,7 +24,6 @@ from .conftest import TEST_API_KEY, TEST_POOL_ID, TEST_POOL_TITLE
 class TestIopoolBinarySensorPlatform:
     """Test class for iopool binary sensor platform."""
 
-    @pytest.mark.asyncio
     @patch("custom_components.iopool.binary_sensor.IopoolBinarySensor")
     async def test_async_setup_entry(
         self,
@@ -71,7 +70,6 @@ class TestIopoolBinarySensorPlatform:
         )
         assert len(call_args) == expected_sensors
 
-    @pytest.mark.asyncio
     async def test_async_setup_entry_no_pool_data(
         self,
         hass: HomeAssistant,
@@ -103,7 +101,6 @@ class TestIopoolBinarySensorPlatform:
         # Should not call async_add_entities when no pool data
         async_add_entities.assert_not_called()
 
-    @pytest.mark.asyncio
     async def test_async_setup_entry_filtration_disabled(
         self,
         hass: HomeAssistant,
@@ -328,7 +325,6 @@ class TestIopoolBinarySensor:
         assert "filtration_duration_minutes" in attributes
         assert attributes["filtration_duration_minutes"] == 8.5
 
-    @pytest.mark.asyncio
     async def test_async_added_to_hass_filtration_sensor(
         self,
         mock_iopool_coordinator,
@@ -354,7 +350,6 @@ class TestIopoolBinarySensor:
         # Should set up state change listener
         sensor.async_on_remove.assert_called()
 
-    @pytest.mark.asyncio
     async def test_async_added_to_hass_with_last_state_on(
         self,
         mock_iopool_coordinator,
@@ -388,7 +383,6 @@ class TestIopoolBinarySensor:
             sensor.entity_id, "on", last_state.attributes
         )
 
-    @pytest.mark.asyncio
     async def test_async_added_to_hass_with_last_state_off(
         self,
         mock_iopool_coordinator,
@@ -422,7 +416,6 @@ class TestIopoolBinarySensor:
             sensor.entity_id, "off", last_state.attributes
         )
 
-    @pytest.mark.asyncio
     async def test_async_added_to_hass_no_switch_entity(
         self,
         mock_iopool_coordinator,
@@ -451,7 +444,6 @@ class TestIopoolBinarySensor:
         # Should still call async_on_remove but not set up state listener
         sensor.async_on_remove.assert_called()
 
-    @pytest.mark.asyncio
     async def test_switch_state_change_callback(
         self,
         mock_iopool_coordinator,
@@ -788,7 +780,6 @@ class TestIopoolBinarySensor:
         assert sensor.icon == sensor_description.icon
         assert sensor.icon == "mdi:gesture-tap-button"
 
-    @pytest.mark.asyncio
     async def test_async_added_to_hass_restores_filtration_state(
         self,
         mock_iopool_coordinator,
@@ -828,7 +819,6 @@ class TestIopoolBinarySensor:
             "winter",
         )
 
-    @pytest.mark.asyncio
     async def test_async_added_to_hass_no_last_state_no_restore(
         self,
         mock_iopool_coordinator,
@@ -34,13 +34,18 @@ from homeassistant.core import HomeAssistant
 from homeassistant.data_entry_flow import FlowResultType
 from homeassistant.helpers import config_validation as cv
 
-from .conftest import TEST_API_KEY, TEST_POOL_ID, TEST_POOL_TITLE
+from .conftest import (
+    TEST_API_KEY,
+    TEST_POOL_ID,
+    TEST_POOL_TITLE,
+    FakeResponse,
+    FakeSession,
+)
 
 
 class TestGetIopoolData:
     """Test get_iopool_data function."""
 
-    @pytest.mark.asyncio
     @patch("custom_components.iopool.config_flow.async_get_clientsession")
     async def test_get_iopool_data_success(
         self, mock_session_func, hass: HomeAssistant, mock_aiohttp_session
@@ -62,7 +67,6 @@ class TestGetIopoolData:
             (403, "Forbidden"),
         ],
     )
-    @pytest.mark.asyncio
     @patch("custom_components.iopool.config_flow.async_get_clientsession")
     async def test_get_iopool_data_invalid_auth(
         self,
@@ -73,9 +77,7 @@ class TestGetIopoolData:
         message: str,
     ) -> None:
         """Test API data retrieval with invalid auth (401/403 must not reach ClientError handler)."""
-        response_mock = mock_aiohttp_session.get.return_value.__aenter__.return_value
-        response_mock.status = status
-        # raise_for_status is NOT called in the fixed code — status is checked explicitly
+        mock_aiohttp_session.response.status = status
         mock_session_func.return_value = mock_aiohttp_session
 
         result = await get_iopool_data(hass, "invalid_key")
@@ -83,30 +85,25 @@ class TestGetIopoolData:
         assert result.result_code == ApiKeyValidationResult.INVALID_AUTH
         assert result.result_data is None
 
-    @pytest.mark.asyncio
     @patch("custom_components.iopool.config_flow.async_get_clientsession")
     async def test_get_iopool_data_connection_error(
         self, mock_session_func, hass: HomeAssistant, mock_aiohttp_session
     ) -> None:
         """Test API data retrieval with connection error."""
-        # Override the session to raise ClientError
-        mock_session_func.return_value.get.side_effect = ClientError(
-            "Connection failed"
-        )
+        mock_aiohttp_session.error = ClientError("Connection failed")
+        mock_session_func.return_value = mock_aiohttp_session
 
         result = await get_iopool_data(hass, TEST_API_KEY)
 
         assert result.result_code == ApiKeyValidationResult.CANNOT_CONNECT
         assert result.result_data is None
 
-    @pytest.mark.asyncio
     @patch("custom_components.iopool.config_flow.async_get_clientsession")
     async def test_get_iopool_data_server_error(
         self, mock_session_func, hass: HomeAssistant, mock_aiohttp_session
     ) -> None:
         """Test API data retrieval with unexpected server error (5xx → CANNOT_CONNECT)."""
-        response_mock = mock_aiohttp_session.get.return_value.__aenter__.return_value
-        response_mock.status = 500
+        mock_aiohttp_session.response.status = 500
         mock_session_func.return_value = mock_aiohttp_session
 
         result = await get_iopool_data(hass, TEST_API_KEY)
@@ -114,15 +111,12 @@ class TestGetIopoolData:
         assert result.result_code == ApiKeyValidationResult.CANNOT_CONNECT
         assert result.result_data is None
 
-    @pytest.mark.asyncio
     @patch("custom_components.iopool.config_flow.async_get_clientsession")
     async def test_get_iopool_data_json_error(
         self, mock_session_func, hass: HomeAssistant, mock_aiohttp_session
     ) -> None:
         """Test API data retrieval with JSON parsing error."""
-        response_mock = mock_aiohttp_session.get.return_value.__aenter__.return_value
-        response_mock.status = 200
-        response_mock.json = AsyncMock(side_effect=ValueError("Invalid JSON"))
+        mock_aiohttp_session.response.json_error = ValueError("Invalid JSON")
         mock_session_func.return_value = mock_aiohttp_session
 
         result = await get_iopool_data(hass, TEST_API_KEY)
@@ -130,15 +124,12 @@ class TestGetIopoolData:
         assert result.result_code == ApiKeyValidationResult.CANNOT_CONNECT
         assert result.result_data is None
 
-    @pytest.mark.asyncio
     @patch("custom_components.iopool.config_flow.async_get_clientsession")
     async def test_get_iopool_data_no_pools(
         self, mock_session_func, hass: HomeAssistant, mock_aiohttp_session
     ) -> None:
         """Test API data retrieval with no pools."""
-        response_mock = mock_aiohttp_session.get.return_value.__aenter__.return_value
-        # Override to return empty pools list
-        response_mock.json.return_value = []
+        mock_aiohttp_session.response.json_data = []
         mock_session_func.return_value = mock_aiohttp_session
 
         result = await get_iopool_data(hass, TEST_API_KEY)
@@ -151,7 +142,6 @@ class TestGetIopoolData:
 class TestConfigFlow:
     """Test config flow."""
 
-    @pytest.mark.asyncio
     async def test_user_form_display(self, hass: HomeAssistant) -> None:
         """Test that the user form is displayed correctly."""
         result = await hass.config_entries.flow.async_init(
@@ -162,7 +152,6 @@ class TestConfigFlow:
         assert result["step_id"] == "user"
         assert result["errors"] == {}
 
-    @pytest.mark.asyncio
     @patch("custom_components.iopool.config_flow.get_iopool_data")
     async def test_user_form_valid_api_key(
         self, mock_get_data, hass: HomeAssistant, mock_api_response
@@ -183,7 +172,6 @@ class TestConfigFlow:
         assert result["type"] == FlowResultType.FORM
         assert result["step_id"] == "choose_pool"
 
-    @pytest.mark.asyncio
     @patch("custom_components.iopool.config_flow.get_iopool_data")
     async def test_user_form_invalid_api_key(
         self, mock_get_data, hass: HomeAssistant
@@ -215,7 +203,6 @@ class TestConfigFlow:
         assert result["step_id"] == "user"
         assert result["errors"] == {"base": "invalid_auth"}
 
-    @pytest.mark.asyncio
     @patch("custom_components.iopool.config_flow.get_iopool_data")
     async def test_user_form_connection_error(
         self, mock_get_data, hass: HomeAssistant
@@ -247,7 +234,6 @@ class TestConfigFlow:
         assert result["step_id"] == "user"
         assert result["errors"] == {"base": "cannot_connect"}
 
-    @pytest.mark.asyncio
     @patch("custom_components.iopool.config_flow.get_iopool_data")
     async def test_user_form_no_pools_found(
         self, mock_get_data, hass: HomeAssistant, mock_api_response_no_pools
@@ -279,7 +265,6 @@ class TestConfigFlow:
         assert result["step_id"] == "user"
         assert result["errors"] == {"base": "no_pools"}
 
-    @pytest.mark.asyncio
     @patch("custom_components.iopool.config_flow.get_iopool_data")
     async def test_choose_pool_form_success(
         self, mock_get_data, hass: HomeAssistant, mock_api_response
@@ -324,7 +309,6 @@ class TestConfigFlow:
             CONF_POOL_ID: TEST_POOL_ID,
         }
 
-    @pytest.mark.asyncio
     @patch("custom_components.iopool.config_flow.get_iopool_data")
     async def test_choose_pool_no_pool_selected(
         self, mock_get_data, hass: HomeAssistant, mock_api_response
@@ -390,7 +374,6 @@ class TestIopoolOptionsFlow:
         )
         flow.handler = "test-entry-id"
 
-    @pytest.mark.asyncio
     async def test_choose_pool_no_pools_available(self, hass: HomeAssistant) -> None:
         """Test choose_pool step when no pools are available."""
         flow = IopoolConfigFlow()
@@ -401,7 +384,6 @@ class TestIopoolOptionsFlow:
         assert result["type"] == FlowResultType.ABORT
         assert result["reason"] == "no_pools"
 
-    @pytest.mark.asyncio
     async def test_options_flow_keeps_optional_number_fields_visible_when_none(self) -> None:
         """Test optional number selectors remain present when options are unset."""
         flow = IopoolOptionsFlow()
@@ -430,7 +412,6 @@ class TestIopoolOptionsFlow:
         assert max_duration_field["selector"]["number"]["min"] == 0.0
         assert winter_duration_field["selector"]["number"]["min"] == 0.0
 
-    @pytest.mark.asyncio
     async def test_options_flow_preserves_existing_optional_number_values(self) -> None:
         """Test optional number selectors keep configured values in the form."""
         options = IopoolOptionsData.to_dict(IopoolOptionsData())
@@ -471,7 +452,6 @@ class TestIopoolOptionsFlow:
             == 90
         )
 
-    @pytest.mark.asyncio
     async def test_options_flow_converts_zero_winter_duration_to_none(self) -> None:
         """Test zero winter duration is normalized back to None."""
         flow = IopoolOptionsFlow()
@@ -508,7 +488,6 @@ class TestIopoolOptionsFlow:
             CONF_OPTIONS_FILTRATION_DURATION
         ] is None
 
-    @pytest.mark.asyncio
     async def test_options_flow_converts_zero_summer_durations_to_none(self) -> None:
         """Test zero summer durations are normalized back to None."""
         flow = IopoolOptionsFlow()
@@ -542,7 +521,6 @@ class TestIopoolOptionsFlow:
             CONF_OPTIONS_FILTRATION_MAX_DURATION
         ] is None
 
-    @pytest.mark.asyncio
     async def test_choose_pool_no_new_pools(
         self, hass: HomeAssistant, mock_api_response
     ) -> None:
@@ -568,7 +546,6 @@ class TestIopoolOptionsFlow:
             assert result["type"] == FlowResultType.ABORT
             assert result["reason"] == "no_new_pools"
 
-    @pytest.mark.asyncio
     async def test_user_step_no_pools_found(self, hass: HomeAssistant) -> None:
         """Test user step when API returns no pools."""
         with patch(
@@ -585,7 +562,6 @@ class TestIopoolOptionsFlow:
             assert result["type"] == FlowResultType.ABORT
             assert result["reason"] == "no_pools_found"
 
-    @pytest.mark.asyncio
     async def test_get_iopool_data_client_error(self, hass: HomeAssistant) -> None:
         """Test get_iopool_data with ClientError."""
         with patch(
@@ -597,39 +573,28 @@ class TestIopoolOptionsFlow:
             assert result.result_code == ApiKeyValidationResult.CANNOT_CONNECT
             assert result.result_data is None
 
-    @pytest.mark.asyncio
     async def test_get_iopool_data_server_error(self, hass: HomeAssistant) -> None:
         """Test get_iopool_data with server error (5xx → CANNOT_CONNECT)."""
         with patch(
             "custom_components.iopool.config_flow.async_get_clientsession"
         ) as mock_session:
-            mock_response = AsyncMock()
-            mock_response.status = 500
-            mock_session.return_value.get.return_value.__aenter__.return_value = (
-                mock_response
-            )
+            mock_session.return_value = FakeSession(FakeResponse(status=500))
 
             result = await get_iopool_data(hass, TEST_API_KEY)
             assert result.result_code == ApiKeyValidationResult.CANNOT_CONNECT
             assert result.result_data is None
 
-    @pytest.mark.asyncio
     async def test_get_iopool_data_other_http_error(self, hass: HomeAssistant) -> None:
         """Test get_iopool_data with other HTTP error (e.g., 404 → CANNOT_CONNECT)."""
         with patch(
             "custom_components.iopool.config_flow.async_get_clientsession"
         ) as mock_session:
-            mock_response = AsyncMock()
-            mock_response.status = 404
-            mock_session.return_value.get.return_value.__aenter__.return_value = (
-                mock_response
-            )
+            mock_session.return_value = FakeSession(FakeResponse(status=404))
 
             result = await get_iopool_data(hass, TEST_API_KEY)
             assert result.result_code == ApiKeyValidationResult.CANNOT_CONNECT
             assert result.result_data is None
 
-    @pytest.mark.asyncio
     async def test_get_iopool_data_unexpected_error(self, hass: HomeAssistant) -> None:
         """Test get_iopool_data with unexpected error."""
         with patch(
@@ -641,7 +606,6 @@ class TestIopoolOptionsFlow:
             assert result.result_code == ApiKeyValidationResult.CANNOT_CONNECT
             assert result.result_data is None
 
-    @pytest.mark.asyncio
     async def test_choose_pool_no_pool_selected(
         self, hass: HomeAssistant, mock_api_response
     ) -> None:
@@ -659,7 +623,6 @@ class TestIopoolOptionsFlow:
             assert result["type"] == FlowResultType.FORM
             assert result["errors"]["base"] == "no_pool_selected"
 
-    @pytest.mark.asyncio
     async def test_choose_pool_form_display(
         self, hass: HomeAssistant, mock_api_response
     ) -> None:
@@ -677,7 +640,6 @@ class TestIopoolOptionsFlow:
             assert result["step_id"] == "choose_pool"
             assert result["last_step"] is True
 
-    @pytest.mark.asyncio
     async def test_reconfigure_step_no_changes(self, hass: HomeAssistant) -> None:
         """Test reconfigure step when API key hasn't changed."""
         flow = IopoolConfigFlow()
@@ -695,7 +657,6 @@ class TestIopoolOptionsFlow:
             assert result["type"] == FlowResultType.ABORT
             assert result["reason"] == "no_changes"
 
-    @pytest.mark.asyncio
     async def test_reconfigure_step_success(self, hass: HomeAssistant) -> None:
         """Test successful reconfigure step."""
         flow = IopoolConfigFlow()
@@ -723,7 +684,6 @@ class TestIopoolOptionsFlow:
             assert result["type"] == FlowResultType.ABORT
             assert result["reason"] == "reconfigure_successful"
 
-    @pytest.mark.asyncio
     async def test_reconfigure_step_api_error(self, hass: HomeAssistant) -> None:
         """Test reconfigure step with API validation error."""
         flow = IopoolConfigFlow()
@@ -760,7 +720,6 @@ class TestIopoolOptionsFlow:
             assert result["type"] == FlowResultType.FORM
             assert result["errors"]["base"] == ApiKeyValidationResult.INVALID_AUTH.value
 
-    @pytest.mark.asyncio
     async def test_reconfigure_step_form_display(self, hass: HomeAssistant) -> None:
         """Test reconfigure step displays form correctly."""
         flow = IopoolConfigFlow()
@@ -4,7 +4,7 @@ from __future__ import annotations
 
 import json
 import logging
-from unittest.mock import AsyncMock, MagicMock, patch
+from unittest.mock import MagicMock
 
 from aiohttp.client_exceptions import ClientError, ServerTimeoutError
 from custom_components.iopool.api_models import IopoolAPIResponse
@@ -14,21 +14,45 @@ import pytest
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.update_coordinator import UpdateFailed
 
-from .conftest import MOCK_POOLS_API_RESPONSE, TEST_API_KEY, TEST_POOL_ID
+from .conftest import (
+    MOCK_POOLS_API_RESPONSE,
+    TEST_API_KEY,
+    TEST_POOL_ID,
+    FakeResponse,
+    FakeSession,
+)
+
+
+@pytest.fixture(scope="module", autouse=True)
+def _patch_coordinator_setup(module_mocker) -> None:
+    """Patch what building a coordinator touches, once per module."""
+    module_mocker.patch("homeassistant.helpers.frame.report_usage")
+    module_mocker.patch(
+        "custom_components.iopool.coordinator.async_get_clientsession",
+        return_value=MagicMock(),
+    )
+
+
+@pytest.fixture(scope="module")
+def shared_coordinator() -> IopoolDataUpdateCoordinator:
+    """Build one coordinator for the whole module."""
+    return IopoolDataUpdateCoordinator(MagicMock(spec=HomeAssistant), TEST_API_KEY)
+
+
+@pytest.fixture
+def coordinator(shared_coordinator: IopoolDataUpdateCoordinator):
+    """Yield the shared coordinator and restore its session and data afterwards."""
+    session = shared_coordinator.session
+    yield shared_coordinator
+    shared_coordinator.session = session
+    shared_coordinator.data = None
 
 
 class TestIopoolDataUpdateCoordinator:
     """Test cases for IopoolDataUpdateCoordinator."""
 
-    @patch("homeassistant.helpers.frame.report_usage")
-    @patch("homeassistant.components.zeroconf.async_get_async_zeroconf")
-    @patch("homeassistant.helpers.aiohttp_client.async_get_clientsession")
-    async def test_coordinator_init(
-        self, mock_session, mock_zeroconf, mock_report: AsyncMock, hass: HomeAssistant
-    ) -> None:
+    def test_coordinator_init(self, hass: HomeAssistant) -> None:
         """Test coordinator initialization."""
-        # Mock the session to avoid frame helper issues
-        mock_session.return_value = MagicMock()
         coordinator = IopoolDataUpdateCoordinator(hass, TEST_API_KEY)
 
         assert coordinator.api_key == TEST_API_KEY
@@ -37,37 +61,11 @@ class TestIopoolDataUpdateCoordinator:
         assert coordinator.session is not None
         assert coordinator.name == "iopool"
 
-    @patch("homeassistant.helpers.frame.report_usage")
-    @patch("homeassistant.components.zeroconf.async_get_async_zeroconf")
-    @patch("homeassistant.helpers.aiohttp_client.async_get_clientsession")
     async def test_async_update_data_success(
-        self, mock_session, mock_zeroconf, mock_report: AsyncMock, hass: HomeAssistant
+        self, coordinator: IopoolDataUpdateCoordinator
     ) -> None:
         """Test successful data update."""
-        # Mock the session to avoid frame helper issues
-        mock_session.return_value = MagicMock()
-        coordinator = IopoolDataUpdateCoordinator(hass, TEST_API_KEY)
-
-        # Create a mock session that returns successful response
-        class MockSession:
-            def get(self, *args, **kwargs):
-                class MockContextManager:
-                    async def __aenter__(self):
-                        class MockResponse:
-                            async def json(self):
-                                return MOCK_POOLS_API_RESPONSE
-
-                            def raise_for_status(self):
-                                pass
-
-                        return MockResponse()
-
-                    async def __aexit__(self, *args):
-                        pass
-
-                return MockContextManager()
-
-        coordinator.session = MockSession()
+        coordinator.session = FakeSession()
 
         result = await coordinator._async_update_data()  # noqa: SLF001
         coordinator.data = result
@@ -76,51 +74,26 @@ class TestIopoolDataUpdateCoordinator:
         assert len(coordinator.data.pools) == 1
         assert coordinator.data.pools[0].id == TEST_POOL_ID
 
-    @patch("homeassistant.helpers.frame.report_usage")
-    @patch("homeassistant.components.zeroconf.async_get_async_zeroconf")
-    @patch("homeassistant.helpers.aiohttp_client.async_get_clientsession")
     async def test_async_update_data_client_error(
-        self, mock_session, mock_zeroconf, mock_report: AsyncMock, hass: HomeAssistant
+        self, coordinator: IopoolDataUpdateCoordinator
     ) -> None:
         """Test data update with client error."""
-        # Mock the session to avoid frame helper issues
-        mock_session.return_value = MagicMock()
-        coordinator = IopoolDataUpdateCoordinator(hass, TEST_API_KEY)
-
-        # Create a mock session that raises ClientError
-        class MockSession:
-            def get(self, *args, **kwargs):
-                raise ClientError("Connection error")
-
-        coordinator.session = MockSession()
+        coordinator.session = FakeSession(error=ClientError("Connection error"))
 
         with pytest.raises(UpdateFailed, match="Error communicating with API"):
             await coordinator._async_update_data()  # noqa: SLF001
 
-    @patch("homeassistant.helpers.frame.report_usage")
-    @patch("homeassistant.components.zeroconf.async_get_async_zeroconf")
-    @patch("homeassistant.helpers.aiohttp_client.async_get_clientsession")
     async def test_async_update_data_timeout_error(
-        self, mock_session, mock_zeroconf, mock_report: AsyncMock, hass: HomeAssistant
+        self, coordinator: IopoolDataUpdateCoordinator
     ) -> None:
         """Test data update with timeout error."""
-        # Mock the session to avoid frame helper issues
-        mock_session.return_value = MagicMock()
-        coordinator = IopoolDataUpdateCoordinator(hass, TEST_API_KEY)
-
-        # Create a mock session that raises ServerTimeoutError
-        class MockSession:
-            def get(self, *args, **kwargs):
-                raise ServerTimeoutError("Timeout")
-
-        coordinator.session = MockSession()
+        coordinator.session = FakeSession(error=ServerTimeoutError("Timeout"))
 
         with pytest.raises(UpdateFailed, match="Error communicating with API"):
             await coordinator._async_update_data()  # noqa: SLF001
 
-    @patch("homeassistant.helpers.frame.report_usage")
     def test_get_pool_data_found(
-        self, mock_report: AsyncMock, mock_iopool_coordinator
+        self, mock_iopool_coordinator
     ) -> None:
         """Test get_pool_data when pool is found."""
         coordinator = mock_iopool_coordinator
@@ -138,9 +111,8 @@ class TestIopoolDataUpdateCoordinator:
         assert result is not None
         assert result.id == TEST_POOL_ID
 
-    @patch("homeassistant.helpers.frame.report_usage")
     def test_get_pool_data_not_found(
-        self, mock_report: AsyncMock, mock_iopool_coordinator
+        self, mock_iopool_coordinator
     ) -> None:
         """Test get_pool_data when pool is not found."""
         coordinator = mock_iopool_coordinator
@@ -153,9 +125,8 @@ class TestIopoolDataUpdateCoordinator:
 
         assert result is None
 
-    @patch("homeassistant.helpers.frame.report_usage")
     def test_get_pool_data_no_data(
-        self, mock_report: AsyncMock, mock_iopool_coordinator
+        self, mock_iopool_coordinator
     ) -> None:
         """Test get_pool_data when coordinator has no data."""
         coordinator = mock_iopool_coordinator
@@ -170,10 +141,8 @@ class TestIopoolDataUpdateCoordinator:
 
         assert result is None
 
-    @patch("homeassistant.helpers.frame.report_usage")
     def test_get_pool_data_empty_pools(
         self,
-        mock_report: AsyncMock,
         mock_iopool_coordinator,
         mock_api_response_no_pools,
     ) -> None:
@@ -194,135 +163,47 @@ class TestIopoolDataUpdateCoordinator:
 class TestIopoolDataUpdateCoordinatorEdgeCases:
     """Test edge cases for IopoolDataUpdateCoordinator."""
 
-    @patch("homeassistant.helpers.frame.report_usage")
-    @patch("homeassistant.components.zeroconf.async_get_async_zeroconf")
-    @patch("homeassistant.helpers.aiohttp_client.async_get_clientsession")
     async def test_async_update_data_invalid_json_response(
-        self, mock_session, mock_zeroconf, mock_report: AsyncMock, hass: HomeAssistant
+        self, coordinator: IopoolDataUpdateCoordinator
     ) -> None:
         """Test data update with invalid JSON response."""
-        mock_session.return_value = MagicMock()
-        coordinator = IopoolDataUpdateCoordinator(hass, TEST_API_KEY)
-
-        # Create a mock session that returns invalid JSON
-        class MockSession:
-            def get(self, *args, **kwargs):
-                class MockContextManager:
-                    async def __aenter__(self):
-                        class MockResponse:
-                            async def json(self):
-                                raise json.JSONDecodeError("Invalid JSON", "", 0)
-
-                            def raise_for_status(self):
-                                pass
-
-                        return MockResponse()
-
-                    async def __aexit__(self, *args):
-                        pass
-
-                return MockContextManager()
-
-        coordinator.session = MockSession()
+        coordinator.session = FakeSession(
+            FakeResponse(json_error=json.JSONDecodeError("Invalid JSON", "", 0))
+        )
 
         with pytest.raises(UpdateFailed, match="Error parsing API response"):
             await coordinator._async_update_data()  # noqa: SLF001
 
-    @patch("homeassistant.helpers.frame.report_usage")
-    @patch("homeassistant.components.zeroconf.async_get_async_zeroconf")
-    @patch("homeassistant.helpers.aiohttp_client.async_get_clientsession")
-    async def test_async_update_data_key_error(
-        self, mock_session, mock_zeroconf, mock_report: AsyncMock, hass: HomeAssistant
+    def test_parse_response_key_error(
+        self, coordinator: IopoolDataUpdateCoordinator
     ) -> None:
-        """Test data update with KeyError during parsing."""
-        mock_session.return_value = MagicMock()
-        coordinator = IopoolDataUpdateCoordinator(hass, TEST_API_KEY)
-
-        # Create a mock session that returns incomplete data
-        class MockSession:
-            def get(self, *args, **kwargs):
-                class MockContextManager:
-                    async def __aenter__(self):
-                        class MockResponse:
-                            async def json(self):
-                                # Missing required key to trigger KeyError in from_dict
-                                return [
-                                    {"missing_required_field": "value"}
-                                ]  # Missing 'id' and other required fields
-
-                            def raise_for_status(self):
-                                pass
-
-                        return MockResponse()
-
-                    async def __aexit__(self, *args):
-                        pass
-
-                return MockContextManager()
-
-        coordinator.session = MockSession()
-
+        """Test that a pool missing required fields fails the update."""
         with pytest.raises(UpdateFailed, match="Error parsing API response"):
-            await coordinator._async_update_data()  # noqa: SLF001
+            coordinator._parse_response(  # noqa: SLF001
+                [{"missing_required_field": "value"}]
+            )
 
-    @patch("homeassistant.helpers.frame.report_usage")
-    @patch("homeassistant.components.zeroconf.async_get_async_zeroconf")
-    @patch("homeassistant.helpers.aiohttp_client.async_get_clientsession")
     async def test_async_update_data_http_error(
-        self, mock_session, mock_zeroconf, mock_report: AsyncMock, hass: HomeAssistant
+        self, coordinator: IopoolDataUpdateCoordinator
     ) -> None:
         """Test data update with HTTP error."""
-        mock_session.return_value = MagicMock()
-        coordinator = IopoolDataUpdateCoordinator(hass, TEST_API_KEY)
-
-        # Create a mock session that raises HTTP error
-        class MockSession:
-            def get(self, *args, **kwargs):
-                raise ClientError("HTTP error")
-
-        coordinator.session = MockSession()
+        coordinator.session = FakeSession(FakeResponse(status=500))
 
         with pytest.raises(UpdateFailed, match="Error communicating with API"):
             await coordinator._async_update_data()  # noqa: SLF001
 
-    @patch("homeassistant.helpers.frame.report_usage")
-    @patch("homeassistant.components.zeroconf.async_get_async_zeroconf")
-    @patch("homeassistant.helpers.aiohttp_client.async_get_clientsession")
     async def test_async_update_data_empty_response(
-        self, mock_session, mock_zeroconf, mock_report: AsyncMock, hass: HomeAssistant
+        self, coordinator: IopoolDataUpdateCoordinator
     ) -> None:
         """Test data update with empty response."""
-        mock_session.return_value = MagicMock()
-        coordinator = IopoolDataUpdateCoordinator(hass, TEST_API_KEY)
-
-        # Create a mock session that returns empty pools
-        class MockSession:
-            def get(self, *args, **kwargs):
-                class MockContextManager:
-                    async def __aenter__(self):
-                        class MockResponse:
-                            async def json(self):
-                                return []  # Empty list
-
-                            def raise_for_status(self):
-                                pass
-
-                        return MockResponse()
-
-                    async def __aexit__(self, *args):
-                        pass
-
-                return MockContextManager()
-
-        coordinator.session = MockSession()
+        coordinator.session = FakeSession(FakeResponse([]))
 
         result = await coordinator._async_update_data()  # noqa: SLF001
         assert result is not None
         assert result.pools == []
 
-    @patch("homeassistant.helpers.frame.report_usage")
     def test_get_pool_data_multiple_pools(
-        self, mock_report: AsyncMock, mock_iopool_coordinator
+        self, mock_iopool_coordinator
     ) -> None:
         """Test get_pool_data with multiple pools."""
         coordinator = mock_iopool_coordinator
@@ -355,9 +236,8 @@ class TestIopoolDataUpdateCoordinatorEdgeCases:
         result_none = coordinator.get_pool_data("nonexistent")
         assert result_none is None
 
-    @patch("homeassistant.helpers.frame.report_usage")
     def test_get_pool_data_with_none_pools(
-        self, mock_report: AsyncMock, mock_iopool_coordinator
+        self, mock_iopool_coordinator
     ) -> None:
         """Test get_pool_data when pools list is None."""
         coordinator = mock_iopool_coordinator
@@ -375,36 +255,11 @@ class TestIopoolDataUpdateCoordinatorEdgeCases:
 class TestIopoolDataUpdateCoordinatorIntegration:
     """Integration tests for IopoolDataUpdateCoordinator."""
 
-    @patch("homeassistant.helpers.frame.report_usage")
-    @patch("homeassistant.components.zeroconf.async_get_async_zeroconf")
-    @patch("homeassistant.helpers.aiohttp_client.async_get_clientsession")
     async def test_full_update_cycle_success(
-        self, mock_session, mock_zeroconf, mock_report: AsyncMock, hass: HomeAssistant
+        self, coordinator: IopoolDataUpdateCoordinator
     ) -> None:
         """Test a full successful update cycle."""
-        mock_session.return_value = MagicMock()
-        coordinator = IopoolDataUpdateCoordinator(hass, TEST_API_KEY)
-
-        # Create a mock session with realistic data
-        class MockSession:
-            def get(self, *args, **kwargs):
-                class MockContextManager:
-                    async def __aenter__(self):
-                        class MockResponse:
-                            async def json(self):
-                                return MOCK_POOLS_API_RESPONSE
-
-                            def raise_for_status(self):
-                                pass
-
-                        return MockResponse()
-
-                    async def __aexit__(self, *args):
-                        pass
-
-                return MockContextManager()
-
-        coordinator.session = MockSession()
+        coordinator.session = FakeSession()
 
         # Perform update
         result = await coordinator._async_update_data()  # noqa: SLF001
@@ -421,55 +276,21 @@ class TestIopoolDataUpdateCoordinatorIntegration:
         assert pool_data is not None
         assert pool_data.id == TEST_POOL_ID
 
-    @patch("homeassistant.helpers.frame.report_usage")
-    @patch("homeassistant.components.zeroconf.async_get_async_zeroconf")
-    @patch("homeassistant.helpers.aiohttp_client.async_get_clientsession")
-    async def test_coordinator_with_custom_api_key(
-        self, mock_session, mock_zeroconf, mock_report: AsyncMock, hass: HomeAssistant
-    ) -> None:
+    def test_coordinator_with_custom_api_key(self, hass: HomeAssistant) -> None:
         """Test coordinator initialization with custom API key."""
         custom_api_key = "custom_test_key_12345"
-        mock_session.return_value = MagicMock()
         coordinator = IopoolDataUpdateCoordinator(hass, custom_api_key)
 
         assert coordinator.api_key == custom_api_key
         assert coordinator.headers == {"x-api-key": custom_api_key}
 
-    @patch("homeassistant.helpers.frame.report_usage")
-    @patch("homeassistant.components.zeroconf.async_get_async_zeroconf")
-    @patch("homeassistant.helpers.aiohttp_client.async_get_clientsession")
     async def test_coordinator_logging_and_debug(
         self,
-        mock_session,
-        mock_zeroconf,
-        mock_report: AsyncMock,
-        hass: HomeAssistant,
-        caplog,
+        coordinator: IopoolDataUpdateCoordinator,
+        caplog: pytest.LogCaptureFixture,
     ) -> None:
         """Test coordinator logging functionality."""
-        mock_session.return_value = MagicMock()
-        coordinator = IopoolDataUpdateCoordinator(hass, TEST_API_KEY)
-
-        # Create a mock session that logs debug info
-        class MockSession:
-            def get(self, *args, **kwargs):
-                class MockContextManager:
-                    async def __aenter__(self):
-                        class MockResponse:
-                            async def json(self):
-                                return MOCK_POOLS_API_RESPONSE
-
-                            def raise_for_status(self):
-                                pass
-
-                        return MockResponse()
-
-                    async def __aexit__(self, *args):
-                        pass
-
-                return MockContextManager()
-
-        coordinator.session = MockSession()
+        coordinator.session = FakeSession()
 
         # Enable debug logging for this test
         with caplog.at_level(
@@ -490,73 +311,24 @@ class TestIopoolDataUpdateCoordinatorIntegration:
 class TestIopoolDataUpdateCoordinatorExceptionHandling:
     """Test comprehensive exception handling for IopoolDataUpdateCoordinator."""
 
-    @patch("homeassistant.helpers.frame.report_usage")
-    @patch("homeassistant.components.zeroconf.async_get_async_zeroconf")
-    @patch("homeassistant.helpers.aiohttp_client.async_get_clientsession")
-    async def test_async_update_data_value_error(
-        self, mock_session, mock_zeroconf, mock_report: AsyncMock, hass: HomeAssistant
+    def test_parse_response_value_error(
+        self, coordinator: IopoolDataUpdateCoordinator
     ) -> None:
-        """Test data update with ValueError during parsing."""
-        mock_session.return_value = MagicMock()
-        coordinator = IopoolDataUpdateCoordinator(hass, TEST_API_KEY)
-
-        # Create a mock session that returns data causing ValueError
-        class MockSession:
-            def get(self, *args, **kwargs):
-                class MockContextManager:
-                    async def __aenter__(self):
-                        class MockResponse:
-                            async def json(self):
-                                # Return data that will cause ValueError in parsing
-                                return [
-                                    {
-                                        "id": "pool1",
-                                        "title": "Pool 1",
-                                        "hasAFiltrationSystem": "invalid_boolean",  # Should cause ValueError
-                                        "lastMeasure": {},
-                                        "advice": {},
-                                    }
-                                ]
-
-                            def raise_for_status(self):
-                                pass
-
-                        return MockResponse()
-
-                    async def __aexit__(self, *args):
-                        pass
-
-                return MockContextManager()
-
-        coordinator.session = MockSession()
+        """Test that an unparsable measure timestamp fails the update."""
+        pool = MOCK_POOLS_API_RESPONSE[0]
+        bad_pool = {
+            **pool,
+            "latestMeasure": {**pool["latestMeasure"], "measuredAt": "not-a-date"},
+        }
 
         with pytest.raises(UpdateFailed, match="Error parsing API response"):
-            await coordinator._async_update_data()  # noqa: SLF001
+            coordinator._parse_response([bad_pool])  # noqa: SLF001
 
-    @patch("homeassistant.helpers.frame.report_usage")
-    @patch("homeassistant.components.zeroconf.async_get_async_zeroconf")
-    @patch("homeassistant.helpers.aiohttp_client.async_get_clientsession")
     async def test_async_update_data_unexpected_exception(
-        self, mock_session, mock_zeroconf, mock_report: AsyncMock, hass: HomeAssistant
+        self, coordinator: IopoolDataUpdateCoordinator
     ) -> None:
         """Test data update with unexpected exception type."""
-        mock_session.return_value = MagicMock()
-        coordinator = IopoolDataUpdateCoordinator(hass, TEST_API_KEY)
-
-        # Create a mock session that raises unexpected exception
-        class MockSession:
-            def get(self, *args, **kwargs):
-                class MockContextManager:
-                    async def __aenter__(self):
-                        # Raise an unexpected exception type not caught by the coordinator
-                        raise RuntimeError("Unexpected error")
-
-                    async def __aexit__(self, *args):
-                        pass
-
-                return MockContextManager()
-
-        coordinator.session = MockSession()
+        coordinator.session = FakeSession(error=RuntimeError("Unexpected error"))
 
         # This should not be caught by the coordinator and should propagate
         with pytest.raises(RuntimeError, match="Unexpected error"):
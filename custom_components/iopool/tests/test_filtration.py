@@ -1,6 +1,8 @@
 """Test the iopool filtration module."""
 
+import copy
 from datetime import datetime, time, timedelta
+from functools import cache
 from unittest.mock import AsyncMock, MagicMock, patch
 
 from custom_components.iopool.const import (
@@ -27,6 +29,14 @@ import pytest
 from homeassistant.util import dt as dt_util
 
 
+# Immutable date/time values shared by the calculate_* and slot start tests
+_TARGET_8AM = time(8, 0)
+_TARGET_23 = time(23, 0)
+_TWO_HOURS = timedelta(minutes=120)
+_JULY_1_2024 = datetime(2024, 7, 1)
+_JULY_1_2024_NOON = datetime(2024, 7, 1, 12, 0, 0)
+
+
 class MockConfigEntry:
     """Mock config entry for testing."""
 
@@ -40,97 +50,235 @@ class MockConfigEntry:
         self.entry_id = entry_id
 
 
-class TestFiltration:
-    """Test class for Filtration functionality."""
-
-    @pytest.fixture
-    def mock_config_entry(self) -> MockConfigEntry:
-        """Create a mock config entry for testing."""
-        return MockConfigEntry(
-            domain=DOMAIN,
-            data={"api_key": "test_api_key", "pool_id": "test_pool_id"},
-            options={
-                CONF_OPTIONS_FILTRATION: {
-                    CONF_OPTIONS_FILTRATION_SWITCH_ENTITY: "switch.pool_pump",
-                    CONF_OPTIONS_FILTRATION_SUMMER: {
-                        CONF_OPTIONS_FILTRATION_STATUS: True,
-                        CONF_OPTIONS_FILTRATION_MIN_DURATION: 60,
-                        CONF_OPTIONS_FILTRATION_MAX_DURATION: 480,
-                        CONF_OPTIONS_FILTRATION_SLOT1: {
-                            "name": "Morning",
-                            CONF_OPTIONS_FILTRATION_START: "08:00:00",
-                            CONF_OPTIONS_FILTRATION_DURATION_PERCENT: 50,
-                        },
-                        CONF_OPTIONS_FILTRATION_SLOT2: {
-                            "name": "Evening",
-                            CONF_OPTIONS_FILTRATION_START: "20:00:00",
-                            CONF_OPTIONS_FILTRATION_DURATION_PERCENT: 50,
-                        },
-                    },
-                    CONF_OPTIONS_FILTRATION_WINTER: {
-                        CONF_OPTIONS_FILTRATION_STATUS: True,
-                        CONF_OPTIONS_FILTRATION_START: "10:00:00",
-                        CONF_OPTIONS_FILTRATION_DURATION: 120,
-                    },
-                }
+_DATA = {"api_key": "test_api_key", "pool_id": "test_pool_id"}
+_FILTRATION_CONFIG_OPTIONS = {
+    CONF_OPTIONS_FILTRATION: {
+        CONF_OPTIONS_FILTRATION_SWITCH_ENTITY: "switch.pool_pump",
+        CONF_OPTIONS_FILTRATION_SUMMER: {
+            CONF_OPTIONS_FILTRATION_STATUS: True,
+            CONF_OPTIONS_FILTRATION_MIN_DURATION: 60,
+            CONF_OPTIONS_FILTRATION_MAX_DURATION: 480,
+            CONF_OPTIONS_FILTRATION_SLOT1: {
+                "name": "Morning",
+                CONF_OPTIONS_FILTRATION_START: "08:00:00",
+                CONF_OPTIONS_FILTRATION_DURATION_PERCENT: 50,
+            },
+            CONF_OPTIONS_FILTRATION_SLOT2: {
+                "name": "Evening",
+                CONF_OPTIONS_FILTRATION_START: "20:00:00",
+                CONF_OPTIONS_FILTRATION_DURATION_PERCENT: 50,
             },
+        },
+        CONF_OPTIONS_FILTRATION_WINTER: {
+            CONF_OPTIONS_FILTRATION_STATUS: True,
+            CONF_OPTIONS_FILTRATION_START: "10:00:00",
+            CONF_OPTIONS_FILTRATION_DURATION: 120,
+        },
+    }
+}
+
+
+@cache
+def _build_mock_config_entry() -> MockConfigEntry:
+    """Build the shared mock config entry with both seasonal filtrations enabled.
+
+    The entry is memoized and must be treated as read-only; tests that change
+    its data or options work on a ``copy.deepcopy`` of it.
+    """
+    return MockConfigEntry(domain=DOMAIN, data=_DATA, options=_FILTRATION_CONFIG_OPTIONS)
+
+
+class _StubStates:
+    """Dict-backed stand-in for hass.states.
+
+    Tests register states by entity id in ``_map``; unknown entities resolve
+    to None, as with the real state machine.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the stub with no registered states."""
+        self._map: dict[str, MagicMock] = {}
+        self.async_set = MagicMock()
+
+    def get(self, entity_id: str) -> MagicMock | None:
+        """Return the state registered for entity_id, if any."""
+        return self._map.get(entity_id)
+
+
+def _build_mock_coordinator() -> MagicMock:
+    """Build a mock coordinator."""
+    coordinator = MagicMock()
+    coordinator.hass = MagicMock()
+    coordinator.hass.states = _StubStates()
+    coordinator.hass.services.async_call = AsyncMock()
+    coordinator.data = None
+    return coordinator
+
+
+def _build_mock_entry(
+    config_entry: MockConfigEntry, coordinator: MagicMock
+) -> IopoolConfigEntry:
+    """Build a mock iopool config entry wired to the given coordinator."""
+    config_data = MagicMock(spec=IopoolConfigData)
+    config_data.options = MagicMock()
+    config_data.options.__dict__ = config_entry.options
+
+    runtime_data = MagicMock()
+    runtime_data.coordinator = coordinator
+    runtime_data.config = config_data
+    runtime_data.remove_time_listeners = []
+
+    entry = MagicMock(spec=IopoolConfigEntry)
+    entry.runtime_data = runtime_data
+    entry.entry_id = config_entry.entry_id
+    entry.data = config_entry.data
+    entry.options = config_entry.options
+    return entry
+
+
+class TestFiltrationReadOnly:
+    """Test Filtration behaviour that never mutates the instance.
+
+    The Filtration instance is shared by every test of the class, so tests
+    added here must not modify it or its mocks.
+    """
+
+    @pytest.fixture(scope="class")
+    @classmethod
+    def filtration(cls) -> Filtration:
+        """Create a Filtration instance shared by the read-only tests."""
+        return Filtration(
+            _build_mock_entry(_build_mock_config_entry(), _build_mock_coordinator())
         )
 
-    @pytest.fixture
-    def mock_coordinator(self) -> MagicMock:
-        """Create a mock coordinator."""
-        coordinator = MagicMock()
-        coordinator.hass = MagicMock()
-        coordinator.hass.states.get = MagicMock()
-        coordinator.hass.services.async_call = AsyncMock()
-        coordinator.data = None
-        return coordinator
+    def test_init(self, filtration: Filtration) -> None:
+        """Test Filtration initialization."""
+        assert filtration.configuration_filtration_enabled_summer is True
+        assert filtration.configuration_filtration_enabled_winter is True
+        assert filtration.configuration_filtration_enabled is True
+        # Instance variables must start as None
+        assert filtration._next_stop_time is None
+        assert filtration._active_slot is None
+
+    def test_config_filtration_summer_enabled_true(
+        self, filtration: Filtration
+    ) -> None:
+        """Test summer filtration enabled configuration check."""
+        result = filtration.config_filtration_summer_enabled()
+        assert result is True
+
+    def test_config_filtration_winter_enabled_true(
+        self, filtration: Filtration
+    ) -> None:
+        """Test winter filtration enabled configuration check."""
+        result = filtration.config_filtration_winter_enabled()
+        assert result is True
+
+    def test_config_filtration_enabled_both_enabled(
+        self, filtration: Filtration
+    ) -> None:
+        """Test filtration enabled when both summer and winter are enabled."""
+        result = filtration.config_filtration_enabled()
+        assert result is True
+
+    def test_get_switch_entity_configured(self, filtration: Filtration) -> None:
+        """Test getting switch entity when configured."""
+        result = filtration.get_switch_entity()
+        assert result == "switch.pool_pump"
+
+    def test_get_summer_filtration_slot_start_slot1(
+        self, filtration: Filtration
+    ) -> None:
+        """Test getting summer filtration slot 1 start time."""
+        with patch(
+            "homeassistant.util.dt.now", return_value=_JULY_1_2024_NOON
+        ):
+            result = filtration.get_summer_filtration_slot_start(1)
+            assert result is not None
+            assert result.hour == 8
+            assert result.minute == 0
+
+    def test_get_summer_filtration_slot_start_slot2(
+        self, filtration: Filtration
+    ) -> None:
+        """Test getting summer filtration slot 2 start time."""
+        with patch(
+            "homeassistant.util.dt.now", return_value=_JULY_1_2024_NOON
+        ):
+            result = filtration.get_summer_filtration_slot_start(2)
+            assert result is not None
+            assert result.hour == 20
+            assert result.minute == 0
+
+    def test_get_summer_filtration_slot_start_invalid_slot(
+        self, filtration: Filtration
+    ) -> None:
+        """Test getting summer filtration slot start with invalid slot number."""
+        result = filtration.get_summer_filtration_slot_start(3)
+        assert result is None
+
+    def test_get_winter_filtration_start_end(self, filtration: Filtration) -> None:
+        """Test getting winter filtration start and end times."""
+        result = filtration.get_winter_filtration_start_end()
+        assert result is not None
+        start_time, duration = result
+        assert isinstance(start_time, time)
+        assert isinstance(duration, timedelta)
+        assert start_time.hour == 10
+        assert start_time.minute == 0
+        assert duration.total_seconds() == 7200
+
+    def test_calculate_next_run_datetime(self, filtration: Filtration) -> None:
+        """Test calculating next run datetime."""
+        # Use timezone-aware datetime
+        current_time = dt_util.now().replace(
+            year=2024, month=7, day=1, hour=6, minute=0, second=0, microsecond=0
+        )
+
+        result = filtration.calculate_next_run_datetime(current_time, _TARGET_8AM)
+        assert result is not None
+        assert result.hour == 8
+        assert result.minute == 0
+        assert result.date() == _JULY_1_2024.date()
+
+    def test_calculate_end_time(self, filtration: Filtration) -> None:
+        """Test calculating end time from start time and duration."""
+        result = filtration.calculate_end_time(_TARGET_8AM, _TWO_HOURS)
+        assert result.hour == 10
+        assert result.minute == 0
+
+    def test_calculate_end_time_next_day(self, filtration: Filtration) -> None:
+        """Test calculating end time that goes to next day."""
+        result = filtration.calculate_end_time(_TARGET_23, _TWO_HOURS)
+        assert result.hour == 1
+        assert result.minute == 0
+
+
+class TestFiltrationMutation:
+    """Test Filtration behaviour that mutates the instance or its mocks."""
 
     @pytest.fixture
-    def mock_config_data(self, mock_config_entry: MockConfigEntry) -> IopoolConfigData:
-        """Create mock config data."""
-        config_data = MagicMock(spec=IopoolConfigData)
-        config_data.options = MagicMock()
-        config_data.options.__dict__ = mock_config_entry.options
-        return config_data
+    def mock_config_entry(self) -> MockConfigEntry:
+        """Return the shared read-only mock config entry."""
+        return _build_mock_config_entry()
 
     @pytest.fixture
-    def mock_runtime_data(
-        self, mock_coordinator: MagicMock, mock_config_data: IopoolConfigData
-    ) -> MagicMock:
-        """Create mock runtime data."""
-        runtime_data = MagicMock()
-        runtime_data.coordinator = mock_coordinator
-        runtime_data.config = mock_config_data
-        runtime_data.remove_time_listeners = []
-        return runtime_data
+    def mock_coordinator(self) -> MagicMock:
+        """Create a mock coordinator."""
+        return _build_mock_coordinator()
 
     @pytest.fixture
     def mock_entry(
-        self, mock_config_entry: MockConfigEntry, mock_runtime_data: MagicMock
+        self, mock_config_entry: MockConfigEntry, mock_coordinator: MagicMock
     ) -> IopoolConfigEntry:
         """Create a mock iopool config entry."""
-        entry = MagicMock(spec=IopoolConfigEntry)
-        entry.runtime_data = mock_runtime_data
-        entry.entry_id = mock_config_entry.entry_id
-        entry.data = mock_config_entry.data
-        entry.options = mock_config_entry.options
-        return entry
+        return _build_mock_entry(mock_config_entry, mock_coordinator)
 
     @pytest.fixture
     def filtration(self, mock_entry: IopoolConfigEntry) -> Filtration:
         """Create a Filtration instance for testing."""
         return Filtration(mock_entry)
 
-    def test_init(self, filtration: Filtration) -> None:
-        """Test Filtration initialization."""
-        assert filtration.configuration_filtration_enabled_summer is True
-        assert filtration.configuration_filtration_enabled_winter is True
-        assert filtration.configuration_filtration_enabled is True
-        # Instance variables must start as None
-        assert filtration._next_stop_time is None
-        assert filtration._active_slot is None
-
     def test_restore_filtration_state(self, filtration: Filtration) -> None:
         """Test restore_filtration_state sets instance variables."""
         filtration.restore_filtration_state("2026-03-28T04:00:00+01:00", "winter")
@@ -201,50 +349,29 @@ class TestFiltration:
         assert filtration._next_stop_time is None
         assert filtration._active_slot is None
 
-    def test_config_filtration_summer_enabled_true(
-        self, filtration: Filtration
-    ) -> None:
-        """Test summer filtration enabled configuration check."""
-        result = filtration.config_filtration_summer_enabled()
-        assert result is True
-
     def test_config_filtration_summer_enabled_false(
-        self, mock_entry: IopoolConfigEntry
+        self, mock_coordinator: MagicMock
     ) -> None:
         """Test summer filtration disabled configuration check."""
-        # Use patch.object to mock the method properly
-        with patch.object(
-            Filtration, "config_filtration_summer_enabled", return_value=False
-        ):
-            filtration = Filtration(mock_entry)
-            result = filtration.config_filtration_summer_enabled()
-            assert result is False
-
-    def test_config_filtration_winter_enabled_true(
-        self, filtration: Filtration
-    ) -> None:
-        """Test winter filtration enabled configuration check."""
-        result = filtration.config_filtration_winter_enabled()
-        assert result is True
+        config_entry = copy.deepcopy(_build_mock_config_entry())
+        config_entry.options[CONF_OPTIONS_FILTRATION][CONF_OPTIONS_FILTRATION_SUMMER][
+            CONF_OPTIONS_FILTRATION_STATUS
+        ] = False
+        filtration = Filtration(_build_mock_entry(config_entry, mock_coordinator))
+        result = filtration.config_filtration_summer_enabled()
+        assert result is False
 
     def test_config_filtration_winter_enabled_false(
-        self, mock_entry: IopoolConfigEntry
+        self, mock_coordinator: MagicMock
     ) -> None:
         """Test winter filtration disabled configuration check."""
-        # Use patch.object to mock the method properly
-        with patch.object(
-            Filtration, "config_filtration_winter_enabled", return_value=False
-        ):
-            filtration = Filtration(mock_entry)
-            result = filtration.config_filtration_winter_enabled()
-            assert result is False
-
-    def test_config_filtration_enabled_both_enabled(
-        self, filtration: Filtration
-    ) -> None:
-        """Test filtration enabled when both summer and winter are enabled."""
-        result = filtration.config_filtration_enabled()
-        assert result is True
+        config_entry = copy.deepcopy(_build_mock_config_entry())
+        config_entry.options[CONF_OPTIONS_FILTRATION][CONF_OPTIONS_FILTRATION_WINTER][
+            CONF_OPTIONS_FILTRATION_STATUS
+        ] = False
+        filtration = Filtration(_build_mock_entry(config_entry, mock_coordinator))
+        result = filtration.config_filtration_winter_enabled()
+        assert result is False
 
     def test_config_filtration_enabled_only_summer(
         self, mock_entry: IopoolConfigEntry
@@ -326,11 +453,6 @@ class TestFiltration:
                 "No filtration switch entity configured, cannot stop filtration"
             )
 
-    def test_get_switch_entity_configured(self, filtration: Filtration) -> None:
-        """Test getting switch entity when configured."""
-        result = filtration.get_switch_entity()
-        assert result == "switch.pool_pump"
-
     def test_get_switch_entity_not_configured(
         self, mock_entry: IopoolConfigEntry
     ) -> None:
@@ -358,37 +480,6 @@ class TestFiltration:
             result = filtration.search_entity("switch", "pump")
             assert result is None
 
-    def test_get_summer_filtration_slot_start_slot1(
-        self, filtration: Filtration
-    ) -> None:
-        """Test getting summer filtration slot 1 start time."""
-        with patch(
-            "homeassistant.util.dt.now", return_value=datetime(2024, 7, 1, 12, 0, 0)
-        ):
-            result = filtration.get_summer_filtration_slot_start(1)
-            assert result is not None
-            assert result.hour == 8
-            assert result.minute == 0
-
-    def test_get_summer_filtration_slot_start_slot2(
-        self, filtration: Filtration
-    ) -> None:
-        """Test getting summer filtration slot 2 start time."""
-        with patch(
-            "homeassistant.util.dt.now", return_value=datetime(2024, 7, 1, 12, 0, 0)
-        ):
-            result = filtration.get_summer_filtration_slot_start(2)
-            assert result is not None
-            assert result.hour == 20
-            assert result.minute == 0
-
-    def test_get_summer_filtration_slot_start_invalid_slot(
-        self, filtration: Filtration
-    ) -> None:
-        """Test getting summer filtration slot start with invalid slot number."""
-        result = filtration.get_summer_filtration_slot_start(3)
-        assert result is None
-
     def test_get_summer_filtration_duration(self, filtration: Filtration) -> None:
         """Test getting summer filtration duration."""
         # Use a simple mock approach without accessing private members
@@ -407,7 +498,7 @@ class TestFiltration:
             # Mock the state of the recommendation entity
             mock_state = MagicMock()
             mock_state.state = "180"  # 3 hours in minutes
-            mock_coordinator.hass.states.get.return_value = mock_state
+            mock_coordinator.hass.states._map["sensor.iopool_recommendation"] = mock_state
 
             result = filtration.get_summer_filtration_duration()
             assert result == 180
@@ -422,7 +513,7 @@ class TestFiltration:
             # Test with a value below minimum
             mock_state = MagicMock()
             mock_state.state = "30"  # Below minimum of 60
-            mock_coordinator.hass.states.get.return_value = mock_state
+            mock_coordinator.hass.states._map["sensor.iopool_recommendation"] = mock_state
 
             result = filtration.get_summer_filtration_duration()
             assert result == 60  # Should be clamped to minimum
@@ -437,7 +528,7 @@ class TestFiltration:
             # Test with a value above maximum
             mock_state = MagicMock()
             mock_state.state = "600"  # Above maximum of 480
-            mock_coordinator.hass.states.get.return_value = mock_state
+            mock_coordinator.hass.states._map["sensor.iopool_recommendation"] = mock_state
 
             result = filtration.get_summer_filtration_duration()
             assert result == 480  # Should be clamped to maximum
@@ -455,7 +546,7 @@ class TestFiltration:
             # Test with non-numeric state
             mock_state = MagicMock()
             mock_state.state = "invalid"
-            mock_coordinator.hass.states.get.return_value = mock_state
+            mock_coordinator.hass.states._map["sensor.iopool_recommendation"] = mock_state
 
             result = filtration.get_summer_filtration_duration()
             assert result is None
@@ -473,9 +564,7 @@ class TestFiltration:
             ),
             patch("custom_components.iopool.filtration._LOGGER") as mock_logger,
         ):
-            # Test with no state entity found
-            mock_coordinator.hass.states.get.return_value = None
-
+            # No state is registered for the entity
             result = filtration.get_summer_filtration_duration()
             assert result is None
             mock_logger.warning.assert_called_with(
@@ -500,7 +589,7 @@ class TestFiltration:
             # Mock the state of the pool mode entity
             mock_state = MagicMock()
             mock_state.state = "summer"
-            mock_coordinator.hass.states.get.return_value = mock_state
+            mock_coordinator.hass.states._map["sensor.iopool_pool_mode"] = mock_state
 
             result = filtration.get_filtration_pool_mode()
             assert result == "summer"
@@ -515,9 +604,7 @@ class TestFiltration:
             ),
             patch("custom_components.iopool.filtration._LOGGER") as mock_logger,
         ):
-            # Test with no state entity found
-            mock_coordinator.hass.states.get.return_value = None
-
+            # No state is registered for the entity
             result = filtration.get_filtration_pool_mode()
             assert result is None
             mock_logger.warning.assert_called_with(
@@ -534,7 +621,7 @@ class TestFiltration:
             # Test with state that cannot be converted to string (should not happen normally)
             mock_state = MagicMock()
             mock_state.state = None
-            mock_coordinator.hass.states.get.return_value = mock_state
+            mock_coordinator.hass.states._map["sensor.iopool_pool_mode"] = mock_state
 
             result = filtration.get_filtration_pool_mode()
             assert result == "None"  # str(None) returns "None"
@@ -563,8 +650,7 @@ class TestFiltration:
             ),
             patch("custom_components.iopool.filtration._LOGGER") as mock_logger,
         ):
-            mock_coordinator.hass.states.get.return_value = None
-
+            # No state is registered for the entity
             result = await filtration.get_filtration_attributes()
             assert result == {}
             mock_logger.warning.assert_called_with(
@@ -580,7 +666,7 @@ class TestFiltration:
         ):
             mock_state = MagicMock()
             mock_state.attributes = {"duration": 120, "mode": "summer"}
-            mock_coordinator.hass.states.get.return_value = mock_state
+            mock_coordinator.hass.states._map["binary_sensor.iopool_filtration"] = mock_state
 
             result = await filtration.get_filtration_attributes()
             expected = (
@@ -590,49 +676,6 @@ class TestFiltration:
             )
             assert result == expected
 
-    def test_get_winter_filtration_start_end(self, filtration: Filtration) -> None:
-        """Test getting winter filtration start and end times."""
-        result = filtration.get_winter_filtration_start_end()
-        assert result is not None
-        start_time, duration = result
-        assert isinstance(start_time, time)
-        assert isinstance(duration, timedelta)
-        assert start_time.hour == 10
-        assert start_time.minute == 0
-        assert duration.total_seconds() == 7200
-
-    def test_calculate_next_run_datetime(self, filtration: Filtration) -> None:
-        """Test calculating next run datetime."""
-        target_time = time(8, 0)
-        # Use timezone-aware datetime
-        current_time = dt_util.now().replace(
-            year=2024, month=7, day=1, hour=6, minute=0, second=0, microsecond=0
-        )
-
-        result = filtration.calculate_next_run_datetime(current_time, target_time)
-        assert result is not None
-        assert result.hour == 8
-        assert result.minute == 0
-        assert result.date() == datetime(2024, 7, 1).date()
-
-    def test_calculate_end_time(self, filtration: Filtration) -> None:
-        """Test calculating end time from start time and duration."""
-        start_time = time(8, 0)
-        duration = timedelta(minutes=120)
-
-        result = filtration.calculate_end_time(start_time, duration)
-        assert result.hour == 10
-        assert result.minute == 0
-
-    def test_calculate_end_time_next_day(self, filtration: Filtration) -> None:
-        """Test calculating end time that goes to next day."""
-        start_time = time(23, 0)
-        duration = timedelta(minutes=120)
-
-        result = filtration.calculate_end_time(start_time, duration)
-        assert result.hour == 1
-        assert result.minute == 0
-
     def test_setup_time_events(self, filtration: Filtration) -> None:
         """Test setting up time events."""
         # Simplified test - just verify the method is callable and doesn't crash
@@ -717,7 +760,7 @@ class TestFiltration:
         # We cannot directly test private methods, so we test through public methods
         mock_state = MagicMock()
         mock_state.state = "on"
-        mock_coordinator.hass.states.get.return_value = mock_state
+        mock_coordinator.hass.states._map["switch.pool_pump"] = mock_state
 
         # Test that the switch entity returns the correct value
         result = filtration.get_switch_entity()
@@ -727,8 +770,7 @@ class TestFiltration:
         self, filtration: Filtration, mock_coordinator: MagicMock
     ) -> None:
         """Test getting switch state when state doesn't exist."""
-        mock_coordinator.hass.states.get.return_value = None
-
+        # No state is registered for the entity
         # Test through public interface - when no state, get_switch_entity still works
         result = filtration.get_switch_entity()
         assert result == "switch.pool_pump"
@@ -738,7 +780,7 @@ class TestFiltration:
     # ---------------------------------------------------------------------------
 
     def _make_check_filtration_mocks(self, now_dt):
-        """Return (switch_state, boost_mock, mock_search, mock_get) helpers for check_filtration_status tests."""
+        """Return (switch_state, boost_mock, mock_search, states) helpers for check_filtration_status tests."""
         switch_state = MagicMock()
         switch_state.state = "on"
         boost_mock = MagicMock()
@@ -750,14 +792,12 @@ class TestFiltration:
                 return "select.boost_selector"
             return None
 
-        def mock_get(eid):
-            if eid == "switch.pool_pump":
-                return switch_state
-            if eid == "select.boost_selector":
-                return boost_mock
-            return None
+        states = {
+            "switch.pool_pump": switch_state,
+            "select.boost_selector": boost_mock,
+        }
 
-        return switch_state, boost_mock, mock_search, mock_get
+        return switch_state, boost_mock, mock_search, states
 
     async def test_check_filtration_status_slot1_end_event_fired(
         self, filtration: Filtration, mock_coordinator: MagicMock
@@ -773,7 +813,7 @@ class TestFiltration:
             "slot1_start_time": start_str,
             "filtration_duration_minutes": 120,
         }
-        _, _, mock_search, mock_get = self._make_check_filtration_mocks(now)
+        _, _, mock_search, states = self._make_check_filtration_mocks(now)
 
         with (
             patch.object(filtration, "get_switch_entity", return_value="switch.pool_pump"),
@@ -786,7 +826,7 @@ class TestFiltration:
             patch.object(filtration, "update_filtration_attributes", new=AsyncMock()),
             patch.object(filtration, "publish_event", new=AsyncMock()) as mock_publish,
         ):
-            mock_coordinator.hass.states.get.side_effect = mock_get
+            mock_coordinator.hass.states._map.update(states)
             await filtration.check_filtration_status(now)
 
         mock_publish.assert_called_once()
@@ -807,7 +847,7 @@ class TestFiltration:
             # slot1_start_time deliberately absent
             "filtration_duration_minutes": 120,
         }
-        _, _, mock_search, mock_get = self._make_check_filtration_mocks(now)
+        _, _, mock_search, states = self._make_check_filtration_mocks(now)
 
         with (
             patch.object(filtration, "get_switch_entity", return_value="switch.pool_pump"),
@@ -820,7 +860,7 @@ class TestFiltration:
             patch.object(filtration, "update_filtration_attributes", new=AsyncMock()),
             patch.object(filtration, "publish_event", new=AsyncMock()) as mock_publish,
         ):
-            mock_coordinator.hass.states.get.side_effect = mock_get
+            mock_coordinator.hass.states._map.update(states)
             # Must not raise TypeError
             await filtration.check_filtration_status(now)
 
@@ -840,7 +880,7 @@ class TestFiltration:
             # slot2_start_time deliberately absent
             "filtration_duration_minutes": 120,
         }
-        _, _, mock_search, mock_get = self._make_check_filtration_mocks(now)
+        _, _, mock_search, states = self._make_check_filtration_mocks(now)
 
         with (
             patch.object(filtration, "get_switch_entity", return_value="switch.pool_pump"),
@@ -853,7 +893,7 @@ class TestFiltration:
             patch.object(filtration, "update_filtration_attributes", new=AsyncMock()),
             patch.object(filtration, "publish_event", new=AsyncMock()) as mock_publish,
         ):
-            mock_coordinator.hass.states.get.side_effect = mock_get
+            mock_coordinator.hass.states._map.update(states)
             await filtration.check_filtration_status(now)
 
         mock_publish.assert_called_once()
@@ -874,7 +914,7 @@ class TestFiltration:
             "winter_filtration_start": start_str,   # correct key
             # "winter_start_time" is intentionally absent to confirm only the right key is read
         }
-        _, _, mock_search, mock_get = self._make_check_filtration_mocks(now)
+        _, _, mock_search, states = self._make_check_filtration_mocks(now)
 
         with (
             patch.object(filtration, "get_switch_entity", return_value="switch.pool_pump"),
@@ -887,7 +927,7 @@ class TestFiltration:
             patch.object(filtration, "update_filtration_attributes", new=AsyncMock()),
             patch.object(filtration, "publish_event", new=AsyncMock()) as mock_publish,
         ):
-            mock_coordinator.hass.states.get.side_effect = mock_get
+            mock_coordinator.hass.states._map.update(states)
             await filtration.check_filtration_status(now)
 
         mock_publish.assert_called_once()
@@ -909,7 +949,7 @@ class TestFiltration:
         filtration_attrs = {
             "winter_start_time": start_dt.isoformat(),   # old wrong key
         }
-        _, _, mock_search, mock_get = self._make_check_filtration_mocks(now)
+        _, _, mock_search, states = self._make_check_filtration_mocks(now)
 
         with (
             patch.object(filtration, "get_switch_entity", return_value="switch.pool_pump"),
@@ -922,7 +962,7 @@ class TestFiltration:
             patch.object(filtration, "update_filtration_attributes", new=AsyncMock()),
             patch.object(filtration, "publish_event", new=AsyncMock()) as mock_publish,
         ):
-            mock_coordinator.hass.states.get.side_effect = mock_get
+            mock_coordinator.hass.states._map.update(states)
             # Must not raise TypeError even when correct key is absent
             await filtration.check_filtration_status(now)
 
@@ -939,7 +979,7 @@ class TestFiltration:
         filtration._active_slot = "winter"
         filtration._next_stop_time = now.isoformat()
         filtration_attrs = {}   # no winter_filtration_start at all
-        _, _, mock_search, mock_get = self._make_check_filtration_mocks(now)
+        _, _, mock_search, states = self._make_check_filtration_mocks(now)
 
         with (
             patch.object(filtration, "get_switch_entity", return_value="switch.pool_pump"),
@@ -952,7 +992,7 @@ class TestFiltration:
             patch.object(filtration, "update_filtration_attributes", new=AsyncMock()),
             patch.object(filtration, "publish_event", new=AsyncMock()) as mock_publish,
         ):
-            mock_coordinator.hass.states.get.side_effect = mock_get
+            mock_coordinator.hass.states._map.update(states)
             await filtration.check_filtration_status(now)
 
         mock_publish.assert_called_once()
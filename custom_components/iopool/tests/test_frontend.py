@@ -4,8 +4,6 @@ from __future__ import annotations
 
 from unittest.mock import AsyncMock, MagicMock, patch
 
-import pytest
-
 from custom_components.iopool.frontend import (
     CARD_FILENAME,
     _CARD_VERSION,
@@ -150,7 +148,6 @@ class TestIopoolCardRegistration:
         hass.http.async_register_static_paths = AsyncMock()
         return hass, mock_resources
 
-    @pytest.mark.asyncio
     async def test_async_register_path_success(self):
         """Test static path registration succeeds."""
         hass, _ = self._make_hass()
@@ -161,7 +158,6 @@ class TestIopoolCardRegistration:
 
         hass.http.async_register_static_paths.assert_called_once()
 
-    @pytest.mark.asyncio
     async def test_async_register_path_already_registered(self):
         """Test that RuntimeError on static path registration is silently ignored."""
         hass, _ = self._make_hass()
@@ -172,7 +168,6 @@ class TestIopoolCardRegistration:
             # Should not raise
             await reg._async_register_path()
 
-    @pytest.mark.asyncio
     async def test_async_register_card_creates_new_resource(self):
         """Test card registration creates a new resource when none exists."""
         hass, mock_resources = self._make_hass()
@@ -189,7 +184,6 @@ class TestIopoolCardRegistration:
         )
         mock_resources.async_update_item.assert_not_called()
 
-    @pytest.mark.asyncio
     async def test_async_register_card_updates_outdated_resource(self):
         """Test card registration updates an existing resource with a different version."""
         hass, mock_resources = self._make_hass()
@@ -208,7 +202,6 @@ class TestIopoolCardRegistration:
         )
         mock_resources.async_create_item.assert_not_called()
 
-    @pytest.mark.asyncio
     async def test_async_register_card_skips_if_version_unchanged(self):
         """Test card registration is skipped when version is already current."""
         hass, mock_resources = self._make_hass()
@@ -224,7 +217,6 @@ class TestIopoolCardRegistration:
         mock_resources.async_update_item.assert_not_called()
         mock_resources.async_create_item.assert_not_called()
 
-    @pytest.mark.asyncio
     async def test_async_register_skips_card_in_yaml_mode(self):
         """Test that card resource is NOT registered when lovelace is in yaml mode."""
         hass, mock_resources = self._make_hass(mode="yaml")
@@ -237,7 +229,6 @@ class TestIopoolCardRegistration:
                     mock_path.assert_called_once()
                     mock_card.assert_not_called()
 
-    @pytest.mark.asyncio
     async def test_async_register_full_flow_storage_mode(self):
         """Test full registration flow in storage mode with resources loaded."""
         hass, mock_resources = self._make_hass(mode="storage", resources_loaded=True)
@@ -252,7 +243,6 @@ class TestIopoolCardRegistration:
         mock_resources.async_get_info.assert_called_once()
         mock_resources.async_create_item.assert_called_once()
 
-    @pytest.mark.asyncio
     async def test_async_unregister_storage_mode_removes_resources(self):
         """Test that async_unregister removes all matching resources in storage mode."""
         hass, mock_resources = self._make_hass(mode="storage")
@@ -266,7 +256,6 @@ class TestIopoolCardRegistration:
         mock_resources.async_get_info.assert_called_once()
         mock_resources.async_delete_item.assert_called_once_with("res-id-1")
 
-    @pytest.mark.asyncio
     async def test_async_unregister_yaml_mode_does_nothing(self):
         """Test that async_unregister does nothing in yaml mode."""
         hass, mock_resources = self._make_hass(mode="yaml")
@@ -278,7 +267,6 @@ class TestIopoolCardRegistration:
         mock_resources.async_get_info.assert_not_called()
         mock_resources.async_delete_item.assert_not_called()
 
-    @pytest.mark.asyncio
     async def test_async_unregister_no_matching_resources(self):
         """Test that async_unregister does nothing when no matching resources exist."""
         hass, mock_resources = self._make_hass(mode="storage")
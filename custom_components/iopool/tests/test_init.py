@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
-from unittest.mock import AsyncMock, MagicMock, patch
+from types import MappingProxyType
+from typing import TYPE_CHECKING
+from unittest.mock import AsyncMock, MagicMock
 
 from custom_components.iopool import (
     async_setup_entry,
@@ -12,78 +14,95 @@ from custom_components.iopool import (
 from custom_components.iopool.const import DOMAIN
 import pytest
 
-from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import CoreState, Event, HomeAssistant
+from homeassistant.core import CoreState
+
+from .conftest import TEST_API_KEY
+
+if TYPE_CHECKING:
+    from homeassistant.core import HomeAssistant
+
+_NOT_RUNNING = CoreState.not_running
+_RUNNING = CoreState.running
+
+# Filtration options as stored by a fresh config flow, with filtration disabled
+_DEFAULT_FILTRATION_OPTIONS = MappingProxyType(
+    {
+        "filtration": {
+            "switch_entity": None,
+            "summer_filtration": {
+                "status": False,
+                "min_duration": None,
+                "max_duration": None,
+                "slot1": {
+                    "name": None,
+                    "start": None,
+                    "duration_percent": 50,
+                },
+                "slot2": {
+                    "name": None,
+                    "start": None,
+                    "duration_percent": 50,
+                },
+            },
+            "winter_filtration": {
+                "status": False,
+                "start": None,
+                "duration": None,
+            },
+        }
+    }
+)
+
+
+def async_return(value):
+    """Return a coroutine function resolving to value, for unasserted awaits."""
+
+    async def _async_return(*args, **kwargs):
+        return value
+
+    return _async_return
+
 
-from .conftest import TEST_API_KEY, TEST_POOL_ID, TEST_POOL_TITLE
+def _runtime_data_with_listeners(*remove_listeners):
+    """Return runtime data holding the given time listener removers."""
+    runtime_data = MagicMock()
+    runtime_data.remove_time_listeners = list(remove_listeners)
+    return runtime_data
+
+
+def _runtime_data_without_listeners():
+    """Return runtime data without a remove_time_listeners attribute."""
+    runtime_data = MagicMock()
+    del runtime_data.remove_time_listeners
+    return runtime_data
 
 
 class TestIntegrationInit:
     """Test iopool integration initialization."""
 
-    @pytest.mark.asyncio
-    @patch("custom_components.iopool.IopoolDataUpdateCoordinator")
-    @patch("custom_components.iopool.Filtration")
-    @patch("custom_components.iopool.IopoolCardRegistration")
+    DOMAIN = DOMAIN
+    API_KEY = TEST_API_KEY
+
     async def test_async_setup_entry_success(
         self,
-        mock_card_registration_class,
-        mock_filtration_class,
-        mock_coordinator_class,
         hass: HomeAssistant,
+        make_config_entry,
+        iopool_mocks,
     ) -> None:
         """Test successful setup of config entry."""
         # Create mock config entry
-        config_entry = ConfigEntry(
-            version=1,
-            minor_version=1,
-            domain=DOMAIN,
-            title=TEST_POOL_TITLE,
-            data={
-                "api_key": TEST_API_KEY,
-                "pool_id": TEST_POOL_ID,
-            },
-            options={
-                "filtration": {
-                    "switch_entity": None,
-                    "summer_filtration": {
-                        "status": False,
-                        "min_duration": None,
-                        "max_duration": None,
-                        "slot1": {
-                            "name": None,
-                            "start": None,
-                            "duration_percent": 50,
-                        },
-                        "slot2": {
-                            "name": None,
-                            "start": None,
-                            "duration_percent": 50,
-                        },
-                    },
-                    "winter_filtration": {
-                        "status": False,
-                        "start": None,
-                        "duration": None,
-                    },
-                }
-            },
-            source="user",
-            unique_id=TEST_POOL_ID,
-            discovery_keys=frozenset(),
-            subentries_data={},
-        )
+        config_entry = make_config_entry(options=_DEFAULT_FILTRATION_OPTIONS)
 
         # Mock coordinator
         mock_coordinator = AsyncMock()
         mock_coordinator.async_config_entry_first_refresh = AsyncMock()
-        mock_coordinator_class.return_value = mock_coordinator
+        iopool_mocks.coordinator_cls.return_value = mock_coordinator
 
         # Mock filtration
         mock_filtration = MagicMock()
         mock_filtration.config_filtration_enabled.return_value = False
         mock_filtration.setup_time_events = MagicMock()
-        mock_filtration_class.return_value = mock_filtration
+        iopool_mocks.filtration_cls.return_value = mock_filtration
 
         # Mock platform setup
         hass.config_entries.async_forward_entry_setups = AsyncMock(return_value=True)
@@ -93,16 +112,16 @@ class TestIntegrationInit:
         hass.bus.async_listen_once = MagicMock()
 
         # Mock state as not running
-        hass.state = CoreState.not_running
+        hass.state = _NOT_RUNNING
 
-        mock_card_registration_class.return_value.async_register = AsyncMock()
+        iopool_mocks.card_registration_cls.return_value.async_register = async_return(None)
 
         result = await async_setup_entry(hass, config_entry)
 
         assert result is True
-        mock_coordinator_class.assert_called_once_with(hass, TEST_API_KEY)
+        iopool_mocks.coordinator_cls.assert_called_once_with(hass, self.API_KEY)
         mock_coordinator.async_config_entry_first_refresh.assert_called_once()
-        mock_filtration_class.assert_called_once()
+        iopool_mocks.filtration_cls.assert_called_once()
 
         # Check that runtime data was set up correctly
         assert config_entry.runtime_data is not None
@@ -110,8 +129,8 @@ class TestIntegrationInit:
         assert config_entry.runtime_data.filtration == mock_filtration
 
         # Check that hass.data was set up
-        assert DOMAIN in hass.data
-        assert config_entry.entry_id in hass.data[DOMAIN]
+        assert self.DOMAIN in hass.data
+        assert config_entry.entry_id in hass.data[self.DOMAIN]
 
         # Check that platforms were set up
         hass.config_entries.async_forward_entry_setups.assert_called_once()
@@ -119,56 +138,37 @@ class TestIntegrationInit:
         # Check that started event listener was registered
         hass.bus.async_listen_once.assert_called_once()
 
-    @pytest.mark.asyncio
-    @patch("custom_components.iopool.IopoolDataUpdateCoordinator")
-    @patch("custom_components.iopool.Filtration")
-    @patch("custom_components.iopool.IopoolCardRegistration")
     async def test_async_setup_entry_filtration_enabled_running(
         self,
-        mock_card_registration_class,
-        mock_filtration_class,
-        mock_coordinator_class,
         hass: HomeAssistant,
+        make_config_entry,
+        iopool_mocks,
     ) -> None:
         """Test setup when filtration is enabled and HA is running."""
-        config_entry = ConfigEntry(
-            version=1,
-            minor_version=1,
-            domain=DOMAIN,
-            title=TEST_POOL_TITLE,
-            data={
-                "api_key": TEST_API_KEY,
-                "pool_id": TEST_POOL_ID,
-            },
-            options={},
-            source="user",
-            unique_id=TEST_POOL_ID,
-            discovery_keys=frozenset(),
-            subentries_data={},
-        )
+        config_entry = make_config_entry()
 
         # Mock coordinator
         mock_coordinator = AsyncMock()
-        mock_coordinator.async_config_entry_first_refresh = AsyncMock()
-        mock_coordinator_class.return_value = mock_coordinator
+        mock_coordinator.async_config_entry_first_refresh = async_return(None)
+        iopool_mocks.coordinator_cls.return_value = mock_coordinator
 
         # Mock filtration as enabled
         mock_filtration = MagicMock()
         mock_filtration.config_filtration_enabled.return_value = True
         mock_filtration.setup_time_events = MagicMock()
-        mock_filtration_class.return_value = mock_filtration
+        iopool_mocks.filtration_cls.return_value = mock_filtration
 
         # Mock platform setup
-        hass.config_entries.async_forward_entry_setups = AsyncMock(return_value=True)
+        hass.config_entries.async_forward_entry_setups = async_return(True)
 
         # Mock bus listener
         hass.bus = MagicMock()
         hass.bus.async_listen_once = MagicMock()
 
         # Mock state as running
-        hass.state = CoreState.running
+        hass.state = _RUNNING
 
-        mock_card_registration_class.return_value.async_register = AsyncMock()
+        iopool_mocks.card_registration_cls.return_value.async_register = async_return(None)
 
         result = await async_setup_entry(hass, config_entry)
 
@@ -176,9 +176,8 @@ class TestIntegrationInit:
         # Check that setup_time_events was called because filtration is enabled and HA is running
         mock_filtration.setup_time_events.assert_called()
 
-    @pytest.mark.asyncio
     async def test_on_started_event_filtration_enabled(
-        self, hass: HomeAssistant
+        self, hass: HomeAssistant, make_config_entry, iopool_mocks
     ) -> None:
         """Test the _on_started event handler when filtration is enabled."""
         # Setup a mock filtration that's enabled
@@ -187,67 +186,33 @@ class TestIntegrationInit:
         mock_filtration.setup_time_events = MagicMock()
 
         # Create the config entry and runtime data
-        config_entry = ConfigEntry(
-            version=1,
-            minor_version=1,
-            domain=DOMAIN,
-            title=TEST_POOL_TITLE,
-            data={
-                "api_key": TEST_API_KEY,
-                "pool_id": TEST_POOL_ID,
-            },
-            options={},
-            source="user",
-            unique_id=TEST_POOL_ID,
-            discovery_keys=frozenset(),
-            subentries_data={},
-        )
-
-        # We need to test the _on_started function by calling async_setup_entry
-        # and capturing the registered callback
-        captured_callback = None
-
-        def capture_callback(event_type, callback):
-            nonlocal captured_callback
-            captured_callback = callback
+        config_entry = make_config_entry()
 
         hass.bus = MagicMock()
-        hass.bus.async_listen_once = capture_callback
 
-        with (
-            patch(
-                "custom_components.iopool.IopoolDataUpdateCoordinator"
-            ) as mock_coordinator_class,
-            patch("custom_components.iopool.Filtration") as mock_filtration_class,
-            patch("custom_components.iopool.IopoolCardRegistration") as mock_card_registration_class,
-        ):
-            mock_coordinator = AsyncMock()
-            mock_coordinator.async_config_entry_first_refresh = AsyncMock()
-            mock_coordinator_class.return_value = mock_coordinator
+        mock_coordinator = AsyncMock()
+        mock_coordinator.async_config_entry_first_refresh = async_return(None)
+        iopool_mocks.coordinator_cls.return_value = mock_coordinator
 
-            mock_filtration_class.return_value = mock_filtration
+        iopool_mocks.filtration_cls.return_value = mock_filtration
 
-            mock_card_registration_class.return_value.async_register = AsyncMock()
+        iopool_mocks.card_registration_cls.return_value.async_register = async_return(None)
 
-            hass.config_entries.async_forward_entry_setups = AsyncMock(
-                return_value=True
-            )
-            hass.state = CoreState.not_running
+        hass.config_entries.async_forward_entry_setups = async_return(True)
+        hass.state = _NOT_RUNNING
 
-            # Call setup to register the callback
-            await async_setup_entry(hass, config_entry)
+        # Call setup to register the callback
+        await async_setup_entry(hass, config_entry)
 
-            # Now call the captured callback with a mock event
-            if captured_callback:
-                mock_event = MagicMock(spec=Event)
-                await captured_callback(mock_event)
+        # Call the registered _on_started callback with a bare event
+        _event_type, on_started = hass.bus.async_listen_once.call_args.args
+        await on_started(object())
 
-                # Verify that setup_time_events was called
-                mock_filtration.setup_time_events.assert_called()
+        # Verify that setup_time_events was called
+        mock_filtration.setup_time_events.assert_called()
 
-    @pytest.mark.asyncio
     async def test_on_started_event_filtration_disabled(
-        self, hass: HomeAssistant
+        self, hass: HomeAssistant, make_config_entry, iopool_mocks
     ) -> None:
         """Test the _on_started event handler when filtration is disabled."""
         # Setup a mock filtration that's disabled
@@ -256,85 +221,41 @@ class TestIntegrationInit:
         mock_filtration.setup_time_events = MagicMock()
 
         # Create the config entry
-        config_entry = ConfigEntry(
-            version=1,
-            minor_version=1,
-            domain=DOMAIN,
-            title=TEST_POOL_TITLE,
-            data={
-                "api_key": TEST_API_KEY,
-                "pool_id": TEST_POOL_ID,
-            },
-            options={},
-            source="user",
-            unique_id=TEST_POOL_ID,
-            discovery_keys=frozenset(),
-            subentries_data={},
-        )
-
-        # Capture the registered callback
-        captured_callback = None
-
-        def capture_callback(event_type, callback):
-            nonlocal captured_callback
-            captured_callback = callback
+        config_entry = make_config_entry()
 
         hass.bus = MagicMock()
-        hass.bus.async_listen_once = capture_callback
 
-        with (
-            patch(
-                "custom_components.iopool.IopoolDataUpdateCoordinator"
-            ) as mock_coordinator_class,
-            patch("custom_components.iopool.Filtration") as mock_filtration_class,
-            patch("custom_components.iopool.IopoolCardRegistration") as mock_card_registration_class,
-        ):
-            mock_coordinator = AsyncMock()
-            mock_coordinator.async_config_entry_first_refresh = AsyncMock()
-            mock_coordinator_class.return_value = mock_coordinator
+        mock_coordinator = AsyncMock()
+        mock_coordinator.async_config_entry_first_refresh = async_return(None)
+        iopool_mocks.coordinator_cls.return_value = mock_coordinator
 
-            mock_filtration_class.return_value = mock_filtration
+        iopool_mocks.filtration_cls.return_value = mock_filtration
 
-            mock_card_registration_class.return_value.async_register = AsyncMock()
+        iopool_mocks.card_registration_cls.return_value.async_register = async_return(None)
 
-            hass.config_entries.async_forward_entry_setups = AsyncMock(
-                return_value=True
-            )
-            hass.state = CoreState.not_running
+        hass.config_entries.async_forward_entry_setups = async_return(True)
+        hass.state = _NOT_RUNNING
 
-            # Call setup to register the callback
-            await async_setup_entry(hass, config_entry)
+        # Call setup to register the callback
+        await async_setup_entry(hass, config_entry)
 
-            # Now call the captured callback with a mock event
-            if captured_callback:
-                mock_event = MagicMock(spec=Event)
-                await captured_callback(mock_event)
+        # Call the registered _on_started callback with a bare event
+        _event_type, on_started = hass.bus.async_listen_once.call_args.args
+        await on_started(object())
 
-                # Verify that setup_time_events was NOT called
-                mock_filtration.setup_time_events.assert_not_called()
+        # Verify that setup_time_events was NOT called
+        mock_filtration.setup_time_events.assert_not_called()
 
-    @pytest.mark.asyncio
-    @patch("custom_components.iopool.IopoolDataUpdateCoordinator")
     async def test_async_setup_entry_coordinator_fails(
         self,
-        mock_coordinator_class,
         hass: HomeAssistant,
+        make_config_entry,
+        mocker,
     ) -> None:
         """Test setup failure when coordinator refresh fails."""
-        config_entry = ConfigEntry(
-            version=1,
-            minor_version=1,
-            domain=DOMAIN,
-            title=TEST_POOL_TITLE,
-            data={
-                "api_key": TEST_API_KEY,
-                "pool_id": TEST_POOL_ID,
-            },
-            options={},
-            source="user",
-            unique_id=TEST_POOL_ID,
-            discovery_keys=frozenset(),
-            subentries_data={},
+        config_entry = make_config_entry()
+        mock_coordinator_class = mocker.patch(
+            "custom_components.iopool.IopoolDataUpdateCoordinator"
         )
 
         # Mock coordinator that fails
@@ -347,199 +268,66 @@ class TestIntegrationInit:
         with pytest.raises(Exception, match="API Error"):
             await async_setup_entry(hass, config_entry)
 
-    @pytest.mark.asyncio
-    @patch("custom_components.iopool.IopoolCardRegistration")
-    async def test_async_unload_entry_success(self, mock_card_registration_class, hass: HomeAssistant) -> None:
-        """Test successful unloading of config entry."""
-        config_entry = ConfigEntry(
-            version=1,
-            minor_version=1,
-            domain=DOMAIN,
-            title=TEST_POOL_TITLE,
-            data={
-                "api_key": TEST_API_KEY,
-                "pool_id": TEST_POOL_ID,
-            },
-            options={},
-            source="user",
-            unique_id=TEST_POOL_ID,
-            discovery_keys=frozenset(),
-            subentries_data={},
-        )
-
-        # Mock runtime data with remove listeners
-        remove_listener_mock = MagicMock()
-        runtime_data = MagicMock()
-        runtime_data.remove_time_listeners = [remove_listener_mock]
-        config_entry.runtime_data = runtime_data
-
-        # Initialize hass.data for domain
-        hass.data.setdefault(DOMAIN, {})
-        hass.data[DOMAIN][config_entry.entry_id] = {"test": "data"}
-
-        # Mock platform unload
-        hass.config_entries.async_unload_platforms = AsyncMock(return_value=True)
-
-        mock_card_registration_class.return_value.async_unregister = AsyncMock()
-
-        result = await async_unload_entry(hass, config_entry)
-
-        assert result is True
-        remove_listener_mock.assert_called_once()
-        # Check that entry was removed from hass.data
-        assert config_entry.entry_id not in hass.data[DOMAIN]
-        mock_card_registration_class.return_value.async_unregister.assert_called_once()
-
-    @pytest.mark.asyncio
-    @patch("custom_components.iopool.IopoolCardRegistration")
-    async def test_async_unload_entry_no_runtime_data(
-        self, mock_card_registration_class, hass: HomeAssistant
-    ) -> None:
-        """Test unload entry when runtime_data is None."""
-        config_entry = ConfigEntry(
-            version=1,
-            minor_version=1,
-            domain=DOMAIN,
-            title=TEST_POOL_TITLE,
-            data={
-                "api_key": TEST_API_KEY,
-                "pool_id": TEST_POOL_ID,
-            },
-            options={},
-            source="user",
-            unique_id=TEST_POOL_ID,
-            discovery_keys=frozenset(),
-            subentries_data={},
-        )
-
-        # No runtime data
-        config_entry.runtime_data = None
-
-        # Mock platform unload
-        hass.config_entries.async_unload_platforms = AsyncMock(return_value=True)
-
-        mock_card_registration_class.return_value.async_unregister = AsyncMock()
-
-        result = await async_unload_entry(hass, config_entry)
-
-        assert result is True
-
-    @pytest.mark.asyncio
-    @patch("custom_components.iopool.IopoolCardRegistration")
-    async def test_async_unload_entry_no_remove_listeners(
-        self, mock_card_registration_class, hass: HomeAssistant
+    @pytest.mark.parametrize(
+        ("make_runtime_data", "unload_ok", "domain_present", "expected"),
+        [
+            (lambda: _runtime_data_with_listeners(MagicMock()), True, True, True),
+            (lambda: None, True, True, True),
+            (_runtime_data_without_listeners, True, True, True),
+            (_runtime_data_with_listeners, False, True, False),
+            (_runtime_data_with_listeners, True, False, True),
+        ],
+        ids=[
+            "success",
+            "no_runtime_data",
+            "no_remove_listeners",
+            "platform_fails",
+            "domain_not_in_data",
+        ],
+    )
+    async def test_async_unload_entry(
+        self,
+        hass: HomeAssistant,
+        make_config_entry,
+        mocker,
+        make_runtime_data,
+        unload_ok,
+        domain_present,
+        expected,
     ) -> None:
-        """Test unload entry when runtime_data has no remove_time_listeners."""
-        config_entry = ConfigEntry(
-            version=1,
-            minor_version=1,
-            domain=DOMAIN,
-            title=TEST_POOL_TITLE,
-            data={
-                "api_key": TEST_API_KEY,
-                "pool_id": TEST_POOL_ID,
-            },
-            options={},
-            source="user",
-            unique_id=TEST_POOL_ID,
-            discovery_keys=frozenset(),
-            subentries_data={},
+        """Test unloading of config entry across runtime_data and hass.data states."""
+        mock_card_registration_class = mocker.patch(
+            "custom_components.iopool.IopoolCardRegistration"
         )
-
-        # Runtime data without remove_time_listeners attribute
-        runtime_data = MagicMock()
-        del runtime_data.remove_time_listeners  # Remove the attribute
+        config_entry = make_config_entry()
+        runtime_data = make_runtime_data()
         config_entry.runtime_data = runtime_data
 
-        # Mock platform unload
-        hass.config_entries.async_unload_platforms = AsyncMock(return_value=True)
+        if domain_present:
+            hass.data.setdefault(self.DOMAIN, {})
+            hass.data[self.DOMAIN][config_entry.entry_id] = {"test": "data"}
 
+        hass.config_entries.async_unload_platforms = async_return(unload_ok)
         mock_card_registration_class.return_value.async_unregister = AsyncMock()
 
         result = await async_unload_entry(hass, config_entry)
 
-        assert result is True
-
-    @pytest.mark.asyncio
-    async def test_async_unload_entry_platform_fails(self, hass: HomeAssistant) -> None:
-        """Test unload entry when platform unload fails."""
-        config_entry = ConfigEntry(
-            version=1,
-            minor_version=1,
-            domain=DOMAIN,
-            title=TEST_POOL_TITLE,
-            data={
-                "api_key": TEST_API_KEY,
-                "pool_id": TEST_POOL_ID,
-            },
-            options={},
-            source="user",
-            unique_id=TEST_POOL_ID,
-            discovery_keys=frozenset(),
-            subentries_data={},
+        assert result is expected
+        # Time listeners are always removed, whatever the platform unload result
+        for remove_listener in getattr(runtime_data, "remove_time_listeners", []):
+            remove_listener.assert_called_once()
+        if domain_present:
+            assert (config_entry.entry_id in hass.data[self.DOMAIN]) is not expected
+        assert (
+            mock_card_registration_class.return_value.async_unregister.await_count
+            == int(expected)
         )
 
-        # Mock runtime data
-        config_entry.runtime_data = MagicMock()
-        config_entry.runtime_data.remove_time_listeners = []
-
-        # Mock platform unload failure
-        hass.config_entries.async_unload_platforms = AsyncMock(return_value=False)
-
-        result = await async_unload_entry(hass, config_entry)
-
-        assert result is False
-
-    @pytest.mark.asyncio
-    @patch("custom_components.iopool.IopoolCardRegistration")
-    async def test_async_unload_entry_domain_not_in_data(
-        self, mock_card_registration_class, hass: HomeAssistant
+    async def test_update_listener(
+        self, hass: HomeAssistant, make_config_entry
     ) -> None:
-        """Test unload entry when domain is not in hass.data."""
-        config_entry = ConfigEntry(
-            version=1,
-            minor_version=1,
-            domain=DOMAIN,
-            title=TEST_POOL_TITLE,
-            data={
-                "api_key": TEST_API_KEY,
-                "pool_id": TEST_POOL_ID,
-            },
-            options={},
-            source="user",
-            unique_id=TEST_POOL_ID,
-            discovery_keys=frozenset(),
-            subentries_data={},
-        )
-
-        # Mock runtime data
-        config_entry.runtime_data = MagicMock()
-        config_entry.runtime_data.remove_time_listeners = []
-
-        # Don't initialize hass.data for domain
-        # hass.data should not contain DOMAIN
-
-        # Mock platform unload
-        hass.config_entries.async_unload_platforms = AsyncMock(return_value=True)
-
-        mock_card_registration_class.return_value.async_unregister = AsyncMock()
-
-        result = await async_unload_entry(hass, config_entry)
-
-        assert result is True
-
-    @pytest.mark.asyncio
-    async def test_update_listener(self, hass: HomeAssistant) -> None:
         """Test update listener function."""
-        config_entry = ConfigEntry(
-            version=1,
-            minor_version=1,
-            domain=DOMAIN,
-            title=TEST_POOL_TITLE,
-            data={
-                "api_key": TEST_API_KEY,
-                "pool_id": TEST_POOL_ID,
-            },
+        config_entry = make_config_entry(
             options={
                 "filtration": {
                     "switch_entity": "switch.pool_pump",
@@ -550,10 +338,6 @@ class TestIntegrationInit:
                     },
                 }
             },
-            source="user",
-            unique_id=TEST_POOL_ID,
-            discovery_keys=frozenset(),
-            subentries_data={},
         )
 
         # Mock runtime data
@@ -571,24 +355,11 @@ class TestIntegrationInit:
         # Check that reload was called
         hass.config_entries.async_reload.assert_called_once_with(config_entry.entry_id)
 
-    @pytest.mark.asyncio
-    async def test_update_listener_no_runtime_data(self, hass: HomeAssistant) -> None:
+    async def test_update_listener_no_runtime_data(
+        self, hass: HomeAssistant, make_config_entry
+    ) -> None:
         """Test update listener when runtime_data is None."""
-        config_entry = ConfigEntry(
-            version=1,
-            minor_version=1,
-            domain=DOMAIN,
-            title=TEST_POOL_TITLE,
-            data={
-                "api_key": TEST_API_KEY,
-                "pool_id": TEST_POOL_ID,
-            },
-            options={},
-            source="user",
-            unique_id=TEST_POOL_ID,
-            discovery_keys=frozenset(),
-            subentries_data={},
-        )
+        config_entry = make_config_entry()
 
         # No runtime data
         config_entry.runtime_data = None
@@ -601,72 +372,46 @@ class TestIntegrationInit:
         # Check that reload was still called
         hass.config_entries.async_reload.assert_called_once_with(config_entry.entry_id)
 
-    @pytest.mark.asyncio
-    @patch("custom_components.iopool.IopoolDataUpdateCoordinator")
-    @patch("custom_components.iopool.Filtration")
-    @patch("custom_components.iopool.IopoolCardRegistration")
     async def test_async_setup_entry_registers_frontend_card(
         self,
-        mock_card_registration_class,
-        mock_filtration_class,
-        mock_coordinator_class,
         hass: HomeAssistant,
+        make_config_entry,
+        iopool_mocks,
     ) -> None:
         """Test that async_setup_entry calls IopoolCardRegistration.async_register."""
-        config_entry = ConfigEntry(
-            version=1,
-            minor_version=1,
-            domain=DOMAIN,
-            title=TEST_POOL_TITLE,
-            data={"api_key": TEST_API_KEY, "pool_id": TEST_POOL_ID},
-            options={},
-            source="user",
-            unique_id=TEST_POOL_ID,
-            discovery_keys=frozenset(),
-            subentries_data={},
-        )
+        config_entry = make_config_entry()
 
         mock_coordinator = AsyncMock()
-        mock_coordinator.async_config_entry_first_refresh = AsyncMock()
-        mock_coordinator_class.return_value = mock_coordinator
+        mock_coordinator.async_config_entry_first_refresh = async_return(None)
+        iopool_mocks.coordinator_cls.return_value = mock_coordinator
 
         mock_filtration = MagicMock()
         mock_filtration.config_filtration_enabled.return_value = False
-        mock_filtration_class.return_value = mock_filtration
+        iopool_mocks.filtration_cls.return_value = mock_filtration
 
         mock_card_reg_instance = MagicMock()
         mock_card_reg_instance.async_register = AsyncMock()
-        mock_card_registration_class.return_value = mock_card_reg_instance
+        iopool_mocks.card_registration_cls.return_value = mock_card_reg_instance
 
-        hass.config_entries.async_forward_entry_setups = AsyncMock(return_value=True)
+        hass.config_entries.async_forward_entry_setups = async_return(True)
         hass.bus = MagicMock()
         hass.bus.async_listen_once = MagicMock()
-        hass.state = CoreState.not_running
+        hass.state = _NOT_RUNNING
 
         result = await async_setup_entry(hass, config_entry)
 
         assert result is True
-        mock_card_registration_class.assert_called_once_with(hass)
+        iopool_mocks.card_registration_cls.assert_called_once_with(hass)
         mock_card_reg_instance.async_register.assert_called_once()
 
-    @pytest.mark.asyncio
-    @patch("custom_components.iopool.IopoolCardRegistration")
     async def test_async_unload_entry_unregisters_frontend_card(
-        self, mock_card_registration_class, hass: HomeAssistant
+        self, hass: HomeAssistant, make_config_entry, mocker
     ) -> None:
         """Test that async_unload_entry calls IopoolCardRegistration.async_unregister on success."""
-        config_entry = ConfigEntry(
-            version=1,
-            minor_version=1,
-            domain=DOMAIN,
-            title=TEST_POOL_TITLE,
-            data={"api_key": TEST_API_KEY, "pool_id": TEST_POOL_ID},
-            options={},
-            source="user",
-            unique_id=TEST_POOL_ID,
-            discovery_keys=frozenset(),
-            subentries_data={},
+        mock_card_registration_class = mocker.patch(
+            "custom_components.iopool.IopoolCardRegistration"
         )
+        config_entry = make_config_entry()
 
         config_entry.runtime_data = MagicMock()
         config_entry.runtime_data.remove_time_listeners = []
@@ -675,7 +420,7 @@ class TestIntegrationInit:
         mock_card_reg_instance.async_unregister = AsyncMock()
         mock_card_registration_class.return_value = mock_card_reg_instance
 
-        hass.config_entries.async_unload_platforms = AsyncMock(return_value=True)
+        hass.config_entries.async_unload_platforms = async_return(True)
 
         result = await async_unload_entry(hass, config_entry)
 
@@ -683,31 +428,22 @@ class TestIntegrationInit:
         mock_card_registration_class.assert_called_once_with(hass)
         mock_card_reg_instance.async_unregister.assert_called_once()
 
-    @pytest.mark.asyncio
     async def test_async_unload_entry_platform_fails_does_not_unregister_card(
-        self, hass: HomeAssistant
+        self, hass: HomeAssistant, make_config_entry, mocker
     ) -> None:
         """Test that async_unload_entry does NOT call async_unregister when platform unload fails."""
-        config_entry = ConfigEntry(
-            version=1,
-            minor_version=1,
-            domain=DOMAIN,
-            title=TEST_POOL_TITLE,
-            data={"api_key": TEST_API_KEY, "pool_id": TEST_POOL_ID},
-            options={},
-            source="user",
-            unique_id=TEST_POOL_ID,
-            discovery_keys=frozenset(),
-            subentries_data={},
-        )
+        config_entry = make_config_entry()
 
         config_entry.runtime_data = MagicMock()
         config_entry.runtime_data.remove_time_listeners = []
 
-        hass.config_entries.async_unload_platforms = AsyncMock(return_value=False)
+        hass.config_entries.async_unload_platforms = async_return(False)
 
-        with patch("custom_components.iopool.IopoolCardRegistration") as mock_card_registration_class:
-            result = await async_unload_entry(hass, config_entry)
+        mock_card_registration_class = mocker.patch(
+            "custom_components.iopool.IopoolCardRegistration"
+        )
+
+        result = await async_unload_entry(hass, config_entry)
 
         assert result is False
         mock_card_registration_class.assert_not_called()
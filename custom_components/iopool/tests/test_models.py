@@ -4,6 +4,7 @@ from datetime import time, timedelta
 from unittest.mock import MagicMock
 
 from custom_components.iopool.models import (
+    _TIME_CACHE,
     IopoolConfigData,
     IopoolData,
     IopoolOptionsData,
@@ -11,149 +12,158 @@ from custom_components.iopool.models import (
     IopoolOptionsFiltrationSlot,
     IopoolOptionsSummerFiltration,
     IopoolOptionsWinterFiltration,
+    _parse_time,
 )
-
-
-class TestIopoolOptionsFiltrationSlot:
-    """Test class for IopoolOptionsFiltrationSlot."""
-
-    def test_init_default(self) -> None:
-        """Test default initialization."""
-        slot = IopoolOptionsFiltrationSlot()
-        assert slot.name is None
-        assert slot.start is None
-        assert slot.duration_percent == 50
-
-    def test_init_with_values(self) -> None:
-        """Test initialization with values."""
-        start_time = time(8, 0, 0)
-        slot = IopoolOptionsFiltrationSlot(
-            name="Morning", start=start_time, duration_percent=75
-        )
-        assert slot.name == "Morning"
-        assert slot.start == start_time
-        assert slot.duration_percent == 75
-
-
-class TestIopoolOptionsSummerFiltration:
-    """Test class for IopoolOptionsSummerFiltration."""
-
-    def test_init_default(self) -> None:
-        """Test default initialization."""
-        summer = IopoolOptionsSummerFiltration()
-        assert summer.status is False
-        assert summer.min_duration is None
-        assert summer.max_duration is None
-        assert isinstance(summer.slot1, IopoolOptionsFiltrationSlot)
-        assert isinstance(summer.slot2, IopoolOptionsFiltrationSlot)
-
-    def test_init_with_values(self) -> None:
-        """Test initialization with values."""
-        slot1 = IopoolOptionsFiltrationSlot(name="Morning")
-        slot2 = IopoolOptionsFiltrationSlot(name="Evening")
-        summer = IopoolOptionsSummerFiltration(
-            status=True, min_duration=60, max_duration=480, slot1=slot1, slot2=slot2
-        )
-        assert summer.status is True
-        assert summer.min_duration == 60
-        assert summer.max_duration == 480
-        assert summer.slot1.name == "Morning"
-        assert summer.slot2.name == "Evening"
-
-
-class TestIopoolOptionsWinterFiltration:
-    """Test class for IopoolOptionsWinterFiltration."""
-
-    def test_init_default(self) -> None:
-        """Test default initialization."""
-        winter = IopoolOptionsWinterFiltration()
-        assert winter.status is False
-        assert winter.start is None
-        assert winter.duration is None
-
-    def test_init_with_values(self) -> None:
-        """Test initialization with values."""
-        start_time = time(10, 0, 0)
-        duration = timedelta(minutes=120)
-        winter = IopoolOptionsWinterFiltration(
-            status=True, start=start_time, duration=duration
-        )
-        assert winter.status is True
-        assert winter.start == start_time
-        assert winter.duration == duration
-
-
-class TestIopoolOptionsFiltration:
-    """Test class for IopoolOptionsFiltration."""
-
-    def test_init_default(self) -> None:
+import pytest
+
+# Times and durations used across the cases below
+_MORNING = time(8, 0, 0)
+_EVENING = time(20, 0, 0)
+_WINTER_START = time(10, 0, 0)
+_WINTER_DURATION = timedelta(minutes=120)
+
+# (class, expected attributes) for default construction of each option class
+_DEFAULT_CASES = [
+    (
+        IopoolOptionsFiltrationSlot,
+        {"name": None, "start": None, "duration_percent": 50},
+    ),
+    (
+        IopoolOptionsSummerFiltration,
+        {
+            "status": False,
+            "min_duration": None,
+            "max_duration": None,
+            "slot1": IopoolOptionsFiltrationSlot(),
+            "slot2": IopoolOptionsFiltrationSlot(),
+        },
+    ),
+    (
+        IopoolOptionsWinterFiltration,
+        {"status": False, "start": None, "duration": None},
+    ),
+    (
+        IopoolOptionsFiltration,
+        {
+            "switch_entity": None,
+            "summer_filtration": IopoolOptionsSummerFiltration(),
+            "winter_filtration": IopoolOptionsWinterFiltration(),
+        },
+    ),
+    (IopoolOptionsData, {"filtration": IopoolOptionsFiltration()}),
+]
+
+# (class, constructor kwargs) for explicit construction of each option class
+_WITH_VALUES_CASES = [
+    (
+        IopoolOptionsFiltrationSlot,
+        {"name": "Morning", "start": _MORNING, "duration_percent": 75},
+    ),
+    (
+        IopoolOptionsSummerFiltration,
+        {
+            "status": True,
+            "min_duration": 60,
+            "max_duration": 480,
+            "slot1": IopoolOptionsFiltrationSlot(name="Morning"),
+            "slot2": IopoolOptionsFiltrationSlot(name="Evening"),
+        },
+    ),
+    (
+        IopoolOptionsWinterFiltration,
+        {"status": True, "start": _WINTER_START, "duration": _WINTER_DURATION},
+    ),
+    (
+        IopoolOptionsFiltration,
+        {
+            "switch_entity": "switch.pool_pump",
+            "summer_filtration": IopoolOptionsSummerFiltration(status=True),
+            "winter_filtration": IopoolOptionsWinterFiltration(status=True),
+        },
+    ),
+]
+
+# Serialized form of default IopoolOptionsData
+_EXPECTED_DEFAULT_TO_DICT = {
+    "filtration": {
+        "switch_entity": None,
+        "summer_filtration": {
+            "status": False,
+            "min_duration": None,
+            "max_duration": None,
+            "slot1": {"name": None, "start": None, "duration_percent": 50},
+            "slot2": {"name": None, "start": None, "duration_percent": 50},
+        },
+        "winter_filtration": {"status": False, "start": None, "duration": None},
+    }
+}
+
+# Fully populated options, shared by the from_dict and roundtrip tests
+_COMPLETE_OPTIONS_DICT = {
+    "filtration": {
+        "switch_entity": "switch.pool_pump",
+        "summer_filtration": {
+            "status": True,
+            "min_duration": 60,
+            "max_duration": 480,
+            "slot1": {
+                "name": "Morning",
+                "start": "08:00:00",
+                "duration_percent": 50,
+            },
+            "slot2": {
+                "name": "Evening",
+                "start": "20:00:00",
+                "duration_percent": 50,
+            },
+        },
+        "winter_filtration": {
+            "status": True,
+            "start": "10:00:00",
+            "duration": 120,
+        },
+    }
+}
+
+
+class TestIopoolOptionsInit:
+    """Test initialization of the option dataclasses."""
+
+    @pytest.mark.parametrize(
+        ("cls", "expected_attrs"),
+        _DEFAULT_CASES,
+        ids=[cls.__name__ for cls, _ in _DEFAULT_CASES],
+    )
+    def test_init_default(self, cls: type, expected_attrs: dict) -> None:
         """Test default initialization."""
-        filtration = IopoolOptionsFiltration()
-        assert filtration.switch_entity is None
-        assert isinstance(filtration.summer_filtration, IopoolOptionsSummerFiltration)
-        assert isinstance(filtration.winter_filtration, IopoolOptionsWinterFiltration)
-
-    def test_init_with_values(self) -> None:
+        instance = cls()
+        for name, value in expected_attrs.items():
+            assert getattr(instance, name) == value
+
+    @pytest.mark.parametrize(
+        ("cls", "kwargs"),
+        _WITH_VALUES_CASES,
+        ids=[cls.__name__ for cls, _ in _WITH_VALUES_CASES],
+    )
+    def test_init_with_values(self, cls: type, kwargs: dict) -> None:
         """Test initialization with values."""
-        summer = IopoolOptionsSummerFiltration(status=True)
-        winter = IopoolOptionsWinterFiltration(status=True)
-        filtration = IopoolOptionsFiltration(
-            switch_entity="switch.pool_pump",
-            summer_filtration=summer,
-            winter_filtration=winter,
-        )
-        assert filtration.switch_entity == "switch.pool_pump"
-        assert filtration.summer_filtration.status is True
-        assert filtration.winter_filtration.status is True
+        instance = cls(**kwargs)
+        for name, value in kwargs.items():
+            assert getattr(instance, name) == value
 
 
 class TestIopoolOptionsData:
     """Test class for IopoolOptionsData."""
 
-    def test_init_default(self) -> None:
-        """Test default initialization."""
-        options = IopoolOptionsData()
-        assert isinstance(options.filtration, IopoolOptionsFiltration)
-
-    def test_from_dict_empty(self) -> None:
-        """Test from_dict with empty data."""
-        options = IopoolOptionsData.from_dict({})
-        assert isinstance(options.filtration, IopoolOptionsFiltration)
-
-    def test_from_dict_none(self) -> None:
-        """Test from_dict with None data."""
-        options = IopoolOptionsData.from_dict(None)
+    @pytest.mark.parametrize("data", [{}, None], ids=["empty", "none"])
+    def test_from_dict_no_data(self, data: dict | None) -> None:
+        """Test from_dict with empty or missing data."""
+        options = IopoolOptionsData.from_dict(data)
         assert isinstance(options.filtration, IopoolOptionsFiltration)
 
     def test_from_dict_complete(self) -> None:
         """Test from_dict with complete data."""
-        data = {
-            "filtration": {
-                "switch_entity": "switch.pool_pump",
-                "summer_filtration": {
-                    "status": True,
-                    "min_duration": 60,
-                    "max_duration": 480,
-                    "slot1": {
-                        "name": "Morning",
-                        "start": "08:00:00",
-                        "duration_percent": 50,
-                    },
-                    "slot2": {
-                        "name": "Evening",
-                        "start": "20:00:00",
-                        "duration_percent": 50,
-                    },
-                },
-                "winter_filtration": {
-                    "status": True,
-                    "start": "10:00:00",
-                    "duration": 120,
-                },
-            }
-        }
-
-        options = IopoolOptionsData.from_dict(data)
+        options = IopoolOptionsData.from_dict(_COMPLETE_OPTIONS_DICT)
 
         # Check filtration options
         assert options.filtration.switch_entity == "switch.pool_pump"
@@ -166,18 +176,18 @@ class TestIopoolOptionsData:
 
         # Check summer slots
         assert summer.slot1.name == "Morning"
-        assert summer.slot1.start == time(8, 0, 0)
+        assert summer.slot1.start == _MORNING
         assert summer.slot1.duration_percent == 50
 
         assert summer.slot2.name == "Evening"
-        assert summer.slot2.start == time(20, 0, 0)
+        assert summer.slot2.start == _EVENING
         assert summer.slot2.duration_percent == 50
 
         # Check winter filtration
         winter = options.filtration.winter_filtration
         assert winter.status is True
-        assert winter.start == time(10, 0, 0)
-        assert winter.duration == timedelta(minutes=120)
+        assert winter.start == _WINTER_START
+        assert winter.duration == _WINTER_DURATION
 
     def test_from_dict_invalid_time(self) -> None:
         """Test from_dict with invalid time format."""
@@ -212,33 +222,16 @@ class TestIopoolOptionsData:
 
     def test_to_dict_default(self) -> None:
         """Test to_dict with default values."""
-        options = IopoolOptionsData()
-        result = options.to_dict()
-
-        expected = {
-            "filtration": {
-                "switch_entity": None,
-                "summer_filtration": {
-                    "status": False,
-                    "min_duration": None,
-                    "max_duration": None,
-                    "slot1": {"name": None, "start": None, "duration_percent": 50},
-                    "slot2": {"name": None, "start": None, "duration_percent": 50},
-                },
-                "winter_filtration": {"status": False, "start": None, "duration": None},
-            }
-        }
-
-        assert result == expected
+        assert IopoolOptionsData().to_dict() == _EXPECTED_DEFAULT_TO_DICT
 
     def test_to_dict_with_values(self) -> None:
         """Test to_dict with actual values."""
         # Create test data
         slot1 = IopoolOptionsFiltrationSlot(
-            name="Morning", start=time(8, 0, 0), duration_percent=60
+            name="Morning", start=_MORNING, duration_percent=60
         )
         slot2 = IopoolOptionsFiltrationSlot(
-            name="Evening", start=time(20, 0, 0), duration_percent=40
+            name="Evening", start=_EVENING, duration_percent=40
         )
         summer = IopoolOptionsSummerFiltration(
             status=True, min_duration=60, max_duration=480, slot1=slot1, slot2=slot2
@@ -278,38 +271,35 @@ class TestIopoolOptionsData:
 
     def test_roundtrip_conversion(self) -> None:
         """Test that from_dict and to_dict are inverse operations."""
-        original_data = {
-            "filtration": {
-                "switch_entity": "switch.pool_pump",
-                "summer_filtration": {
-                    "status": True,
-                    "min_duration": 60,
-                    "max_duration": 480,
-                    "slot1": {
-                        "name": "Morning",
-                        "start": "08:00:00",
-                        "duration_percent": 50,
-                    },
-                    "slot2": {
-                        "name": "Evening",
-                        "start": "20:00:00",
-                        "duration_percent": 50,
-                    },
-                },
-                "winter_filtration": {
-                    "status": True,
-                    "start": "10:00:00",
-                    "duration": 120,
-                },
-            }
-        }
-
         # Convert to object and back to dict
-        options = IopoolOptionsData.from_dict(original_data)
+        options = IopoolOptionsData.from_dict(_COMPLETE_OPTIONS_DICT)
         result_data = options.to_dict()
 
         # Should be the same
-        assert result_data == original_data
+        assert result_data == _COMPLETE_OPTIONS_DICT
+
+
+class TestParseTime:
+    """Test the memoized _parse_time helper."""
+
+    def test_second_call_returns_cached_object(self) -> None:
+        """Test that parsing the same string twice returns the cached time."""
+        first = _parse_time("07:15:00")
+
+        assert first == time(7, 15, 0)
+        assert _parse_time("07:15:00") is first
+        assert _TIME_CACHE["07:15:00"] is first
+
+    def test_invalid_time_cached_as_none(self) -> None:
+        """Test that an invalid string is cached as None."""
+        assert _parse_time("invalid_time") is None
+        assert "invalid_time" in _TIME_CACHE
+        assert _TIME_CACHE["invalid_time"] is None
+
+    @pytest.mark.parametrize("value", [["08:00:00"], {"start": "08:00:00"}, 800])
+    def test_non_string_returns_none(self, value: object) -> None:
+        """Test that non-string values return None instead of raising."""
+        assert _parse_time(value) is None
 
 
 class TestIopoolConfigData:
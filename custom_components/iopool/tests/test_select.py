@@ -1,80 +1,202 @@
 """Test the iopool select entities."""
 
+from __future__ import annotations
+
+from dataclasses import dataclass
 from datetime import datetime
-from unittest.mock import AsyncMock, MagicMock, patch
+from types import MappingProxyType, SimpleNamespace
+from typing import TYPE_CHECKING, Any
+from unittest.mock import (
+    AsyncMock,
+    MagicMock,
+    NonCallableMagicMock,
+    create_autospec,
+    patch,
+)
 
+from custom_components.iopool.api_models import IopoolAPIResponse
+from custom_components.iopool.const import CONF_POOL_ID
+from custom_components.iopool.coordinator import IopoolDataUpdateCoordinator
+from custom_components.iopool.filtration import Filtration
 from custom_components.iopool.select import (
     BOOST_OPTIONS,
     MODE_OPTIONS,
     POOL_SELECTS_CONDITIONAL_FILTRATION,
     IopoolSelect,
+    async_setup_entry,
 )
 import pytest
 
 from homeassistant.components.select import SelectEntityDescription
+from homeassistant.const import CONF_API_KEY
+
+from .conftest import TEST_API_KEY
+
+if TYPE_CHECKING:
+    from homeassistant.core import HomeAssistant
 
 TEST_POOL_ID = "pool_123"
 TEST_POOL_TITLE = "My Pool"
 
+# Read-only entry data shared by the platform setup tests
+_HASS_CONF_DATA = MappingProxyType({CONF_API_KEY: TEST_API_KEY, CONF_POOL_ID: TEST_POOL_ID})
+
+_BOOST_DESC = POOL_SELECTS_CONDITIONAL_FILTRATION[0]
+_MODE_DESC = POOL_SELECTS_CONDITIONAL_FILTRATION[1]
+
+
+async def _async_none(*_args: Any, **_kwargs: Any) -> None:
+    """Awaitable stub standing in for a restore lookup that finds nothing."""
+
+
+def _prepare_for_state_writes(entity: IopoolSelect, hass: HomeAssistant) -> None:
+    """Attach hass to an entity and discard its state writes."""
+    entity.hass = hass
+    entity.async_write_ha_state = lambda: None
+
+
+@dataclass
+class _StubConfig:
+    """Stand-in for IopoolConfigData exposing only what setup reads."""
+
+    options: Any
+
+
+@dataclass
+class _StubRuntime:
+    """Stand-in for IopoolData exposing only what setup reads."""
+
+    coordinator: Any
+    config: Any
+    filtration: Any
+
+
+def _build_runtime_data(
+    enabled: bool, filtration_dict: dict, coordinator: Any
+) -> _StubRuntime:
+    """Build the runtime data read by the select platform setup."""
+    filtration_mock = MagicMock()
+    filtration_mock.configuration_filtration_enabled = enabled
+    return _StubRuntime(
+        coordinator=coordinator,
+        config=_StubConfig(options=SimpleNamespace(filtration=filtration_dict)),
+        filtration=filtration_mock,
+    )
+
 
 @pytest.fixture
 def mock_iopool_coordinator():
     """Return a mocked iopool coordinator."""
-    coordinator = MagicMock()
+    coordinator = NonCallableMagicMock(spec=IopoolDataUpdateCoordinator)
     coordinator.get_pool_data.return_value = MagicMock()
+    coordinator.data = NonCallableMagicMock(spec=IopoolAPIResponse)
+    coordinator.data.pools = []
     return coordinator
 
 
-class TestIopoolSelect:
-    """Test the iopool select entity."""
+@pytest.fixture
+def patched_hass(hass):
+    """Return the hass mock with a stubbed config entry reload scheduler."""
+    hass.config_entries.async_schedule_reload = MagicMock()
+    return hass
 
-    @pytest.mark.parametrize(
-        ("select_index", "expected_key", "expected_options"),
-        [
-            (0, "boost_selector", BOOST_OPTIONS),
-            (1, "pool_mode", MODE_OPTIONS),
-        ],
-    )
-    def test_iopool_select_properties(
-        self,
-        mock_iopool_coordinator,
-        select_index,
-        expected_key,
-        expected_options,
-    ) -> None:
-        """Test iopool select entity properties."""
-        select_description = POOL_SELECTS_CONDITIONAL_FILTRATION[select_index]
-        filtration_mock = MagicMock()
+
+@pytest.fixture
+def make_select(mock_iopool_coordinator):
+    """Return a factory building an IopoolSelect and its filtration mock."""
+
+    def _make(
+        description: SelectEntityDescription = _BOOST_DESC,
+        *,
+        pool_title: str = TEST_POOL_TITLE,
+        filtration_attributes: dict | None = None,
+    ) -> tuple[IopoolSelect, Filtration]:
+        filtration_mock = create_autospec(Filtration, spec_set=True, instance=True)
+        filtration_mock.get_filtration_attributes.return_value = (
+            None,
+            None,
+            filtration_attributes or {},
+        )
 
         select_entity = IopoolSelect(
             mock_iopool_coordinator,
             filtration_mock,
-            select_description,
+            description,
             "test_entry_id",
             TEST_POOL_ID,
-            TEST_POOL_TITLE,
+            pool_title,
         )
+        return select_entity, filtration_mock
+
+    return _make
 
-        assert select_entity.unique_id == f"test_entry_id_{TEST_POOL_ID}_{expected_key}"
-        assert select_entity.options == expected_options
 
-    def test_iopool_select_icon(
+class TestIopoolSelectPlatform:
+    """Test class for iopool select platform."""
+
+    @pytest.fixture
+    def mock_select_class(self, mocker) -> MagicMock:
+        """Patch IopoolSelect for one test and return the class mock."""
+        return mocker.patch("custom_components.iopool.select.IopoolSelect")
+
+    @pytest.mark.parametrize(
+        ("enabled", "filtration_dict", "expected_len"),
+        [
+            (
+                True,
+                {"switch_entity": "switch.pool_pump"},
+                len(POOL_SELECTS_CONDITIONAL_FILTRATION),
+            ),
+            (False, {}, 0),
+        ],
+        ids=["with_filtration", "no_filtration"],
+    )
+    async def test_async_setup_entry(
         self,
+        hass: HomeAssistant,
+        mock_config_entry,
         mock_iopool_coordinator,
+        mock_select_class: MagicMock,
+        enabled: bool,
+        filtration_dict: dict,
+        expected_len: int,
     ) -> None:
-        """Test iopool select icon."""
-        select_description = POOL_SELECTS_CONDITIONAL_FILTRATION[0]
-        filtration_mock = MagicMock()
-
-        select_entity = IopoolSelect(
-            mock_iopool_coordinator,
-            filtration_mock,
-            select_description,
-            "test_entry_id",
-            TEST_POOL_ID,
-            TEST_POOL_TITLE,
+        """Test select platform setup with and without filtration configured."""
+        async_add_entities = MagicMock()
+        mock_config_entry.runtime_data = _build_runtime_data(
+            enabled, filtration_dict, mock_iopool_coordinator
         )
+        mock_config_entry.data = _HASS_CONF_DATA
+
+        await async_setup_entry(hass, mock_config_entry, async_add_entities)
+
+        assert async_add_entities.call_count == 1
+        assert len(async_add_entities.call_args.args[0]) == expected_len
+        assert mock_select_class.call_count == expected_len
+
+
+class TestIopoolSelect:
+    """Test the iopool select entity."""
+
+    @pytest.mark.parametrize(
+        ("select_description", "expected_key", "expected_options"),
+        [
+            (_BOOST_DESC, "boost_selector", BOOST_OPTIONS),
+            (_MODE_DESC, "pool_mode", MODE_OPTIONS),
+        ],
+    )
+    def test_iopool_select_properties(
+        self,
+        make_select,
+        select_description,
+        expected_key,
+        expected_options,
+    ) -> None:
+        """Test iopool select entity unique_id, options and icon."""
+        select_entity, _ = make_select(select_description)
 
+        assert select_entity.unique_id == f"test_entry_id_{TEST_POOL_ID}_{expected_key}"
+        assert select_entity.options == expected_options
         assert select_entity.icon == select_description.icon
 
     @pytest.mark.parametrize(
@@ -89,56 +211,28 @@ class TestIopoolSelect:
     )
     def test_select_entity_id_slugified(
         self,
-        mock_iopool_coordinator,
+        make_select,
         pool_name: str,
         expected_id_fragment: str,
     ) -> None:
         """Test that select entity_id is properly slugified from the pool name."""
-        select_description = POOL_SELECTS_CONDITIONAL_FILTRATION[0]  # boost_selector
-        filtration_mock = MagicMock()
-        select_entity = IopoolSelect(
-            mock_iopool_coordinator,
-            filtration_mock,
-            select_description,
-            "test_entry_id",
-            TEST_POOL_ID,
-            pool_name,
-        )
-        expected_entity_id = f"select.iopool_{expected_id_fragment}_{select_description.key}"
+        select_entity, _ = make_select(pool_title=pool_name)
+        expected_entity_id = f"select.iopool_{expected_id_fragment}_{_BOOST_DESC.key}"
         assert select_entity.entity_id == expected_entity_id
 
 
 class TestIopoolSelectAdvanced:
     """Test advanced functionality."""
 
-    @pytest.mark.asyncio
     async def test_boost_selector_basic_functionality(
         self,
-        mock_iopool_coordinator,
+        make_select,
         hass,
     ) -> None:
         """Test basic boost selector functionality."""
-        select_description = POOL_SELECTS_CONDITIONAL_FILTRATION[0]  # boost_selector
-        filtration_mock = MagicMock()
-        filtration_mock.async_start_filtration = AsyncMock()
-        filtration_mock.async_stop_filtration = AsyncMock()
-        filtration_mock.get_filtration_attributes = AsyncMock(
-            return_value=(None, None, {})
-        )
-        filtration_mock.update_filtration_attributes = AsyncMock()
-        filtration_mock.publish_event = AsyncMock()
-
-        select_entity = IopoolSelect(
-            mock_iopool_coordinator,
-            filtration_mock,
-            select_description,
-            "test_entry_id",
-            TEST_POOL_ID,
-            TEST_POOL_TITLE,
-        )
-        select_entity.hass = hass
-        select_entity.async_write_ha_state = MagicMock()
-        select_entity.async_get_last_state = AsyncMock(return_value=None)
+        select_entity, filtration_mock = make_select()
+        _prepare_for_state_writes(select_entity, hass)
+        select_entity.async_get_last_state = _async_none
 
         # Initialize state
         await select_entity.async_added_to_hass()
@@ -150,69 +244,39 @@ class TestIopoolSelectAdvanced:
         await select_entity.async_select_option("2H")
         assert select_entity.current_option == "2H"
 
-    @pytest.mark.asyncio
     async def test_pool_mode_basic_functionality(
         self,
         mock_iopool_coordinator,
+        make_select,
         hass,
     ) -> None:
         """Test basic pool mode functionality."""
-        select_description = POOL_SELECTS_CONDITIONAL_FILTRATION[1]  # pool_mode
-        filtration_mock = MagicMock()
-
         # Mock pool with STANDARD mode
         mock_pool = MagicMock()
         mock_pool.mode = "STANDARD"
         mock_pool.id = TEST_POOL_ID
 
         # Mock coordinator.data with pools list
-        mock_iopool_coordinator.data = MagicMock()
         mock_iopool_coordinator.data.pools = [mock_pool]
 
-        select_entity = IopoolSelect(
-            mock_iopool_coordinator,
-            filtration_mock,
-            select_description,
-            "test_entry_id",
-            TEST_POOL_ID,
-            TEST_POOL_TITLE,
-        )
+        select_entity, filtration_mock = make_select(_MODE_DESC)
         select_entity.hass = hass
-        select_entity.async_get_last_state = AsyncMock(return_value=None)
+        select_entity.async_get_last_state = _async_none
 
         await select_entity.async_added_to_hass()
 
         assert select_entity.current_option == "Standard"
 
-    @pytest.mark.asyncio
     async def test_boost_timer_functionality(
         self,
-        mock_iopool_coordinator,
+        make_select,
         hass,
     ) -> None:
         """Test boost timer advanced functionality."""
 
-        select_description = POOL_SELECTS_CONDITIONAL_FILTRATION[0]  # boost_selector
-        filtration_mock = MagicMock()
-        filtration_mock.async_start_filtration = AsyncMock()
-        filtration_mock.async_stop_filtration = AsyncMock()
-        filtration_mock.get_filtration_attributes = AsyncMock(
-            return_value=(None, None, {})
-        )
-        filtration_mock.update_filtration_attributes = AsyncMock()
-        filtration_mock.publish_event = AsyncMock()
-
-        select_entity = IopoolSelect(
-            mock_iopool_coordinator,
-            filtration_mock,
-            select_description,
-            "test_entry_id",
-            TEST_POOL_ID,
-            TEST_POOL_TITLE,
-        )
-        select_entity.hass = hass
-        select_entity.async_write_ha_state = MagicMock()
-        select_entity.async_get_last_state = AsyncMock(return_value=None)
+        select_entity, filtration_mock = make_select()
+        _prepare_for_state_writes(select_entity, hass)
+        select_entity.async_get_last_state = _async_none
 
         # Mock timer tracking
         with patch(
@@ -234,25 +298,14 @@ class TestIopoolSelectAdvanced:
             await select_entity.async_select_option("None")
             assert select_entity.current_option == "None"
 
-    @pytest.mark.asyncio
     async def test_boost_with_last_state_restoration(
         self,
-        mock_iopool_coordinator,
+        make_select,
         hass,
     ) -> None:
         """Test boost state restoration from last state."""
 
-        select_description = POOL_SELECTS_CONDITIONAL_FILTRATION[0]  # boost_selector
-        filtration_mock = MagicMock()
-
-        select_entity = IopoolSelect(
-            mock_iopool_coordinator,
-            filtration_mock,
-            select_description,
-            "test_entry_id",
-            TEST_POOL_ID,
-            TEST_POOL_TITLE,
-        )
+        select_entity, filtration_mock = make_select()
         select_entity.hass = hass
 
         # Mock last state with boost still active
@@ -287,30 +340,14 @@ class TestIopoolSelectAdvanced:
             # Timer should be set up
             mock_track.assert_called_once()
 
-    @pytest.mark.asyncio
     async def test_boost_expired_restoration(
         self,
-        mock_iopool_coordinator,
+        make_select,
         hass,
     ) -> None:
         """Test boost expired during restoration."""
 
-        select_description = POOL_SELECTS_CONDITIONAL_FILTRATION[0]  # boost_selector
-        filtration_mock = MagicMock()
-        filtration_mock.async_stop_filtration = AsyncMock()
-        filtration_mock.get_filtration_attributes = AsyncMock(
-            return_value=(None, None, {})
-        )
-        filtration_mock.update_filtration_attributes = AsyncMock()
-
-        select_entity = IopoolSelect(
-            mock_iopool_coordinator,
-            filtration_mock,
-            select_description,
-            "test_entry_id",
-            TEST_POOL_ID,
-            TEST_POOL_TITLE,
-        )
+        select_entity, filtration_mock = make_select()
         select_entity.hass = hass
 
         # Mock last state with expired boost
@@ -339,39 +376,27 @@ class TestIopoolSelectAdvanced:
             assert select_entity.current_option == "None"
             filtration_mock.async_stop_filtration.assert_called_once()
 
-    @pytest.mark.asyncio
     async def test_pool_mode_selection(
         self,
-        mock_iopool_coordinator,
-        hass,
+        make_select,
+        patched_hass,
     ) -> None:
         """Test pool mode selection functionality."""
-        select_description = POOL_SELECTS_CONDITIONAL_FILTRATION[1]  # pool_mode
-        filtration_mock = MagicMock()
-        filtration_mock.async_change_pool_mode = AsyncMock()
-
-        select_entity = IopoolSelect(
-            mock_iopool_coordinator,
-            filtration_mock,
-            select_description,
-            "test_entry_id",
-            TEST_POOL_ID,
-            TEST_POOL_TITLE,
-        )
-        select_entity.hass = hass
-        select_entity.async_write_ha_state = MagicMock()
+        select_entity, filtration_mock = make_select(_MODE_DESC)
+        _prepare_for_state_writes(select_entity, patched_hass)
 
         # Test mode selection - this should set the option
         await select_entity.async_select_option("Active-Winter")
         assert select_entity.current_option == "Active-Winter"
 
-        # For now, the pool mode change is done via integration reload
-        # not via async_change_pool_mode direct call
+        # The pool mode change is applied via an integration reload
+        patched_hass.config_entries.async_schedule_reload.assert_called_once_with(
+            "test_entry_id"
+        )
 
-    @pytest.mark.asyncio
     async def test_options_property_unknown_key(
         self,
-        mock_iopool_coordinator,
+        make_select,
     ) -> None:
         """Test options property with unknown key."""
         # Create description with unknown key
@@ -379,41 +404,19 @@ class TestIopoolSelectAdvanced:
             key="unknown_key",
             translation_key="unknown",
         )
-        filtration_mock = MagicMock()
-
-        select_entity = IopoolSelect(
-            mock_iopool_coordinator,
-            filtration_mock,
-            unknown_description,
-            "test_entry_id",
-            TEST_POOL_ID,
-            TEST_POOL_TITLE,
-        )
+        select_entity, _ = make_select(unknown_description)
 
         # Should return empty list for unknown key
         assert select_entity.options == []
 
-    @pytest.mark.asyncio
     async def test_invalid_boost_format(
         self,
-        mock_iopool_coordinator,
+        make_select,
         hass,
     ) -> None:
         """Test boost with invalid time format."""
-        select_description = POOL_SELECTS_CONDITIONAL_FILTRATION[0]  # boost_selector
-        filtration_mock = MagicMock()
-        filtration_mock.async_start_filtration = AsyncMock()
-
-        select_entity = IopoolSelect(
-            mock_iopool_coordinator,
-            filtration_mock,
-            select_description,
-            "test_entry_id",
-            TEST_POOL_ID,
-            TEST_POOL_TITLE,
-        )
-        select_entity.hass = hass
-        select_entity.async_write_ha_state = MagicMock()
+        select_entity, filtration_mock = make_select()
+        _prepare_for_state_writes(select_entity, hass)
 
         # Test invalid boost format
         await select_entity.async_select_option("InvalidTime")
@@ -422,31 +425,16 @@ class TestIopoolSelectAdvanced:
         # Should not start filtration with invalid format
         filtration_mock.async_start_filtration.assert_not_called()
 
-    @pytest.mark.asyncio
     async def test_boost_filtration_with_active_slot(
         self,
-        mock_iopool_coordinator,
+        make_select,
         hass,
     ) -> None:
         """Test boost when filtration already has active slot."""
-        select_description = POOL_SELECTS_CONDITIONAL_FILTRATION[0]  # boost_selector
-        filtration_mock = MagicMock()
-        filtration_mock.async_start_filtration = AsyncMock()
-        filtration_mock.publish_event = AsyncMock()
-        filtration_mock.get_filtration_attributes = AsyncMock(
-            return_value=(None, None, {"active_slot": "existing_slot"})
-        )
-
-        select_entity = IopoolSelect(
-            mock_iopool_coordinator,
-            filtration_mock,
-            select_description,
-            "test_entry_id",
-            TEST_POOL_ID,
-            TEST_POOL_TITLE,
+        select_entity, filtration_mock = make_select(
+            filtration_attributes={"active_slot": "existing_slot"}
         )
-        select_entity.hass = hass
-        select_entity.async_write_ha_state = MagicMock()
+        _prepare_for_state_writes(select_entity, hass)
 
         # Test boost with existing active slot
         await select_entity.async_select_option("2H")
@@ -459,33 +447,16 @@ class TestIopoolSelectAdvanced:
 class TestIopoolSelectEdgeCases:
     """Test edge cases for IopoolSelect."""
 
-    @pytest.mark.asyncio
     async def test_clean_filtration_attributes_via_boost_stop(
         self,
-        mock_iopool_coordinator,
+        make_select,
         hass,
     ) -> None:
         """Test cleaning filtration attributes when stopping boost."""
-        select_description = POOL_SELECTS_CONDITIONAL_FILTRATION[0]  # boost_selector
-        filtration_mock = MagicMock()
-        filtration_mock.async_start_filtration = AsyncMock()
-        filtration_mock.async_stop_filtration = AsyncMock()
-        filtration_mock.publish_event = AsyncMock()
-        filtration_mock.get_filtration_attributes = AsyncMock(
-            return_value=(None, None, {"active_slot": "boost"})
+        select_entity, filtration_mock = make_select(
+            filtration_attributes={"active_slot": "boost"}
         )
-        filtration_mock.update_filtration_attributes = AsyncMock()
-
-        select_entity = IopoolSelect(
-            mock_iopool_coordinator,
-            filtration_mock,
-            select_description,
-            "test_entry_id",
-            TEST_POOL_ID,
-            TEST_POOL_TITLE,
-        )
-        select_entity.hass = hass
-        select_entity.async_write_ha_state = MagicMock()
+        _prepare_for_state_writes(select_entity, hass)
 
         # Set a boost first, then cancel it to trigger cleanup
         await select_entity.async_select_option("2H")
@@ -495,3 +466,16 @@ class TestIopoolSelectEdgeCases:
         filtration_mock.update_filtration_attributes.assert_called_with(
             active_slot=None
         )
+
+    async def test_async_will_remove_from_hass(
+        self,
+        make_select,
+    ) -> None:
+        """Test removing the entity cancels a pending boost timer."""
+        select_entity, _ = make_select()
+        select_entity._boost_timer = mock_timer = MagicMock()
+
+        await select_entity.async_will_remove_from_hass()
+
+        mock_timer.assert_called_once_with()
+        assert select_entity._boost_timer is None
@@ -2,10 +2,12 @@
 
 from __future__ import annotations
 
-from datetime import datetime
-from unittest.mock import AsyncMock, MagicMock, patch
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock
 
-from custom_components.iopool.const import DOMAIN
+from custom_components.iopool.const import CONF_POOL_ID
 from custom_components.iopool.sensor import (
     POOL_SENSORS,
     IopoolSensor,
@@ -13,49 +15,91 @@ from custom_components.iopool.sensor import (
 )
 import pytest
 
-from homeassistant.components.sensor import SensorEntityDescription
+from homeassistant.components.sensor import SensorEntityDescription, SensorStateClass
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import UnitOfTemperature
+from homeassistant.const import CONF_API_KEY, UnitOfTemperature
 from homeassistant.core import HomeAssistant
 
-from .conftest import TEST_API_KEY, TEST_POOL_ID, TEST_POOL_TITLE
+from .conftest import (
+    CONFIG_ENTRY_KWARGS,
+    TEST_API_KEY,
+    TEST_POOL_ID,
+    TEST_POOL_TITLE,
+)
+
+_DESC_BY_KEY = {desc.key: desc for desc in POOL_SENSORS}
+
+
+@pytest.fixture(scope="module", autouse=True)
+def _patch_frame_report(module_mocker):
+    """Silence Home Assistant frame usage reports for the whole module."""
+    module_mocker.patch("homeassistant.helpers.frame.report_usage")
+
+
+@pytest.fixture(scope="module")
+def _module_add_entities():
+    """Return the async_add_entities mock shared by the module's tests."""
+    return MagicMock()
+
+
+@pytest.fixture
+def mock_add_entities(_module_add_entities):
+    """Yield the shared async_add_entities mock and clear its calls afterwards."""
+    yield _module_add_entities
+    _module_add_entities.reset_mock()
+
+
+@pytest.fixture
+def make_sensor():
+    """Return a factory building an IopoolSensor over its own stubbed coordinator."""
+
+    def _make(
+        description: str | SensorEntityDescription,
+        *,
+        pool_name: str = TEST_POOL_TITLE,
+        **pool_attrs: Any,
+    ) -> IopoolSensor:
+        if isinstance(description, str):
+            description = _DESC_BY_KEY[description]
+        coordinator = MagicMock()
+        coordinator.data = SimpleNamespace()
+        coordinator.get_pool_data.return_value = SimpleNamespace(
+            id=TEST_POOL_ID, **pool_attrs
+        )
+        return IopoolSensor(
+            coordinator, description, "test_entry_id", TEST_POOL_ID, pool_name
+        )
+
+    return _make
 
 
 class TestIopoolSensorPlatform:
     """Test iopool sensor platform."""
 
-    @pytest.mark.asyncio
-    @patch("homeassistant.helpers.frame.report_usage")
-    @patch("homeassistant.components.zeroconf.async_get_async_zeroconf")
-    @patch("custom_components.iopool.sensor.IopoolSensor")
+    @pytest.fixture(autouse=True)
+    def _platform_patch_zeroconf(self, mocker) -> None:
+        """Keep platform setup from reaching the real zeroconf instance."""
+        mocker.patch("homeassistant.components.zeroconf.async_get_async_zeroconf")
+
+    @pytest.fixture
+    def mock_sensor_class(self, mocker) -> MagicMock:
+        """Patch IopoolSensor for one test and return the class mock."""
+        return mocker.patch("custom_components.iopool.sensor.IopoolSensor")
+
     async def test_async_setup_entry(
         self,
-        mock_sensor_class,
-        mock_zeroconf,
-        mock_report: MagicMock,
         hass: HomeAssistant,
+        base_config_entry: ConfigEntry,
+        mock_add_entities: MagicMock,
+        mock_sensor_class: MagicMock,
     ) -> None:
         """Test sensor platform setup."""
         # Create mock config entry
-        config_entry = ConfigEntry(
-            version=1,
-            minor_version=1,
-            domain=DOMAIN,
-            title=TEST_POOL_TITLE,
-            data={
-                "api_key": TEST_API_KEY,
-                "pool_id": TEST_POOL_ID,
-            },
-            options={},
-            source="user",
-            unique_id=TEST_POOL_ID,
-            discovery_keys=frozenset(),
-            subentries_data={},
-        )
+        config_entry = base_config_entry
 
         # Mock runtime data
         mock_coordinator = MagicMock()
-        mock_coordinator.get_pool_data.return_value = MagicMock(
+        mock_coordinator.get_pool_data.return_value = SimpleNamespace(
             id=TEST_POOL_ID, title="Test Pool"
         )
 
@@ -68,84 +112,59 @@ class TestIopoolSensorPlatform:
         mock_runtime_data.config = mock_config
         config_entry.runtime_data = mock_runtime_data
 
-        # Mock async_add_entities
-        mock_async_add_entities = MagicMock()
-
-        # Mock sensor instances
-        mock_sensor_instances = [
-            MagicMock() for _ in range(6)
-        ]  # Based on POOL_SENSORS count
-        mock_sensor_class.side_effect = mock_sensor_instances
+        # Build one sensor mock per call, whatever the POOL_SENSORS count
+        mock_sensor_class.side_effect = lambda *_args, **_kwargs: MagicMock()
 
-        await async_setup_entry(hass, config_entry, mock_async_add_entities)
+        await async_setup_entry(hass, config_entry, mock_add_entities)
 
         # Verify sensors were created and added
         assert mock_sensor_class.call_count > 0
-        mock_async_add_entities.assert_called_once()
+        mock_add_entities.assert_called_once()
 
-    @pytest.mark.asyncio
-    @patch("homeassistant.helpers.frame.report_usage")
     async def test_async_setup_entry_no_runtime_data(
         self,
-        mock_report: MagicMock,
-        hass: HomeAssistant,
+        base_config_entry: ConfigEntry,
+        mock_add_entities: MagicMock,
     ) -> None:
         """Test sensor platform setup with no runtime data."""
         # Create mock config entry without runtime data
-        config_entry = ConfigEntry(
-            version=1,
-            minor_version=1,
-            domain=DOMAIN,
-            title=TEST_POOL_TITLE,
-            data={
-                "api_key": TEST_API_KEY,
-                "pool_id": TEST_POOL_ID,
-            },
-            options={},
-            source="user",
-            unique_id=TEST_POOL_ID,
-            discovery_keys=frozenset(),
-            subentries_data={},
-        )
+        config_entry = base_config_entry
 
         config_entry.runtime_data = None
 
-        # Mock async_add_entities
-        mock_async_add_entities = MagicMock()
-
         # This should raise an AttributeError due to accessing None.coordinator
         with pytest.raises(
             AttributeError, match="'NoneType' object has no attribute 'coordinator'"
         ):
-            await async_setup_entry(hass, config_entry, mock_async_add_entities)
+            # runtime_data is dereferenced before hass is used, so a bare mock is enough
+            await async_setup_entry(MagicMock(), config_entry, mock_add_entities)
 
         # Verify no entities were added
-        mock_async_add_entities.assert_not_called()
+        mock_add_entities.assert_not_called()
 
 
 class TestIopoolSensor:
     """Test individual iopool sensor."""
 
-    def test_sensor_initialization(self) -> None:
-        """Test sensor initialization."""
+    def test_sensor_initialization(self, sensor_desc: SensorEntityDescription) -> None:
+        """Test sensor initialization for every pool sensor description."""
         mock_coordinator = MagicMock()
         mock_coordinator.data = MagicMock()
         mock_coordinator.data.pools = [MagicMock()]
         mock_coordinator.data.pools[0].id = TEST_POOL_ID
 
-        sensor_description = POOL_SENSORS[0]  # Temperature sensor
         sensor = IopoolSensor(
             mock_coordinator,
-            sensor_description,
+            sensor_desc,
             "test_entry_id",
             TEST_POOL_ID,
             TEST_POOL_TITLE,
         )
 
         assert sensor.coordinator == mock_coordinator
-        assert sensor.entity_description == sensor_description
+        assert sensor.entity_description == sensor_desc
         # Test that sensor was created with correct parameters
-        assert sensor.unique_id is not None
+        assert sensor.unique_id == f"test_entry_id_{TEST_POOL_ID}_{sensor_desc.key}"
 
     @pytest.mark.parametrize(
         ("pool_name", "expected_id_fragment"),
@@ -157,87 +176,40 @@ class TestIopoolSensor:
             ("  Leading Spaces  ", "leading_spaces"),
         ],
     )
-    def test_sensor_entity_id_slugified(self, pool_name: str, expected_id_fragment: str) -> None:
+    def test_sensor_entity_id_slugified(
+        self, make_sensor, pool_name: str, expected_id_fragment: str
+    ) -> None:
         """Test that sensor entity_id is properly slugified from the pool name."""
-        mock_coordinator = MagicMock()
-        sensor_description = POOL_SENSORS[0]  # Temperature sensor
-        sensor = IopoolSensor(
-            mock_coordinator,
-            sensor_description,
-            "test_entry_id",
-            TEST_POOL_ID,
-            pool_name,
-        )
-        expected_entity_id = f"sensor.iopool_{expected_id_fragment}_{sensor_description.key}"
+        sensor = make_sensor("temperature", pool_name=pool_name)
+        expected_entity_id = f"sensor.iopool_{expected_id_fragment}_temperature"
         assert sensor.entity_id == expected_entity_id
 
-    def test_temperature_sensor_properties(self) -> None:
+    def test_temperature_sensor_properties(self, make_sensor) -> None:
         """Test temperature sensor specific properties."""
-        mock_coordinator = MagicMock()
-        mock_pool = MagicMock()
-        mock_pool.id = TEST_POOL_ID
-        mock_pool.latest_measure = MagicMock()
-        mock_pool.latest_measure.temperature = 24.5
-        mock_pool.latest_measure.is_valid = True
-        mock_coordinator.get_pool_data.return_value = mock_pool
-
-        # Get temperature sensor description
-        temp_sensor_desc = next(
-            desc for desc in POOL_SENSORS if desc.key == "temperature"
-        )
-
-        sensor = IopoolSensor(
-            mock_coordinator,
-            temp_sensor_desc,
-            "test_entry_id",
-            TEST_POOL_ID,
-            TEST_POOL_TITLE,
-        )
+        latest_measure = SimpleNamespace(temperature=24.5, is_valid=True)
+        sensor = make_sensor("temperature", latest_measure=latest_measure)
 
         assert sensor.native_value == 24.5
         assert sensor.native_unit_of_measurement == UnitOfTemperature.CELSIUS
         assert sensor.available is True
 
-    def test_sensor_unavailable_when_no_pool_data(self) -> None:
+    def test_sensor_unavailable_when_no_pool_data(self, make_sensor) -> None:
         """Test sensor is unavailable when no pool data."""
-        mock_coordinator = MagicMock()
-        mock_coordinator.get_pool_data.return_value = None
-
-        sensor_description = POOL_SENSORS[0]
-        sensor = IopoolSensor(
-            mock_coordinator,
-            sensor_description,
-            "test_entry_id",
-            TEST_POOL_ID,
-            TEST_POOL_TITLE,
-        )
+        sensor = make_sensor("temperature")
+        sensor.coordinator.get_pool_data.return_value = None
 
         assert sensor.available is False
         assert sensor.native_value is None
 
-    def test_sensor_unavailable_when_invalid_measure(self) -> None:
+    def test_sensor_unavailable_when_invalid_measure(self, make_sensor) -> None:
         """Test sensor attributes when measure is invalid."""
-        mock_coordinator = MagicMock()
-        mock_pool = MagicMock()
-        mock_pool.id = TEST_POOL_ID
-        mock_pool.latest_measure = MagicMock()
-        mock_pool.latest_measure.temperature = 0.0
-        mock_pool.latest_measure.is_valid = False
-        mock_pool.latest_measure.mode = "standard"
-        mock_pool.latest_measure.measured_at = None
-        mock_coordinator.get_pool_data.return_value = mock_pool
-
-        temp_sensor_desc = next(
-            desc for desc in POOL_SENSORS if desc.key == "temperature"
-        )
-
-        sensor = IopoolSensor(
-            mock_coordinator,
-            temp_sensor_desc,
-            "test_entry_id",
-            TEST_POOL_ID,
-            TEST_POOL_TITLE,
+        latest_measure = SimpleNamespace(
+            temperature=0.0,
+            is_valid=False,
+            mode="standard",
+            measured_at=None,
         )
+        sensor = make_sensor("temperature", latest_measure=latest_measure)
 
         # Sensor should be available even with invalid measure (as per current implementation)
         assert sensor.available is True
@@ -249,24 +221,17 @@ class TestIopoolSensor:
 class TestAsyncSetupEntryEdgeCases:
     """Test edge cases for async_setup_entry."""
 
-    @pytest.mark.asyncio
-    async def test_async_setup_entry_no_pool_found(self, hass: HomeAssistant) -> None:
+    async def test_async_setup_entry_no_pool_found(
+        self, hass: HomeAssistant, mock_add_entities: MagicMock
+    ) -> None:
         """Test setup when pool is not found."""
         # Create mock config entry
         config_entry = ConfigEntry(
-            version=1,
-            minor_version=1,
-            domain=DOMAIN,
-            title=TEST_POOL_TITLE,
-            data={
-                "api_key": TEST_API_KEY,
-                "pool_id": "nonexistent_pool",
-            },
-            options={},
-            source="user",
-            unique_id="nonexistent_pool",
-            discovery_keys=frozenset(),
-            subentries_data={},
+            **{
+                **CONFIG_ENTRY_KWARGS,
+                "data": {CONF_API_KEY: TEST_API_KEY, CONF_POOL_ID: "nonexistent_pool"},
+                "unique_id": "nonexistent_pool",
+            }
         )
 
         # Mock runtime data
@@ -281,145 +246,67 @@ class TestAsyncSetupEntryEdgeCases:
         mock_runtime_data.config = mock_config
         config_entry.runtime_data = mock_runtime_data
 
-        # Mock async_add_entities
-        mock_async_add_entities = MagicMock()
-
         # Should return early when no pool found
-        await async_setup_entry(hass, config_entry, mock_async_add_entities)
+        await async_setup_entry(hass, config_entry, mock_add_entities)
 
         # Verify no entities were added (since pool was not found)
-        mock_async_add_entities.assert_not_called()
+        mock_add_entities.assert_not_called()
 
-    @pytest.mark.asyncio
-    @patch("homeassistant.helpers.template.Template")
-    @patch("homeassistant.components.history_stats.sensor.HistoryStatsSensor")
-    @patch(
-        "homeassistant.components.history_stats.coordinator.HistoryStatsUpdateCoordinator"
+    @pytest.mark.parametrize(
+        ("language", "pool_title", "switch_entity", "expected_friendly_name"),
+        [
+            (
+                "en",
+                "Test Pool",
+                "switch.pool_pump",
+                "Test Pool Elapsed Filtration Duration Today",
+            ),
+            (
+                "fr",
+                "Piscine Test",
+                "switch.pompe_piscine",
+                "Piscine Test Durée de filtration écoulée aujourd'hui",
+            ),
+        ],
+        ids=["en", "fr"],
     )
-    @patch("homeassistant.components.history_stats.data.HistoryStats")
     async def test_async_setup_entry_with_switch_entity(
         self,
-        mock_history_stats,
-        mock_coordinator_class,
-        mock_sensor_class,
-        mock_template,
+        mocker,
         hass: HomeAssistant,
+        base_config_entry: ConfigEntry,
+        mock_add_entities: MagicMock,
+        language: str,
+        pool_title: str,
+        switch_entity: str,
+        expected_friendly_name: str,
     ) -> None:
         """Test setup with switch entity configured for history stats."""
-        # Setup mocks
-        hass.config.language = "en"
-
-        config_entry = ConfigEntry(
-            version=1,
-            minor_version=1,
-            domain=DOMAIN,
-            title=TEST_POOL_TITLE,
-            data={
-                "api_key": TEST_API_KEY,
-                "pool_id": TEST_POOL_ID,
-            },
-            options={},
-            source="user",
-            unique_id=TEST_POOL_ID,
-            discovery_keys=frozenset(),
-            subentries_data={},
+        mock_template = mocker.patch("homeassistant.helpers.template.Template")
+        mock_sensor_class = mocker.patch(
+            "homeassistant.components.history_stats.sensor.HistoryStatsSensor"
         )
-
-        # Mock pool data
-        mock_pool = MagicMock()
-        mock_pool.id = TEST_POOL_ID
-        mock_pool.title = "Test Pool"
-
-        mock_coordinator = MagicMock()
-        mock_coordinator.get_pool_data.return_value = mock_pool
-
-        # Mock config with switch entity
-        mock_config = MagicMock()
-        mock_config.options.filtration.get.return_value = "switch.pool_pump"
-
-        mock_runtime_data = MagicMock()
-        mock_runtime_data.coordinator = mock_coordinator
-        mock_runtime_data.config = mock_config
-        config_entry.runtime_data = mock_runtime_data
-
-        # Mock history stats components
-        mock_template.return_value = MagicMock()
-        mock_history_stats.return_value = MagicMock()
-
-        mock_history_coordinator = MagicMock()
-        mock_history_coordinator.async_config_entry_first_refresh = AsyncMock(
-            return_value=None
+        mock_coordinator_class = mocker.patch(
+            "homeassistant.components.history_stats.coordinator.HistoryStatsUpdateCoordinator"
+        )
+        mock_history_stats = mocker.patch(
+            "homeassistant.components.history_stats.data.HistoryStats"
         )
-        mock_coordinator_class.return_value = mock_history_coordinator
-
-        mock_history_sensor = MagicMock()
-        mock_sensor_class.return_value = mock_history_sensor
-
-        mock_async_add_entities = MagicMock()
-
-        await async_setup_entry(hass, config_entry, mock_async_add_entities)
-
-        # Verify history stats components were created
-        mock_template.assert_called()
-        mock_history_stats.assert_called_once()
-        mock_coordinator_class.assert_called_once()
-        # Verify HistoryStatsSensor was called with state_class=MEASUREMENT (required since HA 2026.3)
-        mock_sensor_class.assert_called_once()
-        call_kwargs = mock_sensor_class.call_args[1]
-        from homeassistant.components.sensor import SensorStateClass
-        assert call_kwargs.get("state_class") == SensorStateClass.MEASUREMENT
-        # Verify HistoryStats was called with min_state_duration=timedelta(0) (required since HA 2026.4)
-        from datetime import timedelta
-        hs_call_kwargs = mock_history_stats.call_args[1]
-        assert hs_call_kwargs.get("min_state_duration") == timedelta(0)
-        assert mock_async_add_entities.call_count >= 1
 
-    @pytest.mark.asyncio
-    @patch("homeassistant.helpers.template.Template")
-    @patch("homeassistant.components.history_stats.sensor.HistoryStatsSensor")
-    @patch(
-        "homeassistant.components.history_stats.coordinator.HistoryStatsUpdateCoordinator"
-    )
-    @patch("homeassistant.components.history_stats.data.HistoryStats")
-    async def test_async_setup_entry_with_switch_entity_french(
-        self,
-        mock_history_stats,
-        mock_coordinator_class,
-        mock_sensor_class,
-        mock_template,
-        hass: HomeAssistant,
-    ) -> None:
-        """Test setup with switch entity and French language."""
         # Setup mocks
-        hass.config.language = "fr"
+        hass.config.language = language
 
-        config_entry = ConfigEntry(
-            version=1,
-            minor_version=1,
-            domain=DOMAIN,
-            title=TEST_POOL_TITLE,
-            data={
-                "api_key": TEST_API_KEY,
-                "pool_id": TEST_POOL_ID,
-            },
-            options={},
-            source="user",
-            unique_id=TEST_POOL_ID,
-            discovery_keys=frozenset(),
-            subentries_data={},
-        )
+        config_entry = base_config_entry
 
         # Mock pool data
-        mock_pool = MagicMock()
-        mock_pool.id = TEST_POOL_ID
-        mock_pool.title = "Piscine Test"
+        mock_pool = SimpleNamespace(id=TEST_POOL_ID, title=pool_title)
 
         mock_coordinator = MagicMock()
         mock_coordinator.get_pool_data.return_value = mock_pool
 
         # Mock config with switch entity
         mock_config = MagicMock()
-        mock_config.options.filtration.get.return_value = "switch.pompe_piscine"
+        mock_config.options.filtration.get.return_value = switch_entity
 
         mock_runtime_data = MagicMock()
         mock_runtime_data.coordinator = mock_coordinator
@@ -439,63 +326,48 @@ class TestAsyncSetupEntryEdgeCases:
         mock_history_sensor = MagicMock()
         mock_sensor_class.return_value = mock_history_sensor
 
-        mock_async_add_entities = MagicMock()
-
-        await async_setup_entry(hass, config_entry, mock_async_add_entities)
+        await async_setup_entry(hass, config_entry, mock_add_entities)
 
-        # Verify French language template was used
+        # Verify history stats components were created
+        mock_template.assert_called()
+        mock_history_stats.assert_called_once()
+        # Verify the friendly name follows the Home Assistant language
         mock_coordinator_class.assert_called_once()
         call_args = mock_coordinator_class.call_args[0]
         friendly_name = call_args[3]  # 4th argument is friendly_name
-        assert friendly_name == "Piscine Test Durée de filtration écoulée aujourd'hui"
+        assert friendly_name == expected_friendly_name
         # Verify HistoryStatsSensor was called with state_class=MEASUREMENT (required since HA 2026.3)
         mock_sensor_class.assert_called_once()
         call_kwargs = mock_sensor_class.call_args[1]
-        from homeassistant.components.sensor import SensorStateClass
         assert call_kwargs.get("state_class") == SensorStateClass.MEASUREMENT
         # Verify HistoryStats was called with min_state_duration=timedelta(0) (required since HA 2026.4)
-        from datetime import timedelta
         hs_call_kwargs = mock_history_stats.call_args[1]
         assert hs_call_kwargs.get("min_state_duration") == timedelta(0)
-        assert mock_async_add_entities.call_count >= 1
+        assert mock_add_entities.call_count >= 1
 
-    @pytest.mark.asyncio
-    @patch("homeassistant.helpers.template.Template")
-    @patch(
-        "homeassistant.components.history_stats.coordinator.HistoryStatsUpdateCoordinator"
-    )
-    @patch("homeassistant.components.history_stats.data.HistoryStats")
     async def test_async_setup_entry_history_stats_error(
         self,
-        mock_history_stats,
-        mock_coordinator_class,
-        mock_template,
+        mocker,
         hass: HomeAssistant,
+        base_config_entry: ConfigEntry,
+        mock_add_entities: MagicMock,
     ) -> None:
         """Test setup when history stats initialization fails."""
+        mock_template = mocker.patch("homeassistant.helpers.template.Template")
+        mock_coordinator_class = mocker.patch(
+            "homeassistant.components.history_stats.coordinator.HistoryStatsUpdateCoordinator"
+        )
+        mock_history_stats = mocker.patch(
+            "homeassistant.components.history_stats.data.HistoryStats"
+        )
+
         # Setup mocks
         hass.config.language = "en"
 
-        config_entry = ConfigEntry(
-            version=1,
-            minor_version=1,
-            domain=DOMAIN,
-            title=TEST_POOL_TITLE,
-            data={
-                "api_key": TEST_API_KEY,
-                "pool_id": TEST_POOL_ID,
-            },
-            options={},
-            source="user",
-            unique_id=TEST_POOL_ID,
-            discovery_keys=frozenset(),
-            subentries_data={},
-        )
+        config_entry = base_config_entry
 
         # Mock pool data
-        mock_pool = MagicMock()
-        mock_pool.id = TEST_POOL_ID
-        mock_pool.title = "Test Pool"
+        mock_pool = SimpleNamespace(id=TEST_POOL_ID, title="Test Pool")
 
         mock_coordinator = MagicMock()
         mock_coordinator.get_pool_data.return_value = mock_pool
@@ -520,226 +392,96 @@ class TestAsyncSetupEntryEdgeCases:
         )
         mock_coordinator_class.return_value = mock_history_coordinator
 
-        mock_async_add_entities = MagicMock()
-
         # Should not raise error, but log it
-        await async_setup_entry(hass, config_entry, mock_async_add_entities)
+        await async_setup_entry(hass, config_entry, mock_add_entities)
 
         # Verify basic entities were still added despite history stats error
-        assert mock_async_add_entities.call_count == 1  # Only basic sensors
+        assert mock_add_entities.call_count == 1  # Only basic sensors
 
 
 class TestIopoolSensorProperties:
     """Test IopoolSensor properties and methods."""
 
-    def test_ph_sensor_native_value(self) -> None:
-        """Test pH sensor native value."""
-        mock_coordinator = MagicMock()
-        mock_pool = MagicMock()
-        mock_pool.latest_measure = MagicMock()
-        mock_pool.latest_measure.ph = 7.2
-        mock_coordinator.get_pool_data.return_value = mock_pool
-
-        ph_sensor_desc = next(desc for desc in POOL_SENSORS if desc.key == "ph")
-        sensor = IopoolSensor(
-            mock_coordinator,
-            ph_sensor_desc,
-            "test_entry_id",
-            TEST_POOL_ID,
-            TEST_POOL_TITLE,
-        )
-
-        assert sensor.native_value == 7.2
-
-    def test_orp_sensor_native_value(self) -> None:
-        """Test ORP sensor native value."""
-        mock_coordinator = MagicMock()
-        mock_pool = MagicMock()
-        mock_pool.latest_measure = MagicMock()
-        mock_pool.latest_measure.orp = 650
-        mock_coordinator.get_pool_data.return_value = mock_pool
-
-        orp_sensor_desc = next(desc for desc in POOL_SENSORS if desc.key == "orp")
-        sensor = IopoolSensor(
-            mock_coordinator,
-            orp_sensor_desc,
-            "test_entry_id",
-            TEST_POOL_ID,
-            TEST_POOL_TITLE,
-        )
-
-        assert sensor.native_value == 650
-
-    def test_filtration_recommendation_sensor_native_value(self) -> None:
-        """Test filtration recommendation sensor native value."""
-        mock_coordinator = MagicMock()
-        mock_pool = MagicMock()
-        mock_pool.advice = MagicMock()
-        mock_pool.advice.filtration_duration = 4.5  # 4.5 hours
-        mock_coordinator.get_pool_data.return_value = mock_pool
-
-        filtration_sensor_desc = next(
-            desc for desc in POOL_SENSORS if desc.key == "filtration_recommendation"
-        )
-        sensor = IopoolSensor(
-            mock_coordinator,
-            filtration_sensor_desc,
-            "test_entry_id",
-            TEST_POOL_ID,
-            TEST_POOL_TITLE,
-        )
-
-        assert sensor.native_value == 270  # 4.5 * 60 = 270 minutes
-
-    def test_iopool_mode_sensor_native_value(self) -> None:
-        """Test iopool mode sensor native value."""
-        mock_coordinator = MagicMock()
-        mock_pool = MagicMock()
-        mock_pool.mode = "Standard"
-        mock_coordinator.get_pool_data.return_value = mock_pool
-
-        mode_sensor_desc = next(
-            desc for desc in POOL_SENSORS if desc.key == "iopool_mode"
-        )
-        sensor = IopoolSensor(
-            mock_coordinator,
-            mode_sensor_desc,
-            "test_entry_id",
-            TEST_POOL_ID,
-            TEST_POOL_TITLE,
-        )
+    @pytest.mark.parametrize(
+        ("key", "pool_kwargs", "expected"),
+        [
+            ("ph", {"latest_measure": SimpleNamespace(ph=7.2)}, 7.2),
+            ("orp", {"latest_measure": SimpleNamespace(orp=650)}, 650),
+            # 4.5 hours of recommended filtration is reported as 270 minutes
+            (
+                "filtration_recommendation",
+                {"advice": SimpleNamespace(filtration_duration=4.5)},
+                270,
+            ),
+            ("iopool_mode", {"mode": "Standard"}, "Standard"),
+        ],
+    )
+    def test_sensor_native_value(
+        self, make_sensor, key: str, pool_kwargs: dict[str, Any], expected: Any
+    ) -> None:
+        """Test sensor native value for each pool data source."""
+        sensor = make_sensor(key, **pool_kwargs)
 
-        assert sensor.native_value == "Standard"
+        assert sensor.native_value == expected
 
-    def test_sensor_with_no_latest_measure(self) -> None:
+    def test_sensor_with_no_latest_measure(self, make_sensor) -> None:
         """Test sensor when pool has no latest measure."""
-        mock_coordinator = MagicMock()
-        mock_pool = MagicMock()
-        mock_pool.latest_measure = None
-        mock_coordinator.get_pool_data.return_value = mock_pool
-
-        temp_sensor_desc = next(
-            desc for desc in POOL_SENSORS if desc.key == "temperature"
-        )
-        sensor = IopoolSensor(
-            mock_coordinator,
-            temp_sensor_desc,
-            "test_entry_id",
-            TEST_POOL_ID,
-            TEST_POOL_TITLE,
-        )
+        sensor = make_sensor("temperature", latest_measure=None)
 
         assert sensor.native_value is None
         assert (
             sensor.available is False
         )  # Should be unavailable for measure-based sensors
 
-    def test_sensor_with_no_advice(self) -> None:
+    def test_sensor_with_no_advice(self, make_sensor) -> None:
         """Test filtration recommendation sensor when pool has no advice."""
-        mock_coordinator = MagicMock()
-        mock_pool = MagicMock()
-        mock_pool.advice = None
-        mock_coordinator.get_pool_data.return_value = mock_pool
-
-        filtration_sensor_desc = next(
-            desc for desc in POOL_SENSORS if desc.key == "filtration_recommendation"
-        )
-        sensor = IopoolSensor(
-            mock_coordinator,
-            filtration_sensor_desc,
-            "test_entry_id",
-            TEST_POOL_ID,
-            TEST_POOL_TITLE,
-        )
+        sensor = make_sensor("filtration_recommendation", advice=None)
 
         assert sensor.native_value is None
         assert (
             sensor.available is True
         )  # Should still be available for non-measure sensors
 
-    def test_sensor_icon_property(self) -> None:
+    def test_sensor_icon_property(self, make_sensor) -> None:
         """Test sensor icon property."""
-        mock_coordinator = MagicMock()
-
-        temp_sensor_desc = next(
-            desc for desc in POOL_SENSORS if desc.key == "temperature"
-        )
-        sensor = IopoolSensor(
-            mock_coordinator,
-            temp_sensor_desc,
-            "test_entry_id",
-            TEST_POOL_ID,
-            TEST_POOL_TITLE,
-        )
+        sensor = make_sensor("temperature")
 
         assert sensor.icon == "mdi:thermometer"
 
-    def test_sensor_no_coordinator_data(self) -> None:
+    def test_sensor_no_coordinator_data(self, make_sensor) -> None:
         """Test sensor when coordinator has no data."""
-        mock_coordinator = MagicMock()
-        mock_coordinator.data = None
-
-        temp_sensor_desc = next(
-            desc for desc in POOL_SENSORS if desc.key == "temperature"
-        )
-        sensor = IopoolSensor(
-            mock_coordinator,
-            temp_sensor_desc,
-            "test_entry_id",
-            TEST_POOL_ID,
-            TEST_POOL_TITLE,
-        )
+        sensor = make_sensor("temperature")
+        sensor.coordinator.data = None
 
         assert sensor.available is False
 
-    def test_unknown_sensor_key(self) -> None:
+    def test_unknown_sensor_key(self, make_sensor) -> None:
         """Test sensor with unknown key."""
-        mock_coordinator = MagicMock()
-        mock_pool = MagicMock()
-        mock_coordinator.get_pool_data.return_value = mock_pool
-
         # Create a custom sensor description with unknown key
         unknown_sensor_desc = SensorEntityDescription(
             key="unknown_sensor",
             translation_key="unknown_sensor",
         )
-
-        sensor = IopoolSensor(
-            mock_coordinator,
-            unknown_sensor_desc,
-            "test_entry_id",
-            TEST_POOL_ID,
-            TEST_POOL_TITLE,
-        )
+        sensor = make_sensor(unknown_sensor_desc)
 
         assert sensor.native_value is None
 
-    @patch("homeassistant.util.dt.as_local")
-    def test_extra_state_attributes_with_measured_at(self, mock_as_local) -> None:
+    def test_extra_state_attributes_with_measured_at(
+        self, mocker, make_sensor
+    ) -> None:
         """Test extra state attributes when measured_at is available."""
-        mock_coordinator = MagicMock()
-        mock_pool = MagicMock()
-        mock_measure = MagicMock()
-        mock_measure.is_valid = True
-        mock_measure.mode = "standard"
-        mock_measure.measured_at = datetime(2023, 1, 1, 12, 0, 0)
-        mock_pool.latest_measure = mock_measure
-        mock_coordinator.get_pool_data.return_value = mock_pool
+        mock_as_local = mocker.patch("homeassistant.util.dt.as_local")
+        mock_measure = SimpleNamespace(
+            is_valid=True,
+            mode="standard",
+            measured_at=datetime(2023, 1, 1, 12, 0, 0),
+        )
 
         # Mock as_local to return a local datetime
         local_datetime = datetime(2023, 1, 1, 13, 0, 0)  # 1 hour ahead
         mock_as_local.return_value = local_datetime
 
-        temp_sensor_desc = next(
-            desc for desc in POOL_SENSORS if desc.key == "temperature"
-        )
-        sensor = IopoolSensor(
-            mock_coordinator,
-            temp_sensor_desc,
-            "test_entry_id",
-            TEST_POOL_ID,
-            TEST_POOL_TITLE,
-        )
+        sensor = make_sensor("temperature", latest_measure=mock_measure)
 
         attributes = sensor.extra_state_attributes
 
@@ -751,74 +493,32 @@ class TestIopoolSensorProperties:
         )  # Temperature sensor has suggested_display_precision=2
         mock_as_local.assert_called_once()
 
-    def test_extra_state_attributes_no_measure(self) -> None:
+    def test_extra_state_attributes_no_measure(self, make_sensor) -> None:
         """Test extra state attributes when no measure is available."""
-        mock_coordinator = MagicMock()
-        mock_pool = MagicMock()
-        mock_pool.latest_measure = None
-        mock_coordinator.get_pool_data.return_value = mock_pool
-
-        temp_sensor_desc = next(
-            desc for desc in POOL_SENSORS if desc.key == "temperature"
-        )
-        sensor = IopoolSensor(
-            mock_coordinator,
-            temp_sensor_desc,
-            "test_entry_id",
-            TEST_POOL_ID,
-            TEST_POOL_TITLE,
-        )
+        sensor = make_sensor("temperature", latest_measure=None)
 
         attributes = sensor.extra_state_attributes
         # Should still include display_precision even without measure data
         assert attributes == {"display_precision": 2}
 
-    def test_extra_state_attributes_display_precision(self) -> None:
+    def test_extra_state_attributes_display_precision(self, make_sensor) -> None:
         """Test that display_precision is included when suggested_display_precision is set."""
-        mock_coordinator = MagicMock()
-        mock_pool = MagicMock()
-        mock_pool.latest_measure = None
-        mock_coordinator.get_pool_data.return_value = mock_pool
-
         # Test with temperature sensor (has suggested_display_precision=2)
-        temp_sensor_desc = next(
-            desc for desc in POOL_SENSORS if desc.key == "temperature"
-        )
-        sensor = IopoolSensor(
-            mock_coordinator,
-            temp_sensor_desc,
-            "test_entry_id",
-            TEST_POOL_ID,
-            TEST_POOL_TITLE,
-        )
+        sensor = make_sensor("temperature", latest_measure=None)
 
         attributes = sensor.extra_state_attributes
         assert "display_precision" in attributes
         assert attributes["display_precision"] == 2
 
         # Test with pH sensor (also has suggested_display_precision=2)
-        ph_sensor_desc = next(desc for desc in POOL_SENSORS if desc.key == "ph")
-        ph_sensor = IopoolSensor(
-            mock_coordinator,
-            ph_sensor_desc,
-            "test_entry_id",
-            TEST_POOL_ID,
-            TEST_POOL_TITLE,
-        )
+        ph_sensor = make_sensor("ph", latest_measure=None)
 
         ph_attributes = ph_sensor.extra_state_attributes
         assert "display_precision" in ph_attributes
         assert ph_attributes["display_precision"] == 2
 
         # Test with ORP sensor (no suggested_display_precision)
-        orp_sensor_desc = next(desc for desc in POOL_SENSORS if desc.key == "orp")
-        orp_sensor = IopoolSensor(
-            mock_coordinator,
-            orp_sensor_desc,
-            "test_entry_id",
-            TEST_POOL_ID,
-            TEST_POOL_TITLE,
-        )
+        orp_sensor = make_sensor("orp", latest_measure=None)
 
         orp_attributes = orp_sensor.extra_state_attributes
         assert "display_precision" not in orp_attributes